@@ -0,0 +1,111 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 23:24:36
+ # @ Description:
+    Collision benchmark. A frame of tile collisions for many entities is timed with the scan
+    of every tile the game used to do, and with the tile grid lookup. Both must give the same
+    positions and velocities.
+    Usage: python -m benchmarks.collisions --enemies 10,100,1000 --size 100
+ '''
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from typing import Any, Callable
+
+import pygame as pg
+
+from src.config import SCALING_FACTOR, TILE_SIZE
+from src.entities.collisions import ObjectCollision, handle_collision, snap_position
+from src.world.generator import generate_level
+from src.world.level import LevelStore
+
+Body = tuple[pg.Vector2, pg.Vector2]
+
+
+def legacy_collision(level: Any, position: pg.Vector2, image: pg.Surface, velocity: pg.Vector2) -> bool:
+    """
+    Tile collision like it used to be done, four corner vectors tested against every tile of the level
+    """
+    player = ObjectCollision(position.x, position.y,
+                             int(image.get_width() * SCALING_FACTOR), int(image.get_height() * SCALING_FACTOR))
+    exit_tile = ObjectCollision(level.exit_position[0] * TILE_SIZE, level.exit_position[1] * TILE_SIZE,
+                                TILE_SIZE, TILE_SIZE)
+    reached_exit = player.is_colliding(exit_tile) != set()
+    sides_colliding = set()
+    objects_colliding = []
+    for tile in level.tiles:
+        object_to_collide = ObjectCollision(tile.rect.x, tile.rect.y, TILE_SIZE, TILE_SIZE)
+        local_colliding = player.is_colliding(object_to_collide)
+        if local_colliding != set():
+            sides_colliding.update(local_colliding)
+            objects_colliding.append(object_to_collide)
+    if sides_colliding != set():
+        snap_position(sides_colliding, objects_colliding, position, image, velocity)
+    return reached_exit
+
+
+def bodies(level: Any, count: int, seed: int) -> list[Body]:
+    """
+    Entities spread at random over the level, with their velocity
+    """
+    rng = random.Random(seed)
+    width, height = level.size
+    return [(pg.Vector2(rng.uniform(0, width), rng.uniform(0, height)), pg.Vector2(rng.uniform(-2, 2), 1))
+            for _ in range(count)]
+
+
+def frame(collide: Callable[..., bool], level: Any, image: pg.Surface, start: list[Body]) -> tuple[float, list]:
+    """
+    Time one frame of collisions, return the time and the resolved bodies
+    """
+    moved = [(pg.Vector2(position), pg.Vector2(velocity)) for position, velocity in start]
+    begin = time.perf_counter()
+    for position, velocity in moved:
+        collide(level, position, image, velocity)
+    return time.perf_counter() - begin, [(tuple(position), tuple(velocity)) for position, velocity in moved]
+
+
+def run_case(name: str, level: Any, count: int, seed: int, repeat: int) -> dict[str, Any]:
+    """
+    Time both collision queries on the same bodies, and compare their results
+    """
+    image = pg.Surface((21, 21))
+    start = bodies(level, count, seed)
+    legacy, legacy_result = min(frame(legacy_collision, level, image, start) for _ in range(repeat))
+    grid, grid_result = min(frame(handle_collision, level, image, start) for _ in range(repeat))
+    result = {'level': name, 'tiles': len(level.tiles), 'enemies': count, 'legacy_seconds': legacy,
+              'grid_seconds': grid, 'speedup': legacy / grid, 'ok': legacy_result == grid_result}
+    print(f"{name:>12} {result['tiles']:>6} tiles {count:>6} enemies {legacy * 1000:10.2f} ms -> "
+          f"{grid * 1000:8.3f} ms x{result['speedup']:7.1f} {'ok' if result['ok'] else 'MISMATCH'}")
+    return result
+
+
+def main() -> int:
+    """
+    Run the benchmark on the first game level and on a generated level, the exit code is 1 on a mismatch
+    """
+    parser = argparse.ArgumentParser(description='Tile collision benchmark')
+    parser.add_argument('--enemies', default='10,100,1000', help='comma separated numbers of enemies')
+    parser.add_argument('--size', type=int, default=100, help='size of the generated level')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3, help='frames per case, the best time is kept')
+    parser.add_argument('--output', default='bench_collisions.json', help='JSON file to write the results to')
+    args = parser.parse_args()
+
+    levels = LevelStore()
+    generated = generate_level(f'random {args.size}', args.size, args.size, density=0.2, seed=args.seed)
+    cases = [(levels[0].name, levels[0]), (generated.name, LevelStore.build_level(generated))]
+
+    results = [run_case(name, level, count, args.seed, args.repeat)
+               for name, level in cases for count in map(int, args.enemies.split(','))]
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump({'python': platform.python_version(), 'results': results}, file, indent=2)
+    return 0 if all(result['ok'] for result in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
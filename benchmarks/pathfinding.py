@@ -0,0 +1,179 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 15:24:51
+ # @ Description:
+    Pathfinding benchmark and differential test. Every engine is timed on random and maze
+    levels from the level generator, and its path cost is checked against Dijkstra's algorithm.
+    Usage: python -m benchmarks.pathfinding --sizes 10,100,500 --output bench.json [--baseline old.json]
+ '''
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from src.core import (
+    SOLVERS,
+    DStarLite,
+    FlowField,
+    Graph,
+    Grid,
+    HierarchicalGrid,
+    dijkstra,
+    dijkstra_path,
+    node_distance,
+    node_name,
+    parse_node
+)
+from src.world.compiler import build_graph
+from src.world.generator import KINDS, generate_level
+
+# an engine answers (cost, nodes expanded) for a start and a goal
+Engine = Callable[[Grid, Graph, str, str], tuple[float, int]]
+
+
+def run_legacy(_: Grid, graph: Graph, start: str, goal: str) -> tuple[float, int]:
+    result = dijkstra(graph, start)
+    return result[goal].dist, len(result)
+
+
+def run_dstar_lite(_: Grid, graph: Graph, start: str, goal: str) -> tuple[float, int]:
+    result = DStarLite(graph, start, goal, node_distance).plan()
+    return result.cost, result.expanded
+
+
+def run_flow_field(grid: Grid, _: Graph, start: str, goal: str) -> tuple[float, int]:
+    field = FlowField(grid)
+    field.build(parse_node(goal))
+    return field.distance_at(*parse_node(start)), len(grid.walkable)
+
+
+def run_hpa(grid: Grid, _: Graph, start: str, goal: str) -> tuple[float, int]:
+    result = HierarchicalGrid(grid).find_path(parse_node(start), parse_node(goal))
+    return result.cost, result.expanded
+
+
+def solver_engine(name: str) -> Engine:
+    def run(_: Grid, graph: Graph, start: str, goal: str) -> tuple[float, int]:
+        result = SOLVERS[name](graph, start, goal)
+        return result.cost, result.expanded
+    return run
+
+
+# name: (engine, largest number of tiles it is run on)
+ENGINES: dict[str, tuple[Engine, int]] = {
+    'dijkstra()': (run_legacy, 200 * 200),
+    **{f'solver:{name}': (solver_engine(name), 2000 * 2000) for name in SOLVERS},
+    'hpa': (run_hpa, 1000 * 1000),
+    'dstar_lite': (run_dstar_lite, 1000 * 1000),
+    'flow_field': (run_flow_field, 2000 * 2000),
+}
+
+# engines trading optimality for speed, their cost can only be checked to never beat the reference
+APPROXIMATE_ENGINES = {'hpa'}
+
+
+def measure(engine: Engine, args: tuple[Grid, Graph, str, str], repeat: int) -> dict[str, Any]:
+    """
+    Best time of several runs, then one run under tracemalloc for the peak memory
+    """
+    best = float('infinity')
+    cost, expanded = float('infinity'), 0
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        cost, expanded = engine(*args)
+        best = min(best, time.perf_counter() - begin)
+
+    tracemalloc.start()
+    engine(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'seconds': best, 'peak_bytes': peak, 'expanded': expanded, 'cost': cost}
+
+
+def run_case(kind: str, size: int, seed: int, engines: list[str], repeat: int) -> list[dict[str, Any]]:
+    """
+    Run every engine on one generated grid and check its cost against the reference
+    """
+    # pylint: disable=R0914 # Too many local variables, disable for clarity
+    try:
+        level = generate_level(f'{kind} {size}', size, size, enemies=0, seed=seed, kind=kind)
+    except ValueError:
+        return []
+    grid = Grid.from_walls(level.walls)
+    graph = build_graph(level.walls)
+    start, goal = node_name(*level.start_position), node_name(*level.exit_position)
+    reference = dijkstra_path(graph, start, goal).cost
+
+    results = []
+    for name in engines:
+        engine, limit = ENGINES[name]
+        if size * size > limit:
+            continue
+        result = {'kind': kind, 'size': size, 'engine': name, **measure(engine, (grid, graph, start, goal), repeat)}
+        if name in APPROXIMATE_ENGINES:
+            result['ok'] = result['cost'] >= reference - 1e-6
+        else:
+            result['ok'] = abs(result['cost'] - reference) <= 1e-6
+        results.append(result)
+        print(f"{kind:>6} {size:>5} {name:<16} {result['seconds'] * 1000:10.2f} ms "
+              f"{result['peak_bytes'] / 1024:10.0f} KiB {result['expanded']:>9} expanded "
+              f"{'ok' if result['ok'] else 'COST MISMATCH'}")
+    return results
+
+
+def regressions(results: list[dict[str, Any]], baseline_path: str, tolerance: float) -> list[str]:
+    """
+    Cases that got slower than the baseline by more than the tolerance
+    """
+    with open(baseline_path, 'r', encoding='utf-8') as file:
+        baseline = {(r['kind'], r['size'], r['engine']): r for r in json.load(file)['results']}
+    slower = []
+    for result in results:
+        old = baseline.get((result['kind'], result['size'], result['engine']))
+        if old is not None and result['seconds'] > old['seconds'] * (1 + tolerance):
+            slower.append(f"{result['kind']} {result['size']} {result['engine']}: "
+                          f"{old['seconds'] * 1000:.2f} ms -> {result['seconds'] * 1000:.2f} ms")
+    return slower
+
+
+def main() -> int:
+    """
+    Run the benchmark, the exit code is 1 on a cost mismatch or a regression against the baseline
+    """
+    parser = argparse.ArgumentParser(description='Pathfinding benchmark and differential test')
+    parser.add_argument('--sizes', default='10,50,100,200', help='comma separated grid sizes, up to 2000')
+    parser.add_argument('--kinds', default=','.join(KINDS), help='comma separated level kinds: ' + ', '.join(KINDS))
+    parser.add_argument('--engines', default=','.join(ENGINES), help='comma separated engines')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3, help='runs per case, the best time is kept')
+    parser.add_argument('--output', default='bench_pathfinding.json', help='JSON file to write the results to')
+    parser.add_argument('--baseline', help='JSON results of a previous run to compare with')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown against the baseline')
+    args = parser.parse_args()
+
+    results = []
+    for kind in args.kinds.split(','):
+        for size in map(int, args.sizes.split(',')):
+            results += run_case(kind, size, args.seed, args.engines.split(','), args.repeat)
+
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump({'python': platform.python_version(), 'seed': args.seed, 'results': results}, file, indent=2)
+
+    failed = False
+    mismatches = [r for r in results if not r['ok']]
+    for result in mismatches:
+        print(f"cost mismatch: {result['kind']} {result['size']} {result['engine']}", file=sys.stderr)
+        failed = True
+    if args.baseline:
+        for line in regressions(results, args.baseline, args.tolerance):
+            print(f'regression: {line}', file=sys.stderr)
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,110 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 20:02:31
+ # @ Description:
+    Rendering benchmark. The frame time of the level tiles drawn one by one, with a subsurface
+    and a scale per tile, is compared with the baked tile layer on the game levels and on
+    larger random levels.
+    Usage: python -m benchmarks.rendering --sizes 50,200 --output bench.json
+ '''
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Any, Callable
+
+import numpy as np
+import pygame as pg
+
+from src.config import SCREEN_SIZE, TILE_SIZE
+from src.world.level import LEVELS
+from src.world.tile_layer import TileLayer
+
+
+def legacy_draw(screen: pg.Surface, walls: np.ndarray, exit_position: tuple[int, int],
+                world: tuple[pg.Surface, dict[str, tuple[int, int]], tuple[int, int]]) -> None:
+    """
+    Tiles drawn like LevelHandler.draw used to, a subsurface and a scale for every tile of every frame
+    """
+    image, frames, dimensions = world
+
+    def draw_tile_here(x: int, y: int, name: str) -> None:
+        brick_image = image.subsurface((*frames[name], *dimensions))
+        screen.blit(pg.transform.scale(brick_image, (TILE_SIZE, TILE_SIZE)), (x, y))
+
+    ys, xs = np.nonzero(walls)
+    for x, y in zip(xs.tolist(), ys.tolist()):
+        draw_tile_here(x * TILE_SIZE, y * TILE_SIZE, 'brick')
+    draw_tile_here(exit_position[0] * TILE_SIZE, exit_position[1] * TILE_SIZE, 'exit')
+
+
+def frame_time(draw: Callable[[], None], frames: int) -> float:
+    """
+    Best time of a frame over several frames
+    """
+    best = float('infinity')
+    for _ in range(frames):
+        begin = time.perf_counter()
+        draw()
+        best = min(best, time.perf_counter() - begin)
+    return best
+
+
+def run_case(screen: pg.Surface, name: str, walls: np.ndarray, exit_position: tuple[int, int],
+             frames: int) -> dict[str, Any]:
+    """
+    Time both ways of drawing a level, and the baking of its layer
+    """
+    world = LEVELS.load_world()
+    layer = TileLayer(walls, exit_position, LEVELS.tile_image('brick'), LEVELS.tile_image('exit'))
+
+    begin = time.perf_counter()
+    layer.bake(screen.get_rect())
+    bake = time.perf_counter() - begin
+
+    legacy = frame_time(lambda: legacy_draw(screen, walls, exit_position, world), frames)
+    baked = frame_time(lambda: layer.draw(screen), frames)
+    result = {'level': name, 'tiles': int(walls.sum()), 'legacy_seconds': legacy, 'baked_seconds': baked,
+              'bake_seconds': bake, 'speedup': legacy / baked}
+    print(f"{name:>12} {result['tiles']:>7} tiles {legacy * 1000:9.3f} ms -> {baked * 1000:7.3f} ms "
+          f"x{result['speedup']:6.1f}  (bake {bake * 1000:.2f} ms)")
+    return result
+
+
+def main() -> int:
+    """
+    Run the benchmark on the game levels and on random levels of the given sizes
+    """
+    parser = argparse.ArgumentParser(description='Tile rendering benchmark')
+    parser.add_argument('--sizes', default='50,200', help='comma separated sizes of the random levels')
+    parser.add_argument('--density', type=float, default=0.3, help='wall density of the random levels')
+    parser.add_argument('--frames', type=int, default=50, help='frames per case, the best time is kept')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='bench_rendering.json', help='JSON file to write the results to')
+    args = parser.parse_args()
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pg.init()
+    screen = pg.display.set_mode(SCREEN_SIZE)
+
+    results = []
+    for number in range(len(LEVELS)):
+        compiled = LEVELS.compile()[number]
+        results.append(run_case(screen, compiled.name, compiled.walls, compiled.exit_position, args.frames))
+
+    rng = np.random.default_rng(args.seed)
+    for size in map(int, args.sizes.split(',')):
+        walls = rng.random((size, size)) < args.density
+        results.append(run_case(screen, f'random {size}', walls, (1, 1), args.frames))
+
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump({'python': platform.python_version(), 'pygame': pg.version.ver, 'results': results}, file, indent=2)
+    pg.quit()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,140 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 23:58:21
+ # @ Description:
+    Asset registry. Every sprite sheet and TOML config is loaded once for the whole process,
+    and the animation frames and their atlas are shared by all the entities using the same sheet.
+ '''
+
+import threading
+from collections import Counter
+from types import MappingProxyType
+from typing import Any, Mapping
+
+import pygame as pg
+import toml
+
+from src.config import SCALING_FACTOR
+
+Animations = Mapping[str, tuple[pg.Surface, ...]]
+
+
+class Atlas:
+    """
+    Every frame of a sheet drawn once at its final scale, facing right and facing left, on a single surface.
+    A frame is drawn with one blit of its area of the atlas
+    """
+    def __init__(self, animations: Animations, scale: float = SCALING_FACTOR) -> None:
+        frames = [frame for frames in animations.values() for frame in frames]
+        width = max(int(frame.get_width() * scale) for frame in frames)
+        height = max(int(frame.get_height() * scale) for frame in frames)
+        self.surface = pg.Surface((2 * width, height * len(frames)), pg.SRCALPHA)
+        # area of each frame of the animations, facing right then facing left
+        self.rects: dict[pg.Surface, tuple[pg.Rect, pg.Rect]] = {}
+        for row, frame in enumerate(frames):
+            size = (int(frame.get_width() * scale), int(frame.get_height() * scale))
+            right = self.surface.blit(pg.transform.scale(frame, size), (0, row * height))
+            left = self.surface.blit(pg.transform.scale(pg.transform.flip(frame, True, False), size),
+                                     (width, row * height))
+            self.rects[frame] = (right, left)
+
+    def area(self, frame: pg.Surface, flipped: bool = False) -> pg.Rect:
+        """
+        Area of the atlas holding a frame of the animations
+        """
+        return self.rects[frame][flipped]
+
+
+class AssetRegistry:
+    """
+    Sheets, configs and animation frames, each one loaded on its first use and then kept.
+    Frames are tuples in a read-only mapping, they must not be drawn on. Assets can be loaded from any thread
+    """
+    def __init__(self) -> None:
+        self.sheets: dict[str, pg.Surface] = {}
+        self.configs: dict[str, dict[str, Any]] = {}
+        self.animation_sets: dict[tuple[str, str], Animations] = {}
+        self.atlases: dict[tuple[str, str], Atlas] = {}
+        # number of times each file was read from the disk
+        self.loads: Counter[str] = Counter()
+        self.lock = threading.RLock()
+
+    def sheet(self, path: str) -> pg.Surface:
+        """
+        Image of a sprite sheet, converted for the display
+        """
+        with self.lock:
+            if path not in self.sheets:
+                self.sheets[path] = pg.image.load(path).convert_alpha()
+                self.loads[path] += 1
+            return self.sheets[path]
+
+    def config(self, path: str) -> dict[str, Any]:
+        """
+        Content of a TOML file
+        """
+        with self.lock:
+            if path not in self.configs:
+                self.configs[path] = toml.load(path)
+                self.loads[path] += 1
+            return self.configs[path]
+
+    def animations(self, image_path: str, toml_path: str) -> Animations:
+        """
+        Frames of each animation of a sprite sheet, with the positions of its TOML file
+        """
+        with self.lock:
+            key = (image_path, toml_path)
+            if key not in self.animation_sets:
+                self.animation_sets[key] = MappingProxyType(slice_animations(self.sheet(image_path),
+                                                                             self.config(toml_path)))
+            return self.animation_sets[key]
+
+    def atlas(self, image_path: str, toml_path: str) -> Atlas:
+        """
+        Atlas of the animations of a sprite sheet
+        """
+        with self.lock:
+            key = (image_path, toml_path)
+            if key not in self.atlases:
+                self.atlases[key] = Atlas(self.animations(image_path, toml_path))
+            return self.atlases[key]
+
+    @property
+    def resident_bytes(self) -> int:
+        """
+        Pixel memory held by the sheets, the frames and the atlases
+        """
+        with self.lock:
+            surfaces = list(self.sheets.values()) + [atlas.surface for atlas in self.atlases.values()]
+            surfaces += [frame for animations in self.animation_sets.values()
+                         for frames in animations.values() for frame in frames]
+        return sum(surface.get_bytesize() * surface.get_width() * surface.get_height() for surface in surfaces)
+
+
+def get_frame(sprite_sheet: pg.Surface, position: tuple[int, int], size: tuple[int, int]) -> pg.Surface:
+    frame = pg.Surface(size, pg.SRCALPHA)
+    frame.blit(sprite_sheet, (0, 0), (*position, *size))
+    return frame
+
+
+def slice_animations(sprite_sheet: pg.Surface, config: dict[str, Any]) -> dict[str, tuple[pg.Surface, ...]]:
+    """
+    Cut the frames of the animations of a TOML config out of a sprite sheet
+    """
+    frame_width = config['animations']['frame_width']
+    frame_height = config['animations']['frame_height']
+
+    animations = {}
+    for animation_name, animation_data in config['animations'].items():
+        if animation_name in {'frame_width', 'frame_height'}:
+            continue
+
+        _ = animation_data['frame_count']
+        y_position = animation_data['y_position']
+        animations[animation_name] = tuple(get_frame(sprite_sheet, (x, y_position), (frame_width, frame_height))
+                                           for x in animation_data['x_positions'])
+    return animations
+
+
+ASSETS = AssetRegistry()
@@ -22,7 +22,38 @@ COLOR_WHITE = (255, 255, 255)
 COLOR_RED = (255, 0, 0)
 COLOR_GREEN = (0, 255, 0)
 
+# Loop settings
+# steps of the game per second, the physics constants are tuned for 60
+SIMULATION_RATE = 60
+# frames drawn per second at most, 0 for no limit
+FRAME_RATE = 60
+# steps run at most for a frame, a longer stall slows the game down instead of freezing it
+MAX_STEPS_PER_FRAME = 5
+
 # Game settings
 SCALING_FACTOR = 1.5
 GRAVITY = 0.02
 TILE_SIZE = 32
+# levels are split in chunks of CHUNK_TILES x CHUNK_TILES tiles for drawing
+CHUNK_TILES = 32
+# pixels around the screen in which chunks and enemies stay active
+CAMERA_MARGIN = 64
+# update only the parts of the screen the states report as changed, instead of flipping it all
+DIRTY_RECTS = False
+# move the enemies with array passes over a batch instead of one by one
+BATCH_PHYSICS = False
+# size in pixels of the cells of the broadphase grid of the entity collisions
+BROADPHASE_CELL = 64
+# push apart the enemies that overlap, changes how crowds of enemies move
+ENEMY_SEPARATION = False
+# frames between two AI updates of an enemy, by distance to the player: up to each distance, then beyond
+AI_LOD_DISTANCES = (8 * TILE_SIZE, 20 * TILE_SIZE)
+AI_LOD_INTERVALS = (1, 4, 16)
+# idle enemies out of the first distance are updated this many times less often
+AI_IDLE_FACTOR = 2
+# seconds of AI updates per frame, the enemies left over are updated first at the next frame
+AI_BUDGET = 0.002
+
+# Debug settings
+SHOW_PREFETCH_STATUS = False
+FONT_DEBUG_SIZE = 24
@@ -2,4 +2,15 @@
 Init file for core module.
 """
 
-from .dijkstra import dijkstra, Graph, Node
+from .dijkstra import dijkstra, shortest_paths, Graph, Node, PathResult, ShortestPaths
+from .astar import astar
+from .bidirectional import bidirectional_dijkstra, dijkstra_path, reversed_edges
+from .jps import jump_point_search
+from .grid import Grid, node_name, node_distance, parse_node, octile
+from .hpa import HierarchicalGrid
+from .solvers import find_path, SOLVERS, DEFAULT_SOLVER
+from .planner import PlannerService
+from .flow_field import FlowField, compute_flow_field
+from .dstar_lite import DStarLite
+from .path_cache import PathCache, content_hash, path_key
+from .batch import BatchResult, batch_shortest_paths
@@ -0,0 +1,23 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 09:25:03
+ # @ Description: A* search guided by the octile distance
+ '''
+
+from .dijkstra import Graph, PathResult
+from .grid import octile, parse_node
+from .search import heap_search, rebuild_path
+
+
+def astar(graph: Graph, start: str, goal: str) -> PathResult:
+    """
+    A* search between two nodes of a level graph, whose nodes are named "x-y".
+    The octile heuristic is exact on an empty grid, so few nodes are expanded.
+    """
+    edges = graph.edges
+    goal_tile = parse_node(goal)
+    dist, prev, closed = heap_search(start, lambda node, _: edges[node].items(), [goal],
+                                     lambda node: octile(parse_node(node), goal_tile))
+    if goal not in closed:
+        return PathResult([], float('infinity'), len(closed))
+    return PathResult(rebuild_path(prev, start, goal), dist[goal], len(closed))
@@ -0,0 +1,66 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 13:10:02
+ # @ Description: Many path queries answered at once, one search per source
+ '''
+
+from typing import Iterable
+
+import numpy as np
+
+from .dijkstra import Graph, shortest_paths
+
+
+class BatchResult:
+    """
+    Distances and predecessors of every searched source, as arrays indexed like nodes.
+    Unreached nodes have an infinite distance and a predecessor of -1.
+    """
+    def __init__(self, nodes: list[str]) -> None:
+        self.nodes = nodes
+        self.index = {node: i for i, node in enumerate(nodes)}
+        self.distances: dict[str, np.ndarray] = {}
+        self.predecessors: dict[str, np.ndarray] = {}
+        self.expanded = 0
+
+    def distance(self, source: str, target: str) -> float:
+        return float(self.distances[source][self.index[target]])
+
+    def path(self, source: str, target: str) -> list[str]:
+        """
+        Path from a searched source to a node, both included, or an empty list if it was not reached
+        """
+        predecessors = self.predecessors[source]
+        current = self.index[target]
+        if np.isinf(self.distances[source][current]):
+            return []
+        path = [current]
+        while self.nodes[current] != source:
+            current = int(predecessors[current])
+            path.append(current)
+        return [self.nodes[i] for i in reversed(path)]
+
+
+def batch_shortest_paths(graph: Graph, requests: Iterable[tuple[str, Iterable[str] | None]]) -> BatchResult:
+    """
+    Answer a list of (source, targets) requests, targets being None to reach every node.
+    Requests are grouped by source, so each source is searched once and stops when all its targets are settled.
+    """
+    grouped: dict[str, set[str] | None] = {}
+    for source, targets in requests:
+        merged = grouped.get(source, set())
+        grouped[source] = None if targets is None or merged is None else merged | set(targets)
+
+    batch = BatchResult(list(graph.edges))
+    for source, targets in grouped.items():
+        result = shortest_paths(graph, source, targets)
+        distances = np.full(len(batch.nodes), np.inf)
+        predecessors = np.full(len(batch.nodes), -1, dtype=np.int32)
+        for node in result.settled:
+            distances[batch.index[node]] = result.dist[node]
+            if node != source:
+                predecessors[batch.index[node]] = batch.index[result.prev[node]]
+        batch.distances[source] = distances
+        batch.predecessors[source] = predecessors
+        batch.expanded += result.expanded
+    return batch
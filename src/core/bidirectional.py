@@ -0,0 +1,92 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 13:52:19
+ # @ Description: Bidirectional Dijkstra for single pair queries
+ '''
+
+from heapq import heappush, heappop
+
+from .dijkstra import Graph, PathResult
+
+
+def bidirectional_dijkstra(graph: Graph,
+                           start: str,
+                           goal: str,
+                           reverse_edges: dict[str, dict[str, float]] | None = None) -> PathResult:
+    """
+    Dijkstra's algorithm run from both ends at once, it stops when the two frontiers meet.
+    The graph is assumed undirected, like level graphs, unless its reversed edges are given.
+    """
+    # pylint: disable=R0914 # Too many local variables, one set per direction
+    if start == goal:
+        return PathResult([start], 0.0, 1)
+
+    edges = [graph.edges, reverse_edges if reverse_edges is not None else graph.edges]
+    dist: list[dict[str, float]] = [{start: 0.0}, {goal: 0.0}]
+    prev: list[dict[str, str]] = [{}, {}]
+    settled: list[set[str]] = [set(), set()]
+    heaps: list[list[tuple[float, str]]] = [[(0.0, start)], [(0.0, goal)]]
+    best = float('infinity')
+    meeting: tuple[str, str] | None = None
+
+    while heaps[0] and heaps[1] and heaps[0][0][0] + heaps[1][0][0] < best:
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        current_dist, current = heappop(heaps[side])
+        if current in settled[side]:
+            continue
+        settled[side].add(current)
+
+        other_dist = dist[1 - side]
+        for neighbor, weight in edges[side].get(current, {}).items():
+            distance = current_dist + weight
+            if distance < dist[side].get(neighbor, float('infinity')):
+                dist[side][neighbor] = distance
+                prev[side][neighbor] = current
+                heappush(heaps[side], (distance, neighbor))
+            if neighbor in other_dist and distance + other_dist[neighbor] < best:
+                best = distance + other_dist[neighbor]
+                meeting = (current, neighbor) if side == 0 else (neighbor, current)
+
+    expanded = len(settled[0]) + len(settled[1])
+    if meeting is None:
+        return PathResult([], float('infinity'), expanded)
+
+    forward, backward = meeting
+    path = [forward]
+    while path[-1] != start:
+        path.append(prev[0][path[-1]])
+    path.reverse()
+    path.append(backward)
+    while path[-1] != goal:
+        path.append(prev[1][path[-1]])
+
+    # summed in path order, like a one-way search would
+    cost = 0.0
+    for current, neighbor in zip(path, path[1:]):
+        cost += graph.edges[current][neighbor]
+    return PathResult(path, cost, expanded)
+
+
+def reversed_edges(graph: Graph) -> dict[str, dict[str, float]] | None:
+    """
+    Edges of a graph turned around, or None when the graph is undirected:
+    every edge has its way back with the same weight, like in level graphs
+    """
+    edges = graph.edges
+    if all(edges.get(neighbor, {}).get(node) == weight
+           for node, neighbours in edges.items() for neighbor, weight in neighbours.items()):
+        return None
+    reverse: dict[str, dict[str, float]] = {node: {} for node in edges}
+    for node, neighbours in edges.items():
+        for neighbor, weight in neighbours.items():
+            reverse.setdefault(neighbor, {})[node] = weight
+    return reverse
+
+
+def dijkstra_path(graph: Graph, start: str, goal: str) -> PathResult:
+    """
+    Shortest path between two nodes of any graph, searched from both ends.
+    The reversed edges of a directed graph are built for the backward search,
+    see shortest_paths for a one-way search
+    """
+    return bidirectional_dijkstra(graph, start, goal, reversed_edges(graph))
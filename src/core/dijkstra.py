@@ -4,6 +4,11 @@
  # @ Description:
  '''
 
+from dataclasses import dataclass
+from typing import Iterable
+
+from .search import heap_search, rebuild_path
+
 class Node:
     """
     Node class to represent a node in the graph
@@ -36,23 +41,63 @@ class Graph:
     def __repr__(self) -> str:
         return self.__str__()
 
-def dijkstra(graph: Graph, start: str) -> dict[str, Node]:
+@dataclass
+class PathResult:
     """
-    Dijkstra's algorithm to find the shortest path from a starting node to all other nodes in the graph
+    Path between two nodes, both included, with its cost and the number of nodes the search expanded.
+    The path is empty and the cost infinite when the goal can not be reached.
     """
-    distances = graph.nodes
-    distances[start].dist = 0
-    unvisited = set(graph.nodes.keys())
+    path: list[str]
+    cost: float
+    expanded: int
+
+class ShortestPaths:
+    """
+    Result of a single-source search: the distance and one predecessor per settled node.
+    Paths are only rebuilt when asked for.
+    """
+    def __init__(self, start: str, dist: dict[str, float], prev: dict[str, str], settled: set[str]) -> None:
+        self.start = start
+        self.dist = dist
+        self.prev = prev
+        self.settled = settled
 
-    while unvisited:
-        current = min(unvisited, key=lambda node: distances[node].dist)
+    @property
+    def expanded(self) -> int:
+        """
+        Number of nodes settled by the search
+        """
+        return len(self.settled)
 
-        for neighbor, weight in graph.edges[current].items():
-            distance = distances[current].dist + weight
-            if distance < distances[neighbor].dist:
-                distances[neighbor].dist = distance
-                distances[neighbor].path = distances[current].path + ([current] if current != start else [])
+    def distance(self, node: str) -> float:
+        """
+        Distance from the start to a node, infinity if it was not reached
+        """
+        if node not in self.settled:
+            return float('infinity')
+        return self.dist[node]
 
-        unvisited.remove(current)
+    def path(self, node: str) -> list[str]:
+        """
+        Path from the start to a node, both included, or an empty list if it was not reached
+        """
+        if node not in self.settled:
+            return []
+        return rebuild_path(self.prev, self.start, node)
 
-    return distances
+def shortest_paths(graph: Graph, start: str, targets: Iterable[str] | None = None) -> ShortestPaths:
+    """
+    Dijkstra's algorithm with a binary heap, the graph is left untouched.
+    If targets are given, the search stops as soon as all of them are settled.
+    """
+    edges = graph.edges
+    dist, prev, settled = heap_search(start, lambda node, _: edges[node].items(), targets)
+    return ShortestPaths(start, dist, prev, settled)
+
+def dijkstra(graph: Graph, start: str) -> dict[str, Node]:
+    """
+    Dijkstra's algorithm to find the shortest path from a starting node to all other nodes in the graph.
+    The path of each node only holds the nodes between the start and the node itself.
+    """
+    result = shortest_paths(graph, start)
+    return {node: Node(node, result.distance(node), result.path(node)[1:-1]) for node in graph.edges}
@@ -0,0 +1,158 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 11:32:48
+ # @ Description: D* Lite, incremental replanning when the start moves or edges change
+ '''
+
+from heapq import heappush, heappop
+from typing import Callable, Iterable
+
+from .dijkstra import Graph, PathResult
+
+INFINITY = float('infinity')
+
+Key = tuple[float, float]
+
+
+def no_heuristic(_: str, __: str) -> float:
+    return 0.0
+
+
+class DStarLite:
+    """
+    D* Lite planner, searching backwards from the goal so that its work can be reused when the start moves.
+    When edge costs change only the part of the search they affect is repaired.
+    The heuristic must be consistent, the default one works on any graph.
+    """
+    def __init__(self,
+                 graph: Graph,
+                 start: str,
+                 goal: str,
+                 heuristic: Callable[[str, str], float] = no_heuristic) -> None:
+        self.graph = graph
+        self.start = start
+        self.goal = goal
+        self.heuristic = heuristic
+        self.predecessors: dict[str, dict[str, float]] = {node: {} for node in graph.edges}
+        for node, neighbours in graph.edges.items():
+            for neighbor, weight in neighbours.items():
+                self.predecessors.setdefault(neighbor, {})[node] = weight
+
+        self.g: dict[str, float] = {}
+        self.rhs: dict[str, float] = {goal: 0.0}
+        self.km = 0.0
+        self.queue: list[tuple[float, float, str]] = []
+        self.queued: dict[str, Key] = {}
+        self.expanded = 0
+        self.push(goal, self.calculate_key(goal))
+
+    def calculate_key(self, node: str) -> Key:
+        best = min(self.g.get(node, INFINITY), self.rhs.get(node, INFINITY))
+        return best + self.heuristic(self.start, node) + self.km, best
+
+    def push(self, node: str, key: Key) -> None:
+        self.queued[node] = key
+        heappush(self.queue, (key[0], key[1], node))
+
+    def top_key(self) -> Key:
+        """
+        Smallest key in the queue, skipping the entries that were updated or removed since they were pushed
+        """
+        while self.queue:
+            k1, k2, node = self.queue[0]
+            if self.queued.get(node) == (k1, k2):
+                return k1, k2
+            heappop(self.queue)
+        return INFINITY, INFINITY
+
+    def best_successor_cost(self, node: str) -> float:
+        return min((weight + self.g.get(neighbor, INFINITY)
+                    for neighbor, weight in self.graph.edges.get(node, {}).items()), default=INFINITY)
+
+    def update_vertex(self, node: str) -> None:
+        if self.g.get(node, INFINITY) != self.rhs.get(node, INFINITY):
+            self.push(node, self.calculate_key(node))
+        else:
+            self.queued.pop(node, None)
+
+    def compute_shortest_path(self) -> None:
+        """
+        Expand nodes until the start is consistent
+        """
+        while (self.top_key() < self.calculate_key(self.start) or
+               self.rhs.get(self.start, INFINITY) > self.g.get(self.start, INFINITY)):
+            k_old = self.top_key()
+            node = self.queue[0][2]
+            k_new = self.calculate_key(node)
+            self.expanded += 1
+
+            if k_old < k_new:
+                self.push(node, k_new)
+            elif self.g.get(node, INFINITY) > self.rhs.get(node, INFINITY):
+                self.g[node] = self.rhs[node]
+                del self.queued[node]
+                for predecessor, weight in self.predecessors.get(node, {}).items():
+                    if predecessor != self.goal:
+                        self.rhs[predecessor] = min(self.rhs.get(predecessor, INFINITY), weight + self.g[node])
+                    self.update_vertex(predecessor)
+            else:
+                g_old = self.g.get(node, INFINITY)
+                self.g[node] = INFINITY
+                for predecessor, weight in [*self.predecessors.get(node, {}).items(), (node, 0.0)]:
+                    if predecessor != self.goal and (predecessor == node or
+                                                     self.rhs.get(predecessor, INFINITY) == weight + g_old):
+                        self.rhs[predecessor] = self.best_successor_cost(predecessor)
+                    self.update_vertex(predecessor)
+
+    def move_start(self, start: str) -> None:
+        """
+        Move the start, the search state is kept and the queue keys are lowered by km instead of being rebuilt
+        """
+        self.km += self.heuristic(self.start, start)
+        self.start = start
+
+    def update_edges(self, changes: Iterable[tuple[str, str, float]]) -> None:
+        """
+        Change the cost of edges (source, target, cost) in the graph, an infinite cost removes the edge.
+        Only the nodes whose distance to the goal depends on them are repaired on the next query.
+        """
+        edges = self.graph.edges
+        for source, target, cost in changes:
+            old_cost = edges.get(source, {}).get(target, INFINITY)
+            if cost == INFINITY:
+                edges.get(source, {}).pop(target, None)
+                self.predecessors.get(target, {}).pop(source, None)
+            else:
+                edges.setdefault(source, {})[target] = cost
+                edges.setdefault(target, {})
+                self.predecessors.setdefault(target, {})[source] = cost
+                self.predecessors.setdefault(source, {})
+
+            if source == self.goal:
+                continue
+            if old_cost > cost:
+                self.rhs[source] = min(self.rhs.get(source, INFINITY), cost + self.g.get(target, INFINITY))
+            elif self.rhs.get(source, INFINITY) == old_cost + self.g.get(target, INFINITY):
+                self.rhs[source] = self.best_successor_cost(source)
+            self.update_vertex(source)
+
+    def plan(self) -> PathResult:
+        """
+        Shortest path from the current start to the goal, expanded counts the nodes repaired for this query
+        """
+        self.expanded = 0
+        if self.start not in self.graph.edges:
+            return PathResult([], INFINITY, 0)
+        self.compute_shortest_path()
+
+        # the start may be left overconsistent, its rhs value is exact
+        cost = self.rhs.get(self.start, INFINITY)
+        if cost == INFINITY:
+            return PathResult([], INFINITY, self.expanded)
+
+        path = [self.start]
+        while path[-1] != self.goal and len(path) <= len(self.graph.edges):
+            node = path[-1]
+            path.append(min(self.graph.edges[node].items(),
+                            key=lambda item: item[1] + self.g.get(item[0], INFINITY))[0])
+        return PathResult(path, cost, self.expanded)
@@ -0,0 +1,112 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 10:48:26
+ # @ Description: Flow field shared by every agent chasing the same target
+ '''
+
+from heapq import heappush, heappop
+
+import numpy as np
+
+from .grid import Grid
+from .planner import PlannerService
+
+
+def compute_flow_field(grid: Grid, target: tuple[int, int]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Search from the target to every reachable tile, the level graph is undirected
+    so the predecessor of a tile is its next step towards the target.
+    Return the distance and step arrays, it does not touch any shared state so it can run on a worker.
+    """
+    dist: dict[tuple[int, int], float] = {target: 0.0}
+    next_tile: dict[tuple[int, int], tuple[int, int]] = {target: target}
+    heap: list[tuple[float, tuple[int, int]]] = [(0.0, target)]
+
+    while heap:
+        current_dist, current = heappop(heap)
+        if current_dist > dist[current]:
+            continue
+        for neighbor, cost in grid.neighbours(*current):
+            distance = current_dist + cost
+            if distance < dist.get(neighbor, float('infinity')):
+                dist[neighbor] = distance
+                next_tile[neighbor] = current
+                heappush(heap, (distance, neighbor))
+
+    tiles = np.array(list(next_tile.keys()), dtype=np.intp)
+    steps = np.array(list(next_tile.values()), dtype=np.intp) - tiles
+
+    distance_array = np.full((grid.height, grid.width), np.inf)
+    distance_array[tiles[:, 1], tiles[:, 0]] = np.fromiter(dist.values(), dtype=float, count=len(dist))
+    step_array = np.zeros((grid.height, grid.width, 2), dtype=np.int8)
+    step_array[tiles[:, 1], tiles[:, 0]] = steps
+    return distance_array, step_array
+
+
+class FlowField:
+    """
+    Distance to a target tile and next step towards it, for every tile of a grid.
+    It is built with one search from the target, then any number of agents read their next step in O(1).
+    """
+    def __init__(self, grid: Grid) -> None:
+        self.grid = grid
+        self.target: tuple[int, int] | None = None
+        self.pending: tuple[int, int] | None = None
+        self.builds = 0
+        self.distance = np.full((grid.height, grid.width), np.inf)
+        self.step = np.zeros((grid.height, grid.width, 2), dtype=np.int8)
+
+    def retarget(self, target: tuple[int, int]) -> bool:
+        """
+        Rebuild the field if the target moved to another walkable tile, return True if it was rebuilt
+        """
+        if target == self.target or not self.grid.is_walkable(*target):
+            return False
+        self.build(target)
+        return True
+
+    def build(self, target: tuple[int, int]) -> None:
+        """
+        Build the field for a target right away
+        """
+        self.apply(target, *compute_flow_field(self.grid, target))
+
+    def retarget_async(self, target: tuple[int, int], planner: PlannerService) -> bool:
+        """
+        Like retarget, but the field is built by the planner workers.
+        The current field stays in use until the new one is delivered by planner.poll()
+        """
+        if target in (self.target, self.pending) or not self.grid.is_walkable(*target):
+            return False
+        self.pending = target
+        planner.submit(self, compute_flow_field, self.grid, target,
+                       callback=lambda arrays: self.apply(target, *arrays))
+        return True
+
+    def apply(self, target: tuple[int, int], distance: np.ndarray, step: np.ndarray) -> None:
+        """
+        Swap in the arrays built for a target
+        """
+        self.distance = distance
+        self.step = step
+        self.target = target
+        if self.pending == target:
+            self.pending = None
+        self.builds += 1
+
+    def step_at(self, x: int, y: int) -> tuple[int, int]:
+        """
+        Next move (dx, dy) towards the target, (0, 0) on the target or on a tile that can not reach it
+        """
+        if not (0 <= x < self.grid.width and 0 <= y < self.grid.height):
+            return 0, 0
+        dx, dy = self.step[y, x]
+        return int(dx), int(dy)
+
+    def distance_at(self, x: int, y: int) -> float:
+        """
+        Distance to the target, infinity if the tile can not reach it
+        """
+        if not (0 <= x < self.grid.width and 0 <= y < self.grid.height):
+            return float('infinity')
+        return float(self.distance[y, x])
@@ -0,0 +1,111 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 09:12:40
+ # @ Description: Grid view of a level graph, used by the grid-only searches
+ '''
+
+from math import sqrt
+
+import numpy as np
+
+from .dijkstra import Graph
+
+SQRT2 = sqrt(2)
+
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, -1), (-1, 1), (1, 1)]
+
+
+def node_name(x: int, y: int) -> str:
+    """
+    Name of the graph node of a tile
+    """
+    return f'{x}-{y}'
+
+
+def parse_node(name: str) -> tuple[int, int]:
+    """
+    Tile of a graph node, from its "x-y" name
+    """
+    x, y = name.split('-')
+    return int(x), int(y)
+
+
+def octile(a: tuple[int, int], b: tuple[int, int]) -> float:
+    """
+    Octile distance, the exact cost between two tiles of an empty 8-connected grid
+    """
+    dx = abs(a[0] - b[0])
+    dy = abs(a[1] - b[1])
+    return max(dx, dy) + (SQRT2 - 1) * min(dx, dy)
+
+
+def node_distance(a: str, b: str) -> float:
+    """
+    Octile distance between two graph nodes
+    """
+    return octile(parse_node(a), parse_node(b))
+
+
+class Grid:
+    """
+    Walkable tiles of an 8-connected level.
+    A diagonal move is only allowed when both tiles it passes by are walkable, like in the level graph.
+    """
+    def __init__(self, walkable: set[tuple[int, int]], width: int, height: int) -> None:
+        self.walkable = walkable
+        self.width = width
+        self.height = height
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> 'Grid':
+        """
+        Build the grid from the nodes of a level graph
+        """
+        walkable = {parse_node(name) for name in graph.edges}
+        width = max((x for x, _ in walkable), default=-1) + 1
+        height = max((y for _, y in walkable), default=-1) + 1
+        return cls(walkable, width, height)
+
+    @classmethod
+    def from_walls(cls, walls: np.ndarray) -> 'Grid':
+        """
+        Build the grid from a (height, width) array, True for the walls
+        """
+        ys, xs = np.nonzero(~walls)
+        return cls(set(zip(xs.tolist(), ys.tolist())), walls.shape[1], walls.shape[0])
+
+    @classmethod
+    def from_rows(cls, rows: list[str]) -> 'Grid':
+        """
+        Build the grid from layout rows, where '#' is a wall
+        """
+        walkable = {(x, y) for y, row in enumerate(rows) for x, char in enumerate(row) if char != '#'}
+        return cls(walkable, max((len(row) for row in rows), default=0), len(rows))
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        return (x, y) in self.walkable
+
+    def neighbours(self, x: int, y: int) -> list[tuple[tuple[int, int], float]]:
+        """
+        Reachable neighbours of a tile with the cost to move there
+        """
+        walkable = self.walkable
+        result = []
+        for dx, dy in DIRECTIONS:
+            if (x + dx, y + dy) not in walkable:
+                continue
+            if dx and dy:
+                if (x + dx, y) in walkable and (x, y + dy) in walkable:
+                    result.append(((x + dx, y + dy), SQRT2))
+            else:
+                result.append(((x + dx, y + dy), 1.0))
+        return result
+
+    def to_graph(self) -> Graph:
+        """
+        Build the level graph of the grid
+        """
+        return Graph({
+            node_name(x, y): {node_name(*tile): cost for tile, cost in self.neighbours(x, y)}
+            for x, y in sorted(self.walkable, key=lambda tile: (tile[1], tile[0]))
+        })
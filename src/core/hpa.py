@@ -0,0 +1,197 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 14:20:37
+ # @ Description: Hierarchical pathfinding (HPA*) for very large levels
+ '''
+
+from .dijkstra import PathResult
+from .grid import Grid, node_name, octile
+from .search import heap_search, rebuild_path
+
+Tile = tuple[int, int]
+Cluster = tuple[int, int]
+
+CLUSTER_SIZE = 10
+# entrances up to this width get one transition in their middle, wider ones get one at each end
+MAX_NARROW_ENTRANCE = 5
+
+
+class HierarchicalGrid:
+    """
+    HPA* abstraction of a grid: the grid is split into square clusters, linked by transitions
+    placed on the entrances between neighbouring clusters.
+    Queries search the small abstract graph and only refine the clusters the path goes through.
+    Paths are close to optimal, not always optimal. Building the abstraction costs more than a single
+    search, so it is only worth it for many queries on a grid whose tiles change through set_walkable.
+    """
+    def __init__(self, grid: Grid, cluster_size: int = CLUSTER_SIZE) -> None:
+        self.grid = grid
+        self.cluster_size = cluster_size
+        self.columns = (grid.width + cluster_size - 1) // cluster_size
+        self.rows = (grid.height + cluster_size - 1) // cluster_size
+        # transitions on the border between two clusters, as (tile in the first, tile in the second)
+        self.borders: dict[tuple[Cluster, Cluster], list[tuple[Tile, Tile]]] = {}
+        # abstract edges inside each cluster, between its transition tiles
+        self.intra: dict[Cluster, dict[Tile, dict[Tile, float]]] = {}
+        self.rebuilt_clusters = 0
+
+        for cx in range(self.columns):
+            for cy in range(self.rows):
+                if cx + 1 < self.columns:
+                    self.build_border((cx, cy), (cx + 1, cy))
+                if cy + 1 < self.rows:
+                    self.build_border((cx, cy), (cx, cy + 1))
+        for cx in range(self.columns):
+            for cy in range(self.rows):
+                self.build_cluster((cx, cy))
+
+    def cluster_of(self, tile: Tile) -> Cluster:
+        return tile[0] // self.cluster_size, tile[1] // self.cluster_size
+
+    def transitions(self, cluster: Cluster) -> list[tuple[Tile, Tile]]:
+        """
+        Transitions leaving a cluster, as (tile inside, tile in the neighbour)
+        """
+        cx, cy = cluster
+        result = []
+        for neighbour in ((cx - 1, cy), (cx + 1, cy), (cx, cy - 1), (cx, cy + 1)):
+            if (cluster, neighbour) in self.borders:
+                result += self.borders[(cluster, neighbour)]
+            elif (neighbour, cluster) in self.borders:
+                result += [(inside, outside) for outside, inside in self.borders[(neighbour, cluster)]]
+        return result
+
+    def build_border(self, first: Cluster, second: Cluster) -> None:
+        """
+        Find the entrances on the border between two clusters, the second one being right or below the first
+        """
+        size = self.cluster_size
+        if second[0] > first[0]:
+            x = second[0] * size
+            pairs = [((x - 1, y), (x, y)) for y in range(first[1] * size, min((first[1] + 1) * size, self.grid.height))]
+        else:
+            y = second[1] * size
+            pairs = [((x, y - 1), (x, y)) for x in range(first[0] * size, min((first[0] + 1) * size, self.grid.width))]
+
+        transitions: list[tuple[Tile, Tile]] = []
+        run: list[tuple[Tile, Tile]] = []
+        for pair in [*pairs, None]:
+            if pair is not None and self.grid.is_walkable(*pair[0]) and self.grid.is_walkable(*pair[1]):
+                run.append(pair)
+                continue
+            if len(run) > MAX_NARROW_ENTRANCE:
+                transitions += [run[0], run[-1]]
+            elif run:
+                transitions.append(run[len(run) // 2])
+            run = []
+        self.borders[(first, second)] = transitions
+
+    def build_cluster(self, cluster: Cluster) -> None:
+        """
+        Compute the abstract edges between the transition tiles of a cluster
+        """
+        tiles = {inside for inside, _ in self.transitions(cluster)}
+        edges: dict[Tile, dict[Tile, float]] = {}
+        for tile in tiles:
+            dist, _ = self.local_search(tile, cluster, tiles - {tile})
+            edges[tile] = {other: dist[other] for other in tiles if other != tile and other in dist}
+        self.intra[cluster] = edges
+        self.rebuilt_clusters += 1
+
+    def local_search(self, source: Tile, cluster: Cluster, targets: set[Tile]) -> tuple[dict[Tile, float],
+                                                                                      dict[Tile, Tile]]:
+        """
+        Dijkstra's algorithm limited to the tiles of a cluster, it stops once all targets are settled
+        """
+        def successors(current: Tile, _: Tile | None) -> list[tuple[Tile, float]]:
+            return [(neighbor, cost) for neighbor, cost in self.grid.neighbours(*current)
+                    if self.cluster_of(neighbor) == cluster]
+
+        if not targets:
+            return {}, {}
+        dist, prev, settled = heap_search(source, successors, targets)
+        return {tile: dist[tile] for tile in settled}, prev
+
+    def set_walkable(self, x: int, y: int, walkable: bool) -> None:
+        """
+        Open or close a tile, only its cluster and the neighbours sharing the border it is on are rebuilt
+        """
+        if self.grid.is_walkable(x, y) == walkable:
+            return
+        if walkable:
+            self.grid.walkable.add((x, y))
+        else:
+            self.grid.walkable.discard((x, y))
+
+        cluster = self.cluster_of((x, y))
+        cx, cy = cluster
+        size = self.cluster_size
+        affected = {cluster}
+        if x == cx * size and cx > 0:
+            self.build_border((cx - 1, cy), cluster)
+            affected.add((cx - 1, cy))
+        if x == (cx + 1) * size - 1 and cx + 1 < self.columns:
+            self.build_border(cluster, (cx + 1, cy))
+            affected.add((cx + 1, cy))
+        if y == cy * size and cy > 0:
+            self.build_border((cx, cy - 1), cluster)
+            affected.add((cx, cy - 1))
+        if y == (cy + 1) * size - 1 and cy + 1 < self.rows:
+            self.build_border(cluster, (cx, cy + 1))
+            affected.add((cx, cy + 1))
+        for other in affected:
+            self.build_cluster(other)
+
+    def abstract_path(self, start: Tile, goal: Tile) -> tuple[list[Tile], int]:
+        """
+        A* over the transitions, with the start and goal temporarily linked to their clusters
+        """
+        start_cluster, goal_cluster = self.cluster_of(start), self.cluster_of(goal)
+        start_tiles = {inside for inside, _ in self.transitions(start_cluster)}
+        goal_tiles = {inside for inside, _ in self.transitions(goal_cluster)}
+        start_edges, _ = self.local_search(start, start_cluster, start_tiles | {goal})
+        goal_edges, _ = self.local_search(goal, goal_cluster, goal_tiles)
+
+        def successors(current: Tile, _: Tile | None) -> list[tuple[Tile, float]]:
+            if current == start:
+                neighbours = {tile: cost for tile, cost in start_edges.items() if tile != start}
+            else:
+                neighbours = dict(self.intra[self.cluster_of(current)].get(current, {}))
+                if current in goal_edges:
+                    neighbours[goal] = goal_edges[current]
+            for inside, outside in self.transitions(self.cluster_of(current)):
+                if inside == current:
+                    neighbours[outside] = 1.0
+            return list(neighbours.items())
+
+        _, prev, closed = heap_search(start, successors, [goal], lambda tile: octile(tile, goal))
+        if goal not in closed:
+            return [], len(closed)
+        return rebuild_path(prev, start, goal), len(closed)
+
+    def find_path(self, start: Tile, goal: Tile) -> PathResult:
+        """
+        Path between two tiles, refined one cluster at a time
+        """
+        if not self.grid.is_walkable(*start) or not self.grid.is_walkable(*goal):
+            return PathResult([], float('infinity'), 0)
+        if start == goal:
+            return PathResult([node_name(*start)], 0.0, 1)
+
+        waypoints, expanded = self.abstract_path(start, goal)
+        if not waypoints:
+            return PathResult([], float('infinity'), expanded)
+
+        path = [start]
+        cost = 0.0
+        for current, following in zip(waypoints, waypoints[1:]):
+            cluster = self.cluster_of(current)
+            if self.cluster_of(following) != cluster:
+                # a transition between two clusters is a single straight move
+                path.append(following)
+                cost += 1.0
+                continue
+            dist, prev = self.local_search(current, cluster, {following})
+            cost += dist[following]
+            path += rebuild_path(prev, current, following)[1:]
+        return PathResult([node_name(*tile) for tile in path], cost, expanded)
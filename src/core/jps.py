@@ -0,0 +1,128 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 09:41:17
+ # @ Description: Jump Point Search for uniform-cost 8-connected grids
+ '''
+
+from .dijkstra import Graph, PathResult
+from .grid import DIRECTIONS, Grid, node_name, octile, parse_node
+from .search import heap_search, rebuild_path
+
+Tile = tuple[int, int]
+
+
+def _sign(value: int) -> int:
+    return (value > 0) - (value < 0)
+
+
+def _jump(grid: Grid, tile: Tile, direction: Tile, goal: Tile) -> Tile | None:
+    """
+    Walk from a tile in a direction until a jump point is found, or None if a wall is hit first
+    """
+    walkable = grid.walkable
+    x, y = tile
+    dx, dy = direction
+    while True:
+        if (x, y) not in walkable:
+            return None
+        if (x, y) == goal:
+            return x, y
+
+        if dx and dy:
+            # a diagonal move stops where a straight move would find something
+            if _jump(grid, (x + dx, y), (dx, 0), goal) or _jump(grid, (x, y + dy), (0, dy), goal):
+                return x, y
+        elif dx:
+            if ((x, y - 1) in walkable and (x - dx, y - 1) not in walkable) or\
+               ((x, y + 1) in walkable and (x - dx, y + 1) not in walkable):
+                return x, y
+        else:
+            if ((x - 1, y) in walkable and (x - 1, y - dy) not in walkable) or\
+               ((x + 1, y) in walkable and (x + 1, y - dy) not in walkable):
+                return x, y
+
+        # corners can not be cut
+        if (x + dx, y) not in walkable or (x, y + dy) not in walkable:
+            return None
+        x += dx
+        y += dy
+
+
+def _directions(grid: Grid, tile: Tile, parent: Tile | None) -> list[Tile]:
+    """
+    Directions worth exploring from a tile, the natural and forced neighbours of the move that led here
+    """
+    # pylint: disable=R0912 # Too many branches, one per kind of move
+    x, y = tile
+    if parent is None:
+        return list(DIRECTIONS)
+
+    walkable = grid.walkable
+    dx = _sign(x - parent[0])
+    dy = _sign(y - parent[1])
+    directions = []
+    if dx and dy:
+        if (x, y + dy) in walkable:
+            directions.append((0, dy))
+        if (x + dx, y) in walkable:
+            directions.append((dx, 0))
+        if (x, y + dy) in walkable and (x + dx, y) in walkable:
+            directions.append((dx, dy))
+    elif dx:
+        if (x + dx, y) in walkable:
+            directions.append((dx, 0))
+        for side in (-1, 1):
+            if (x, y + side) in walkable:
+                directions.append((0, side))
+                directions.append((dx, side))
+    else:
+        if (x, y + dy) in walkable:
+            directions.append((0, dy))
+        for side in (-1, 1):
+            if (x + side, y) in walkable:
+                directions.append((side, 0))
+                directions.append((side, dy))
+    return directions
+
+
+def _expand(jump_points: list[Tile]) -> list[str]:
+    """
+    Fill the tiles between consecutive jump points, so that the path moves one tile at a time
+    """
+    path = [node_name(*jump_points[0])]
+    for (x, y), (x2, y2) in zip(jump_points, jump_points[1:]):
+        dx = _sign(x2 - x)
+        dy = _sign(y2 - y)
+        while (x, y) != (x2, y2):
+            x += dx
+            y += dy
+            path.append(node_name(x, y))
+    return path
+
+
+def jump_point_search(graph: Graph, start: str, goal: str) -> PathResult:
+    """
+    Jump Point Search between two nodes of a level graph.
+    Only valid for uniform-cost grids, where straight moves cost 1 and diagonal ones sqrt(2).
+    """
+    grid = Grid.from_graph(graph)
+    start_tile = parse_node(start)
+    goal_tile = parse_node(goal)
+    if start_tile not in grid.walkable or goal_tile not in grid.walkable:
+        return PathResult([], float('infinity'), 0)
+
+    def successors(current: Tile, parent: Tile | None) -> list[tuple[Tile, float]]:
+        jump_points = []
+        for dx, dy in _directions(grid, current, parent):
+            if dx and dy and ((current[0] + dx, current[1]) not in grid.walkable or
+                              (current[0], current[1] + dy) not in grid.walkable):
+                continue
+            jump_point = _jump(grid, (current[0] + dx, current[1] + dy), (dx, dy), goal_tile)
+            if jump_point is not None:
+                jump_points.append((jump_point, octile(current, jump_point)))
+        return jump_points
+
+    dist, prev, closed = heap_search(start_tile, successors, [goal_tile], lambda tile: octile(tile, goal_tile))
+    if goal_tile not in closed:
+        return PathResult([], float('infinity'), len(closed))
+    return PathResult(_expand(rebuild_path(prev, start_tile, goal_tile)), dist[goal_tile], len(closed))
@@ -0,0 +1,108 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 12:21:36
+ # @ Description: Path results cached in memory and on disk
+ '''
+
+import hashlib
+import json
+import os
+import shutil
+from collections import OrderedDict
+
+from .dijkstra import PathResult
+
+
+def content_hash(content: str) -> str:
+    """
+    Hash of a text, used to tell when a level changed
+    """
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+def path_key(layout_hash: str, start: str, goal: str, solver: str) -> str:
+    return f'{layout_hash}:{start}:{goal}:{solver}'
+
+
+class PathCache:
+    """
+    Two layer cache of path results: a LRU dictionary in memory in front of one JSON file per entry on disk.
+    The disk entries live in a folder named after a version, the hash of the level file. Several versions
+    are kept, so that stores of different level files share the folder, and the least recently opened
+    ones are deleted past the limit.
+    """
+    def __init__(self, directory: str, capacity: int = 256, versions: int = 8) -> None:
+        self.directory = directory
+        self.capacity = capacity
+        self.versions = versions
+        self.version: str | None = None
+        self.memory: OrderedDict[str, PathResult] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def open(self, version: str) -> None:
+        """
+        Use the entries written for a version of the levels.
+        The memory layer is kept, its keys already hold the layout and the solver of each path
+        """
+        self.version = version
+        try:
+            folder = os.path.join(self.directory, version)
+            os.makedirs(folder, exist_ok=True)
+            os.utime(folder)
+            folders = [os.path.join(self.directory, name) for name in os.listdir(self.directory)]
+            folders = sorted((path for path in folders if os.path.isdir(path)), key=os.path.getmtime, reverse=True)
+        except OSError:
+            return
+        for path in folders[self.versions:]:
+            if path != folder:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, str(self.version), f'{content_hash(key)}.json')
+
+    def get(self, key: str) -> PathResult | None:
+        """
+        Get a result from memory, then from disk, or None if it was never stored
+        """
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.hits += 1
+            return self.memory[key]
+
+        if self.version is not None:
+            try:
+                with open(self.entry_path(key), 'r', encoding='utf-8') as file:
+                    data = json.load(file)
+                result = PathResult(data['path'], data['cost'], 0)
+                self.remember(key, result)
+                self.hits += 1
+                return result
+            except (OSError, ValueError, KeyError):
+                pass
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, result: PathResult) -> None:
+        """
+        Store a result in memory and on disk
+        """
+        self.remember(key, result)
+        if self.version is None:
+            return
+        path = self.entry_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(f'{path}.tmp', 'w', encoding='utf-8') as file:
+                json.dump({'key': key, 'path': result.path, 'cost': result.cost}, file)
+            os.replace(f'{path}.tmp', path)
+        except OSError:
+            # the disk layer is only an optimization
+            pass
+
+    def remember(self, key: str, result: PathResult) -> None:
+        self.memory[key] = result
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.capacity:
+            self.memory.popitem(last=False)
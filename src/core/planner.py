@@ -0,0 +1,104 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 16:08:14
+ # @ Description: AI planning jobs run on a worker pool, off the game loop
+ '''
+
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+from .dijkstra import Graph, PathResult
+from .solvers import find_path
+
+
+@dataclass
+class Job:
+    """
+    Job submitted to the planner, its result is only delivered if no newer job was submitted for its key
+    """
+    key: Hashable
+    generation: int
+    future: Future
+    callback: Callable[[Any], None]
+    submitted: float
+
+
+class PlannerService:
+    """
+    Runs path and flow field jobs on a thread or process pool, so the game loop never waits for them.
+    Results are handed back by poll(), on the thread calling it, in a later frame.
+    Each job belongs to a key, an enemy or a flow field: submitting a new job for a key makes
+    the older ones stale, their results are dropped instead of delivered.
+    A key is only held until its latest job is finished, so that finished keys can be freed.
+    """
+    def __init__(self, executor: Executor | None = None) -> None:
+        self.executor = executor if executor is not None else ThreadPoolExecutor(1, thread_name_prefix='planner')
+        # latest job of each key with a job in flight, numbered over all keys so that a number is never reused
+        self.generations: dict[Hashable, int] = {}
+        self.submitted = 0
+        self.jobs: list[Job] = []
+        self.latencies: deque[float] = deque(maxlen=100)
+        self.delivered = 0
+        self.dropped = 0
+
+    def submit(self, key: Hashable, function: Callable[..., Any], *args: Any,
+               callback: Callable[[Any], None]) -> int:
+        """
+        Run function(*args) on a worker, callback receives its result from poll(). Return the job generation
+        """
+        self.submitted += 1
+        generation = self.submitted
+        self.generations[key] = generation
+        self.jobs.append(Job(key, generation, self.executor.submit(function, *args), callback, time.perf_counter()))
+        return generation
+
+    def submit_path(self, # pylint: disable=too-many-arguments, too-many-positional-arguments
+                    key: Hashable,
+                    graph: Graph,
+                    start: str,
+                    goal: str,
+                    solver: str,
+                    callback: Callable[[PathResult], None]) -> int:
+        """
+        Search a path on a worker, the graph must not be changed until the result is delivered
+        """
+        return self.submit(key, find_path, graph, start, goal, solver, callback=callback)
+
+    def poll(self) -> int:
+        """
+        Deliver the results of the finished jobs that are still the latest of their key, return how many.
+        A job that raised raises again here.
+        """
+        delivered = 0
+        for job in [job for job in self.jobs if job.future.done()]:
+            # taken out before its callback, a job or callback that raises is not seen again by the next poll
+            self.jobs.remove(job)
+            self.latencies.append(time.perf_counter() - job.submitted)
+            if job.generation != self.generations.get(job.key):
+                self.dropped += 1
+                continue
+            del self.generations[job.key]
+            job.callback(job.future.result())
+            delivered += 1
+            self.delivered += 1
+        return delivered
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Number of jobs submitted and not finished yet
+        """
+        return sum(1 for job in self.jobs if not job.future.done())
+
+    @property
+    def average_latency(self) -> float:
+        """
+        Average time in seconds between the submission of the last jobs and their delivery
+        """
+        return sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
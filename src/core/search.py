@@ -0,0 +1,58 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 12:01:18
+ # @ Description: Heap search shared by the solvers, each one only gives its successors and heuristic
+ '''
+
+from heapq import heappush, heappop
+from typing import Callable, Hashable, Iterable, TypeVar
+
+Key = TypeVar('Key', bound=Hashable)
+
+
+def heap_search(start: Key,
+                successors: Callable[[Key, Key | None], Iterable[tuple[Key, float]]],
+                targets: Iterable[Key] | None = None,
+                heuristic: Callable[[Key], float] | None = None) -> tuple[dict[Key, float], dict[Key, Key], set[Key]]:
+    """
+    Best first search from a node, Dijkstra's algorithm without heuristic and A* with one.
+    The successors of a node are given with its parent, None for the start.
+    If targets are given, the search stops as soon as all of them are settled.
+    Return the distances, the predecessors and the settled nodes
+    """
+    dist: dict[Key, float] = {start: 0.0}
+    prev: dict[Key, Key] = {}
+    closed: set[Key] = set()
+    remaining = set(targets) if targets is not None else None
+    heap: list[tuple[float, float, Key]] = [(heuristic(start) if heuristic else 0.0, 0.0, start)]
+
+    while heap:
+        _, current_dist, current = heappop(heap)
+        if current in closed:
+            continue
+        closed.add(current)
+
+        if remaining is not None:
+            remaining.discard(current)
+            if not remaining:
+                break
+
+        for neighbor, weight in successors(current, prev.get(current)):
+            distance = current_dist + weight
+            if distance < dist.get(neighbor, float('infinity')):
+                dist[neighbor] = distance
+                prev[neighbor] = current
+                heappush(heap, (distance + heuristic(neighbor) if heuristic else distance, distance, neighbor))
+
+    return dist, prev, closed
+
+
+def rebuild_path(prev: dict[Key, Key], start: Key, node: Key) -> list[Key]:
+    """
+    Path from the start to a node, both included, following the predecessors
+    """
+    path = [node]
+    while path[-1] != start:
+        path.append(prev[path[-1]])
+    path.reverse()
+    return path
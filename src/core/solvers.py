@@ -0,0 +1,32 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 10:02:55
+ # @ Description: Search backends that can be picked per level
+ '''
+
+from typing import Callable
+
+from .astar import astar
+from .bidirectional import dijkstra_path
+from .dijkstra import Graph, PathResult
+from .jps import jump_point_search
+
+Solver = Callable[[Graph, str, str], PathResult]
+
+SOLVERS: dict[str, Solver] = {
+    # a single pair is always asked for, so Dijkstra's algorithm runs from both ends
+    'dijkstra': dijkstra_path,
+    'astar': astar,
+    'jps': jump_point_search,
+}
+
+DEFAULT_SOLVER = 'dijkstra'
+
+
+def find_path(graph: Graph, start: str, goal: str, solver: str = DEFAULT_SOLVER) -> PathResult:
+    """
+    Shortest path between two nodes with the given search backend
+    """
+    if solver not in SOLVERS:
+        raise ValueError(f'Unknown solver "{solver}", expected one of: {", ".join(SOLVERS)}')
+    return SOLVERS[solver](graph, start, goal)
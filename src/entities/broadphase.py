@@ -0,0 +1,103 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 11:46:20
+ # @ Description:
+    Broadphase of the entity collisions. Entities are kept in a uniform grid of cells, only the
+    ones sharing a cell are candidates for a collision check. An entity is only moved in the grid
+    when its box covers other cells than at the last tick.
+ '''
+
+from itertools import combinations
+from typing import Generic, Hashable, TypeVar
+
+from src.config import BROADPHASE_CELL
+
+# x0, y0, x1, y1 with the bounds included, like the corners of ObjectCollision
+Box = tuple[float, float, float, float]
+CellRange = tuple[int, int, int, int]
+Item = TypeVar('Item', bound=Hashable)
+
+
+class SpatialGrid(Generic[Item]):
+    """
+    Uniform grid of entity boxes. Results come in the order the entities were first inserted in,
+    so that they follow the order of the enemies list
+    """
+    def __init__(self, cell_size: int = BROADPHASE_CELL) -> None:
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], set[Item]] = {}
+        # insertion number and covered cells of each entity
+        self.items: dict[Item, tuple[int, CellRange]] = {}
+        self.inserted = 0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item: Item) -> bool:
+        return item in self.items
+
+    def cell_range(self, box: Box) -> CellRange:
+        size = self.cell_size
+        return int(box[0] // size), int(box[1] // size), int(box[2] // size), int(box[3] // size)
+
+    def move(self, item: Item, box: Box) -> None:
+        """
+        Insert an entity or update its box, nothing is done if it still covers the same cells
+        """
+        cells = self.cell_range(box)
+        if item in self.items:
+            number, old = self.items[item]
+            if old == cells:
+                return
+            self.unlink(item, old)
+        else:
+            number = self.inserted
+            self.inserted += 1
+        self.items[item] = (number, cells)
+        x0, y0, x1, y1 = cells
+        for y in range(y0, y1 + 1):
+            for x in range(x0, x1 + 1):
+                self.cells.setdefault((x, y), set()).add(item)
+
+    def remove(self, item: Item) -> None:
+        if item in self.items:
+            self.unlink(item, self.items.pop(item)[1])
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self.items.clear()
+
+    def unlink(self, item: Item, cells: CellRange) -> None:
+        x0, y0, x1, y1 = cells
+        for y in range(y0, y1 + 1):
+            for x in range(x0, x1 + 1):
+                members = self.cells[(x, y)]
+                members.discard(item)
+                if not members:
+                    del self.cells[(x, y)]
+
+    def query(self, box: Box) -> list[Item]:
+        """
+        Entities sharing a cell with a box
+        """
+        x0, y0, x1, y1 = self.cell_range(box)
+        found: set[Item] = set()
+        for y in range(y0, y1 + 1):
+            for x in range(x0, x1 + 1):
+                found.update(self.cells.get((x, y), ()))
+        return sorted(found, key=lambda item: self.items[item][0])
+
+    def pairs(self) -> list[tuple[Item, Item]]:
+        """
+        Pairs of entities sharing at least one cell, each pair once and its first entity inserted first
+        """
+        items = self.items
+        found = []
+        for (x, y), members in self.cells.items():
+            if len(members) > 1:
+                for first, second in combinations(sorted(members, key=lambda item: items[item][0]), 2):
+                    a, b = items[first][1], items[second][1]
+                    # a pair is only reported by the first cell covered by both entities
+                    if x == max(a[0], b[0]) and y == max(a[1], b[1]):
+                        found.append((first, second))
+        return found
@@ -5,11 +5,18 @@
  '''
 
 from enum import Enum
+from typing import TYPE_CHECKING
+
 import pygame as pg
 
+from src.entities.broadphase import Box
 from src.world.level import Level
 from src.config import SCALING_FACTOR, GRAVITY, TILE_SIZE
 
+if TYPE_CHECKING:
+    from src.entities.broadphase import SpatialGrid
+    from src.entities.enemy import Enemy
+
 class CornerSide(Enum):
     TOP_LEFT = 0
     TOP_RIGHT = 1
@@ -87,47 +94,71 @@ def snap_position(
         velocity.y = 0
 
 
-def handle_collision(level: Level, position: pg.Vector2, image: pg.Surface, velocity: pg.Vector2) -> None:
+def corner_mask(box: tuple[float, float, float, float], left: float, top: float, size: float) -> int:
     """
-    Handle collision with the level
+    Corners of a box (x0, y0, x1, y1) inside a square, bounds included.
+    Bit i is set for CornerSide(i), nothing is allocated
     """
-    player = ObjectCollision(
-        position.x,
-        position.y,
-        int(image.get_width() * SCALING_FACTOR),
-        int(image.get_height() * SCALING_FACTOR)
-    ) # 100.0, 546.0 with size 32, 32
-
-    sides_colliding: set[CornerSide] = set()
-    objects_colliding = []
-
-    exit_tile = ObjectCollision(
-            level.exit_position[0] * TILE_SIZE,
-            level.exit_position[1] * TILE_SIZE,
-            TILE_SIZE,
-            TILE_SIZE
-        )
-    if player.is_colliding(exit_tile):
-        level.is_finished = True
-
-    for tile in level.tiles:
-        object_to_collide = ObjectCollision(
-            tile.rect.x,
-            tile.rect.y,
-            TILE_SIZE,
-            TILE_SIZE
-        )
-        local_colliding = player.is_colliding(object_to_collide)
-        if local_colliding != set():
-            sides_colliding.update(local_colliding)
-            objects_colliding.append(object_to_collide)
-    if sides_colliding != set():
-        snap_position(sides_colliding, objects_colliding, position, image, velocity)
+    x0, y0, x1, y1 = box
+    right, bottom = left + size, top + size
+    inside_x0 = left <= x0 <= right
+    inside_x1 = left <= x1 <= right
+    mask = 0
+    if top <= y0 <= bottom:
+        mask |= inside_x0 | inside_x1 << 1
+    if top <= y1 <= bottom:
+        mask |= inside_x0 << 2 | inside_x1 << 3
+    return mask
+
+
+def handle_collision(level: Level, position: pg.Vector2, image: pg.Surface, velocity: pg.Vector2) -> bool:
+    """
+    Handle collision with the level, return True if the exit is reached.
+    Only the cells the box overlaps are looked up in the tile grid, a corner on the border
+    of a cell touches the tile on the other side too
+    """
+    box = (position.x, position.y,
+           position.x + int(image.get_width() * SCALING_FACTOR), position.y + int(image.get_height() * SCALING_FACTOR))
+    reached_exit = corner_mask(box, level.exit_position[0] * TILE_SIZE, level.exit_position[1] * TILE_SIZE,
+                               TILE_SIZE) != 0
+
+    sides = 0
+    first = None
+    cells = level.cells
+    # cells in reading order, so that the first colliding tile is the first one of the tiles list
+    for row in range(int(box[1] // TILE_SIZE) - 1, int(box[3] // TILE_SIZE) + 1):
+        for column in range(int(box[0] // TILE_SIZE) - 1, int(box[2] // TILE_SIZE) + 1):
+            tile = cells.get((column, row))
+            if tile is None:
+                continue
+            mask = corner_mask(box, tile.rect.x, tile.rect.y, TILE_SIZE)
+            if mask:
+                sides |= mask
+                if first is None:
+                    first = tile
+    if first is not None:
+        snap_position({side for side in CornerSide if sides >> side.value & 1},
+                      [ObjectCollision(first.rect.x, first.rect.y, TILE_SIZE, TILE_SIZE)], position, image, velocity)
+    return reached_exit
+
+def entity_box(position: pg.Vector2, image: pg.Surface) -> Box:
+    """
+    Collision box (x0, y0, x1, y1) of an entity, bounds included
+    """
+    return (position.x, position.y,
+            position.x + int(image.get_width() * SCALING_FACTOR), position.y + int(image.get_height() * SCALING_FACTOR))
+
 
-def handle_entity_collision(position: pg.Vector2, image: pg.Surface, enemies: list['Enemy']) -> bool:
+def handle_entity_collision(position: pg.Vector2,
+                            image: pg.Surface,
+                            enemies: list['Enemy'],
+                            broadphase: 'SpatialGrid[Enemy] | None' = None) -> bool:
     """
-    Handle collision with the enemies
+    Handle collision with the enemies, return False if the player is dead.
+    With a broadphase holding the enemies, only the ones sharing a cell with the player are checked
     """
+    if broadphase is not None:
+        enemies = broadphase.query(entity_box(position, image))
     player = ObjectCollision(
         position.x,
         position.y,
@@ -153,3 +184,38 @@ def handle_entity_collision(position: pg.Vector2, image: pg.Surface, enemies: li
             else:
                 return False # player is dead
     return True
+
+
+def overlaps_wall(level: Level, box: Box) -> bool:
+    """
+    Whether a box (x0, y0, x1, y1) overlaps a wall tile, touching its border does not count
+    """
+    x0, y0, x1, y1 = box
+    for row in range(int(y0 // TILE_SIZE), int(y1 // TILE_SIZE) + 1):
+        for column in range(int(x0 // TILE_SIZE), int(x1 // TILE_SIZE) + 1):
+            left, top = column * TILE_SIZE, row * TILE_SIZE
+            if ((column, row) in level.cells and left < x1 and x0 < left + TILE_SIZE
+                    and top < y1 and y0 < top + TILE_SIZE):
+                return True
+    return False
+
+
+def separate_enemies(pairs: list[tuple['Enemy', 'Enemy']], level: Level) -> None:
+    """
+    Push apart the enemies of the candidate pairs that overlap, each one by half of the overlap along x.
+    An enemy is not pushed into a wall, it stays in place and only the other one moves
+    """
+    # this import is here to avoid circular imports
+    from .enemy import EnemyState # pylint: disable=import-outside-toplevel
+    for first, second in pairs:
+        if EnemyState.DYING in (first.state, second.state):
+            continue
+        a, b = entity_box(first.position, first.image), entity_box(second.position, second.image)
+        overlap_x = min(a[2], b[2]) - max(a[0], b[0])
+        if overlap_x <= 0 or min(a[3], b[3]) <= max(a[1], b[1]):
+            continue
+        push = overlap_x / 2 if a[0] + a[2] <= b[0] + b[2] else -overlap_x / 2
+        if not overlaps_wall(level, (a[0] - push, a[1], a[2] - push, a[3])):
+            first.position.x -= push
+        if not overlaps_wall(level, (b[0] + push, b[1], b[2] + push, b[3])):
+            second.position.x += push
@@ -7,7 +7,9 @@
 from enum import Enum
 import pygame as pg
 
+from src.assets import ASSETS, AssetRegistry
 from src.entities.entity import Entity
+from src.entities.physics import EntityBatch
 from src.entities.player import Player
 from src.config import TILE_SIZE
 
@@ -24,11 +26,14 @@ class Enemy(Entity):
     """
     Enemy class with state machine implementation.
     """
-    def __init__(self, position: tuple[int, int], player: Player) -> None:
-        super().__init__("assets/enemies.png", "assets/enemies.toml", position)
+    def __init__(self, position: tuple[int, int], player: Player, assets: AssetRegistry = ASSETS) -> None:
+        super().__init__("assets/enemies.png", "assets/enemies.toml", position, assets)
         self.state = EnemyState.IDLE
         self.target = player
         self.frame_remains = 1
+        # batch holding the kinematic state of the enemy, and its slot there
+        self.batch: EntityBatch | None = None
+        self.slot = -1
 
     def change_state(self, new_state: EnemyState):
         """
@@ -45,9 +50,16 @@ class Enemy(Entity):
         self.change_animation('die')
         self.frame_remains = 60 * 5 # 5 seconds
 
-    def update(self, dt: float, level) -> None:
+    def update(self, dt: float, run) -> None:
         """
-        Update the enemy's behavior based on its current state.
+        Update the enemy's behavior based on its current state, then move it.
+        """
+        self.think(run)
+        self.step(dt, run)
+
+    def think(self, run) -> None:
+        """
+        Run the state machine, it can be run less often than step.
         """
         def target_in_range(range_distance: int) -> bool:
             """
@@ -62,8 +74,11 @@ class Enemy(Entity):
                 self.change_state(EnemyState.WALKING)
 
         def update_walking():
-            direction = self.target.position - self.position
-            if direction.x > 0:
+            # follow the level flow field, it goes around the walls
+            step_x, _ = run.flow_field.step_at(*self.get_tile())
+            if step_x == 0:
+                step_x = (self.target.position - self.position).x
+            if step_x > 0:
                 self.acceleration.x = 0.015
             else:
                 self.acceleration.x = -0.02
@@ -83,9 +98,18 @@ class Enemy(Entity):
             update_walking()
         elif self.state == EnemyState.ATTACKING:
             update_attacking()
-        elif self.state == EnemyState.DYING:
+
+    def step(self, dt: float, run) -> None:
+        """
+        Animate and move the enemy, or count down its death. Run every frame.
+        """
+        if self.state == EnemyState.DYING:
             self.frame_remains -= 1
 
         self.animate(dt)
         if not self.state == EnemyState.DYING:
-            self.move_and_slide(level)
+            if self.batch is None:
+                self.move_and_slide(run.level)
+            else:
+                # moved with the other enemies of the batch at the end of the tick
+                self.batch.moving[self.slot] = True
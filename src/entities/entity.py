@@ -5,64 +5,49 @@
  '''
 
 import pygame as pg
-import toml
 
-from src.config import SCALING_FACTOR, GRAVITY
+from src.assets import ASSETS, AssetRegistry, Animations
+from src.config import SCALING_FACTOR, GRAVITY, TILE_SIZE
 from src.world.level import Level
 from src.entities.collisions import handle_collision
 
 
 class Entity(pg.sprite.Sprite):
     """
-    Entity class to represent a player, enemy, or any element having an animated sprite and collisions
+    Entity class to represent a player, enemy, or any element having an animated sprite and collisions.
+    The sheet and the frames come from the asset registry, spawning an entity does not load anything again
     """
-    def __init__(self, path_image: str, toml_path: str, position: tuple[int, int]) -> None:
+    def __init__(self, path_image: str, toml_path: str, position: tuple[int, int],
+                 assets: AssetRegistry = ASSETS) -> None:
         super().__init__()
 
-        self.sprite_sheet = pg.image.load(path_image).convert_alpha()
-        self.animations: dict = {}
+        # the sheet and the frames are shared by every entity using them
+        self.sprite_sheet = assets.sheet(path_image)
+        self.animations: Animations = assets.animations(path_image, toml_path)
+        self.atlas = assets.atlas(path_image, toml_path)
         self.current_animation = 'idle'
         self.animation_speed = 0.1
         self.animation_time = 0.0
         self.frame_index = 0
-        self.load_animations(toml_path)
 
         self.position = pg.Vector2(*position)
         self.velocity = pg.Vector2(0, 0)
         self.acceleration = pg.Vector2(0, 0)
+        # position before the last step, drawings are interpolated from it
+        self.previous_position = pg.Vector2(*position)
 
         self.image: pg.Surface = self.animations[self.current_animation][self.frame_index]
 
-    def get_frame(self, sprite_sheet: pg.Surface, position: tuple[int, int], size: tuple[int, int]) -> pg.Surface:
-        frame = pg.Surface(size, pg.SRCALPHA)
-        frame.blit(sprite_sheet, (0, 0), (*position, *size))
-        return frame
-
-    def load_animations(self, toml_path: str):
+    def get_tile(self) -> tuple[int, int]:
         """
-        Load animations from a TOML file
+        Get the tile under the center of the sprite
         """
-        config = toml.load(toml_path)
-        frame_width = config['animations']['frame_width']
-        frame_height = config['animations']['frame_height']
-
-        for animation_name, animation_data in config['animations'].items():
-            if animation_name in {'frame_width', 'frame_height'}:
-                continue
-
-            _ = animation_data['frame_count']
-            y_position = animation_data['y_position']
-            x_positions = animation_data['x_positions']
+        return (int(self.position.x + self.image.get_width() * SCALING_FACTOR / 2) // TILE_SIZE,
+                int(self.position.y + self.image.get_height() * SCALING_FACTOR / 2) // TILE_SIZE)
 
-            frames = []
-            for x in x_positions:
-                frame = self.get_frame(self.sprite_sheet, (x, y_position), (frame_width, frame_height))
-                frames.append(frame)
-            self.animations[animation_name] = frames
-
-    def move_and_slide(self, level: Level) -> None:
+    def move_and_slide(self, level: Level) -> bool:
         """
-        Move the player character and apply gravity
+        Move the player character and apply gravity, return True if the exit is reached
         """
         # Update velocity with acceleration
         self.velocity += self.acceleration
@@ -82,7 +67,7 @@ class Entity(pg.sprite.Sprite):
             self.change_animation('idle')
             self.velocity.x = 0
 
-        handle_collision(level, self.position, self.image, self.velocity)
+        return handle_collision(level, self.position, self.image, self.velocity)
 
     def animate(self, dt: float):
         """
@@ -108,12 +93,30 @@ class Entity(pg.sprite.Sprite):
         self.frame_index = 0
 
 
-    def draw(self, screen: pg.Surface):
-        if self.velocity.x < 0:
-            self.image = pg.transform.flip(self.image, True, False)
-        else:
-            self.image = pg.transform.flip(self.image, False, False)
-        screen.blit(pg.transform.scale(self.image,
-                                          (self.image.get_width() * SCALING_FACTOR,
-                                           self.image.get_height() * SCALING_FACTOR)),
-                   (self.position.x, self.position.y))
+    def save_position(self) -> None:
+        """
+        Keep the position before a step, or after a teleport so that it is not interpolated
+        """
+        self.previous_position = pg.Vector2(self.position.x, self.position.y)
+
+    def drawn_position(self, alpha: float = 1.0) -> pg.Vector2:
+        """
+        Position between the one before the last step and the current one, alpha is the fraction of a step
+        """
+        if alpha >= 1.0:
+            return pg.Vector2(self.position.x, self.position.y)
+        return self.previous_position + (pg.Vector2(self.position.x, self.position.y) - self.previous_position) * alpha
+
+    def get_rect(self, alpha: float = 1.0) -> pg.Rect:
+        """
+        Rectangle covered by the sprite in the level, where it is drawn for an alpha below 1
+        """
+        position = self.drawn_position(alpha)
+        return pg.Rect(int(position.x), int(position.y),
+                       int(self.image.get_width() * SCALING_FACTOR), int(self.image.get_height() * SCALING_FACTOR))
+
+    def draw(self, screen: pg.Surface, offset: tuple[int, int] = (0, 0), alpha: float = 1.0):
+        # the frame is already scaled and flipped in the atlas
+        position = self.drawn_position(alpha)
+        screen.blit(self.atlas.surface, (position.x - offset[0], position.y - offset[1]),
+                    self.atlas.area(self.image, self.velocity.x < 0))
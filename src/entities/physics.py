@@ -0,0 +1,279 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 11:44:12
+ # @ Description:
+    Batched physics for many entities. Positions, velocities and accelerations are stored in
+    NumPy arrays, one row per entity, and a tick moves every entity with a few array passes:
+    the same integration, idle detection and tile collision as Entity.move_and_slide.
+ '''
+
+from typing import Any, Iterator
+
+import numpy as np
+import pygame as pg
+
+from src.config import GRAVITY, SCALING_FACTOR, TILE_SIZE
+from src.world.level import Level
+
+
+class ArrayRowView:
+    """
+    Row of a (n, 2) array used like a pg.Vector2, writes go to the array
+    """
+    __slots__ = ('array', 'row')
+
+    def __init__(self, array: np.ndarray, row: int) -> None:
+        self.array = array
+        self.row = row
+
+    @property
+    def x(self) -> float:
+        return float(self.array[self.row, 0])
+
+    @x.setter
+    def x(self, value: float) -> None:
+        self.array[self.row, 0] = value
+
+    @property
+    def y(self) -> float:
+        return float(self.array[self.row, 1])
+
+    @y.setter
+    def y(self, value: float) -> None:
+        self.array[self.row, 1] = value
+
+    def __len__(self) -> int:
+        return 2
+
+    def __getitem__(self, index: int) -> float:
+        return float(self.array[self.row, index])
+
+    def __setitem__(self, index: int, value: float) -> None:
+        self.array[self.row, index] = value
+
+    def __iter__(self) -> Iterator[float]:
+        return iter((self.x, self.y))
+
+    def __add__(self, other: Any) -> pg.Vector2:
+        return pg.Vector2(self.x, self.y) + other
+
+    def __sub__(self, other: Any) -> pg.Vector2:
+        return pg.Vector2(self.x, self.y) - other
+
+    def __rsub__(self, other: Any) -> pg.Vector2:
+        return other - pg.Vector2(self.x, self.y)
+
+    def __iadd__(self, other: Any) -> 'ArrayRowView':
+        self.array[self.row] += tuple(other)
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        return pg.Vector2(self.x, self.y) == other
+
+    def __repr__(self) -> str:
+        return f'ArrayRowView({self.x}, {self.y})'
+
+    def length(self) -> float:
+        return pg.Vector2(self.x, self.y).length()
+
+
+class EntityBatch:
+    """
+    Kinematic state of many entities in arrays. Slots of removed entities are reused through a free list,
+    the entities keep their API: their position, velocity and acceleration become views of their row.
+    The frames of an entity must all have the size of its first one
+    """
+    def __init__(self, capacity: int = 64) -> None:
+        self.position = np.zeros((capacity, 2))
+        self.velocity = np.zeros((capacity, 2))
+        self.acceleration = np.zeros((capacity, 2))
+        # scaled size of the sprite, and the same size truncated like the collision box
+        self.size = np.zeros((capacity, 2))
+        self.box = np.zeros((capacity, 2))
+        self.active = np.zeros(capacity, dtype=bool)
+        # set by the entities that move this tick, cleared by step
+        self.moving = np.zeros(capacity, dtype=bool)
+        self.entities: list[Any] = [None] * capacity
+        self.free = list(range(capacity - 1, -1, -1))
+
+    def __len__(self) -> int:
+        return int(self.active.sum())
+
+    def grow(self) -> None:
+        """
+        Double the capacity of the arrays, the views of the entities are moved to the new arrays
+        """
+        capacity = len(self.active)
+        for name in ('position', 'velocity', 'acceleration', 'size', 'box', 'active', 'moving'):
+            array = getattr(self, name)
+            setattr(self, name, np.concatenate([array, np.zeros_like(array)]))
+        self.entities += [None] * capacity
+        self.free = list(range(2 * capacity - 1, capacity - 1, -1)) + self.free
+        for entity in self.entities:
+            if entity is not None:
+                entity.position.array = self.position
+                entity.velocity.array = self.velocity
+                entity.acceleration.array = self.acceleration
+
+    def add(self, entity: Any) -> int:
+        """
+        Move the state of an entity to a free slot, return the slot
+        """
+        if not self.free:
+            self.grow()
+        slot = self.free.pop()
+        self.position[slot] = tuple(entity.position)
+        self.velocity[slot] = tuple(entity.velocity)
+        self.acceleration[slot] = tuple(entity.acceleration)
+        width, height = entity.image.get_width(), entity.image.get_height()
+        self.size[slot] = (width * SCALING_FACTOR, height * SCALING_FACTOR)
+        self.box[slot] = (int(width * SCALING_FACTOR), int(height * SCALING_FACTOR))
+        self.active[slot] = True
+        self.moving[slot] = False
+        self.entities[slot] = entity
+        entity.position = ArrayRowView(self.position, slot)
+        entity.velocity = ArrayRowView(self.velocity, slot)
+        entity.acceleration = ArrayRowView(self.acceleration, slot)
+        entity.batch, entity.slot = self, slot
+        return slot
+
+    def remove(self, entity: Any) -> None:
+        """
+        Give an entity its own vectors back and free its slot
+        """
+        slot = entity.slot
+        entity.position = pg.Vector2(*self.position[slot])
+        entity.velocity = pg.Vector2(*self.velocity[slot])
+        entity.acceleration = pg.Vector2(*self.acceleration[slot])
+        entity.batch, entity.slot = None, -1
+        self.active[slot] = self.moving[slot] = False
+        self.entities[slot] = None
+        self.free.append(slot)
+
+    def step(self, level: Level) -> None:
+        """
+        Move the entities marked as moving, like Entity.move_and_slide does for each of them
+        """
+        slots = np.flatnonzero(self.active & self.moving)
+        self.moving[:] = False
+        if len(slots) == 0:
+            return
+        velocity = self.velocity[slots] + self.acceleration[slots]
+        velocity[:, 0] *= 0.9
+        position = self.position[slots] + velocity
+        self.acceleration[slots, 1] = 0
+        velocity[:, 1] += GRAVITY
+
+        idle = (velocity[:, 0] < 0.01) & (velocity[:, 0] > -0.01)
+        velocity[idle, 0] = 0
+        for slot in slots[idle].tolist():
+            self.entities[slot].change_animation('idle')
+
+        collide(wall_grid(level), position, velocity, self.size[slots], self.box[slots])
+        self.position[slots] = position
+        self.velocity[slots] = velocity
+
+
+def wall_grid(level: Level) -> np.ndarray:
+    """
+    Walls of a level as a boolean grid, built from its tiles for a level made without the compiler
+    """
+    if level.walls is not None:
+        return level.walls
+    walls = np.zeros((max((y for _, y in level.cells), default=0) + 1,
+                      max((x for x, _ in level.cells), default=0) + 1), dtype=bool)
+    for x, y in level.cells:
+        walls[y, x] = True
+    return walls
+
+
+def collide(walls: np.ndarray,
+            position: np.ndarray,
+            velocity: np.ndarray,
+            size: np.ndarray,
+            box: np.ndarray) -> None:
+    """
+    Tile collision of collisions.handle_collision for all the rows at once, position and velocity are updated.
+    Each box is tested against the wall cells it overlaps and the ring of cells before them,
+    the first colliding cell in reading order is the one snapped to
+    """
+    row, column, in_range = candidate_cells(position, box)
+    masks = corner_masks(position, box, row, column, wall_cells(walls, row, column, in_range))
+    snap(position, velocity, size, first_hit(masks, row, column))
+
+
+def candidate_cells(position: np.ndarray, box: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Cells each box may collide with, in reading order: their rows of shape (n, rows, 1), their columns
+    of shape (n, 1, columns), and which of them are in the range of the box since boxes differ in size
+    """
+    first_row = (position[:, 1] // TILE_SIZE).astype(np.int64) - 1
+    first_column = (position[:, 0] // TILE_SIZE).astype(np.int64) - 1
+    last_row = ((position[:, 1] + box[:, 1]) // TILE_SIZE).astype(np.int64)
+    last_column = ((position[:, 0] + box[:, 0]) // TILE_SIZE).astype(np.int64)
+    rows = int((last_row - first_row).max()) + 1
+    columns = int((last_column - first_column).max()) + 1
+
+    row = first_row[:, None, None] + np.arange(rows)[None, :, None]
+    column = first_column[:, None, None] + np.arange(columns)[None, None, :]
+    return row, column, (row <= last_row[:, None, None]) & (column <= last_column[:, None, None])
+
+
+def wall_cells(walls: np.ndarray, row: np.ndarray, column: np.ndarray, in_range: np.ndarray) -> np.ndarray:
+    """
+    Candidate cells holding a wall, the ones outside of the level never do
+    """
+    height, width = walls.shape
+    inside = in_range & (row >= 0) & (row < height) & (column >= 0) & (column < width)
+    wall = np.zeros(inside.shape, dtype=bool)
+    wall[inside] = walls[np.broadcast_to(row, inside.shape)[inside], np.broadcast_to(column, inside.shape)[inside]]
+    return wall
+
+
+def corner_masks(position: np.ndarray, box: np.ndarray, row: np.ndarray, column: np.ndarray,
+                 wall: np.ndarray) -> np.ndarray:
+    """
+    Corners of each box inside each wall cell, borders included, with the bits of collisions.corner_mask
+    """
+    x0, y0 = position[:, 0, None, None], position[:, 1, None, None]
+    x1, y1 = x0 + box[:, 0, None, None], y0 + box[:, 1, None, None]
+    left, top = column * TILE_SIZE, row * TILE_SIZE
+    in_x0 = (left <= x0) & (x0 <= left + TILE_SIZE)
+    in_x1 = (left <= x1) & (x1 <= left + TILE_SIZE)
+    in_y0 = (top <= y0) & (y0 <= top + TILE_SIZE)
+    in_y1 = (top <= y1) & (y1 <= top + TILE_SIZE)
+    # corner bits in CornerSide order: top left, top right, bottom left, bottom right
+    return wall * ((in_y0 & in_x0) | (in_y0 & in_x1).astype(np.int64) << 1
+                   | (in_y1 & in_x0).astype(np.int64) << 2 | (in_y1 & in_x1).astype(np.int64) << 3)
+
+
+def first_hit(masks: np.ndarray, row: np.ndarray, column: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Corners colliding with any cell for each box, and the top left corner of the first colliding cell
+    """
+    count = len(masks)
+    flat = masks.reshape(count, -1)
+    first = np.argmax(flat != 0, axis=1)[:, None]
+    first_x = np.take_along_axis(np.broadcast_to(column, masks.shape).reshape(count, -1), first, axis=1)[:, 0]
+    first_y = np.take_along_axis(np.broadcast_to(row, masks.shape).reshape(count, -1), first, axis=1)[:, 0]
+    return np.bitwise_or.reduce(flat, axis=1), first_x * TILE_SIZE, first_y * TILE_SIZE
+
+
+def snap(position: np.ndarray, velocity: np.ndarray, size: np.ndarray,
+         hit: tuple[np.ndarray, np.ndarray, np.ndarray]) -> None:
+    """
+    Move each box out of the cell it hit first and stop it, in the same order of cases as
+    collisions.snap_position
+    """
+    sides, first_x, first_y = hit
+    left_side = sides & 0b0101 == 0b0101
+    right_side = ~left_side & (sides & 0b1010 == 0b1010)
+    top_side = ~left_side & ~right_side & (sides & 0b0011 != 0)
+    bottom_side = ~left_side & ~right_side & ~top_side & (sides & 0b1100 != 0)
+    position[left_side, 0] = first_x[left_side] + TILE_SIZE + 1
+    position[right_side, 0] = first_x[right_side] - size[right_side, 0] - 1
+    velocity[left_side | right_side, 0] = 0
+    position[top_side, 1] = first_y[top_side] + TILE_SIZE
+    velocity[top_side, 1] = GRAVITY
+    position[bottom_side, 1] = first_y[bottom_side] - size[bottom_side, 1]
+    velocity[bottom_side, 1] = 0
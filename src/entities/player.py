@@ -6,14 +6,15 @@
 
 import pygame as pg
 
+from src.assets import ASSETS, AssetRegistry
 from src.entities.entity import Entity
 
 class Player(Entity):
     """
     Player class to represent the player character
     """
-    def __init__(self, position: tuple[int, int]) -> None:
-        super().__init__("assets/mario_bros.png", "assets/mario_bros.toml", position)
+    def __init__(self, position: tuple[int, int], assets: AssetRegistry = ASSETS) -> None:
+        super().__init__("assets/mario_bros.png", "assets/mario_bros.toml", position, assets)
         self.alive = True
 
     def handle_event(self, event: pg.event.Event):
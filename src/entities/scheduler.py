@@ -0,0 +1,129 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 11:48:31
+ # @ Description:
+    AI scheduler. The state machine of an enemy runs at a rate depending on its distance to the
+    player and on its state, and the AI of a frame stops when its time budget is spent: the
+    enemies left over are updated first at the next frame. Enemies still move every frame.
+ '''
+
+import time
+from collections import deque
+from typing import Callable
+
+from src.config import AI_BUDGET, AI_IDLE_FACTOR, AI_LOD_DISTANCES, AI_LOD_INTERVALS
+from src.entities.enemy import Enemy, EnemyState
+
+# frames over which the tick rates are measured
+RATE_WINDOW = 60
+
+
+class AIScheduler:
+    """
+    Enemies waiting for their next AI update, in buckets by frame. The tick rate of each level of detail
+    is measured as the AI updates per enemy per frame
+    """
+    def __init__(self,
+                 budget: float = AI_BUDGET,
+                 distances: tuple[int, ...] = AI_LOD_DISTANCES,
+                 intervals: tuple[int, ...] = AI_LOD_INTERVALS,
+                 clock: Callable[[], float] = time.perf_counter) -> None:
+        self.budget = budget
+        self.distances = distances
+        self.intervals = intervals
+        self.clock = clock
+        self.frame = 0
+        self.buckets: dict[int, list[Enemy]] = {}
+        # enemies due but not updated yet because the budget was spent
+        self.pending: deque[Enemy] = deque()
+        # level of detail of each enemy at its last update, and the number of enemies of each level
+        self.levels: dict[Enemy, int] = {}
+        self.counts = [0] * len(intervals)
+        self.history: deque[tuple[list[int], list[int]]] = deque(maxlen=RATE_WINDOW)
+        self.deferred = 0
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def add(self, enemy: Enemy) -> None:
+        """
+        Schedule a new enemy, it is updated at the current frame
+        """
+        if enemy not in self.levels:
+            self.levels[enemy] = 0
+            self.counts[0] += 1
+            self.buckets.setdefault(self.frame, []).append(enemy)
+
+    def remove(self, enemy: Enemy) -> None:
+        # its scheduled updates are skipped
+        if enemy in self.levels:
+            self.counts[self.levels.pop(enemy)] -= 1
+
+    def clear(self) -> None:
+        self.buckets.clear()
+        self.pending.clear()
+        self.levels.clear()
+        self.counts = [0] * len(self.intervals)
+
+    def level_of_detail(self, enemy: Enemy) -> int:
+        """
+        Index of the interval of an enemy, by its distance to the player
+        """
+        distance = (enemy.target.position - enemy.position).length()
+        for level, limit in enumerate(self.distances):
+            if distance < limit:
+                return level
+        return len(self.distances)
+
+    def interval(self, enemy: Enemy, level: int) -> int:
+        """
+        Frames until the next update of an enemy, dying enemies are not updated again
+        """
+        if enemy.state == EnemyState.DYING:
+            return 0
+        if enemy.state == EnemyState.IDLE and level > 0:
+            return self.intervals[level] * AI_IDLE_FACTOR
+        return self.intervals[level]
+
+    def update(self, run) -> int:
+        """
+        Run the AI of the enemies due at this frame until the budget is spent, return the number of updates.
+        At least one enemy is updated per frame so that the pending ones always get their turn
+        """
+        self.pending.extend(self.buckets.pop(self.frame, ()))
+        counts = list(self.counts)
+        updates = [0] * len(self.intervals)
+
+        deadline = self.clock() + self.budget
+        done = 0
+        while self.pending and (done == 0 or self.clock() < deadline):
+            enemy = self.pending.popleft()
+            if enemy not in self.levels:
+                continue
+            enemy.think(run)
+            done += 1
+            updates[self.levels[enemy]] += 1
+            self.remove(enemy)
+            level = self.level_of_detail(enemy)
+            interval = self.interval(enemy, level)
+            if interval:
+                self.levels[enemy] = level
+                self.counts[level] += 1
+                self.buckets.setdefault(self.frame + interval, []).append(enemy)
+
+        self.deferred = len(self.pending)
+        self.history.append((counts, updates))
+        self.frame += 1
+        return done
+
+    @property
+    def tick_rates(self) -> list[float]:
+        """
+        AI updates per enemy per frame of each level of detail, over the last frames
+        """
+        rates = []
+        for level in range(len(self.intervals)):
+            enemy_frames = sum(counts[level] for counts, _ in self.history)
+            updates = sum(done[level] for _, done in self.history)
+            rates.append(updates / enemy_frames if enemy_frames else 0.0)
+        return rates
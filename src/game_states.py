@@ -26,18 +26,25 @@ class State:
     """
     def __init__(self):
         self.next_state: MainState | None = None
+        # the first frame of a state redraws the whole screen
+        self.full_redraw = True
+        self.dirty: list[pygame.Rect] = []
 
-    def update(self) -> None:
+    def update(self, dt: float) -> None:
         """
-        Update the state.
+        Update the state by one step of the simulation.
+
+        Args:
+            dt (float): The duration of a step, in seconds.
         """
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0) -> None:
         """
         Draw the state to the screen.
 
         Args:
             screen (pygame.Surface): The surface to draw the state on.
+            alpha (float): The time since the last step, as a fraction of a step, to interpolate the drawing.
         """
 
     def handle_event(self, event: pygame.event.Event) -> None:
@@ -47,3 +54,26 @@ class State:
         Args:
             event (pygame.event.Event): The event to handle.
         """
+
+    def mark_dirty(self, *rects: pygame.Rect) -> None:
+        """
+        Report rectangles of the screen changed by the current draw.
+
+        Args:
+            *rects (pygame.Rect): The changed rectangles, in screen coordinates.
+        """
+        self.dirty.extend(rects)
+
+    def dirty_rects(self) -> list[pygame.Rect] | None:
+        """
+        Rectangles of the screen changed since the last call, None if the whole screen must be updated.
+
+        Returns:
+            list[pygame.Rect] | None: The rectangles to pass to pygame.display.update.
+        """
+        if self.full_redraw:
+            self.full_redraw = False
+            self.dirty = []
+            return None
+        rects, self.dirty = self.dirty, []
+        return rects
@@ -5,7 +5,15 @@
  '''
 
 import pygame
-from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, WINDOW_TITLE
+from src.config import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    WINDOW_TITLE,
+    DIRTY_RECTS,
+    SIMULATION_RATE,
+    FRAME_RATE,
+    MAX_STEPS_PER_FRAME
+)
 from src.ui.menu import MainMenu, GameMenu, Credits, Instructions, Death, Win
 from src.game_states import MainState, State
 
@@ -18,13 +26,24 @@ if __name__ == '__main__':
     level = 0
     actualState: State = MainMenu()
 
+    # the game moves by fixed steps, as many as the time elapsed holds, whatever the frame rate
+    clock = pygame.time.Clock()
+    STEP = 1 / SIMULATION_RATE
+    accumulator = 0.0 # pylint: disable=invalid-name
+
     running: bool = True
     while running:
+        accumulator = min(accumulator + clock.tick(FRAME_RATE) / 1000, MAX_STEPS_PER_FRAME * STEP)
         for event in pygame.event.get():
             actualState.handle_event(event)
 
-        actualState.update()
-        actualState.draw(screen)
+        while accumulator >= STEP and actualState.next_state is None:
+            actualState.update(STEP)
+            accumulator -= STEP
+        # what is left of the elapsed time places the drawing between the last two steps
+        actualState.draw(screen, min(accumulator / STEP, 1.0))
+        # rects of the state that drew this frame, a new state starts with a full redraw
+        rects = actualState.dirty_rects() if DIRTY_RECTS else None # pylint: disable=invalid-name
         if hasattr(actualState, 'next_level'):
             # if die, restart the current level
             level = actualState.next_level
@@ -45,6 +64,9 @@ if __name__ == '__main__':
             actualState = Win()
             level = 0
 
-        pygame.display.flip()
+        if rects is None:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
 
     pygame.quit()
@@ -16,13 +16,25 @@ from src.config import (
     COLOR_WHITE,
     COLOR_RED,
     TILE_SIZE,
-    COLOR_GREEN
+    COLOR_GREEN,
+    SHOW_PREFETCH_STATUS,
+    FONT_DEBUG_SIZE,
+    BATCH_PHYSICS,
+    ENEMY_SEPARATION
 )
 from src.entities.enemy import Enemy, EnemyState
+from src.entities.physics import EntityBatch
+from src.entities.scheduler import AIScheduler
 from src.game_states import MainState, State
 from src.entities.player import Player
 from src.world.level import LevelHandler
-from src.entities.collisions import handle_entity_collision
+from src.world.prefetch import LevelPrefetcher
+from src.entities.broadphase import SpatialGrid
+from src.entities.collisions import entity_box, handle_entity_collision, separate_enemies
+from src.core import PlannerService
+
+PLANNER = PlannerService()
+PREFETCHER = LevelPrefetcher()
 
 
 class Button: # pylint: disable=too-many-arguments, too-many-positional-arguments
@@ -42,6 +54,7 @@ class Button: # pylint: disable=too-many-arguments, too-many-positional-argument
         self.image: pg.Surface = self.font.render(self.text, True, self.text_color)
         self.rect: pg.Rect = self.image.get_rect(center=position)
         self.hovered: bool = False
+        self.changed: bool = False
 
     def draw(self, screen: pg.Surface) -> None:
         if self.hovered:
@@ -52,42 +65,179 @@ class Button: # pylint: disable=too-many-arguments, too-many-positional-argument
 
     def handle_event(self, event: pg.event.Event) -> None:
         if event.type == pg.MOUSEMOTION:
-            self.hovered = self.rect.collidepoint(event.pos)
+            hovered = self.rect.collidepoint(event.pos)
+            self.changed = self.changed or hovered != self.hovered
+            self.hovered = hovered
+
+
+def changed_buttons(*buttons: Button) -> list[pg.Rect]:
+    """
+    Rectangles of the buttons whose hover changed since the last call
+    """
+    rects = [button.rect for button in buttons if button.changed]
+    for button in buttons:
+        button.changed = False
+    return rects
 
 
-class GameMenu(State):
+class GameMenu(State): # pylint: disable=too-many-instance-attributes
     """
-    Game menu class to represent the game menu
+    Game menu class to represent the game menu.
+    The planner runs the AI queries on its workers and the prefetcher prepares the next level while
+    the current one is played, both are kept from one game to the next. Levels come from the prefetcher store
     """
-    def __init__(self, level_number: int) -> None:
+    def __init__(self, level_number: int, planner: PlannerService = PLANNER,
+                 prefetcher: LevelPrefetcher = PREFETCHER) -> None:
         super().__init__()
         self.next_state: MainState | None = None
-        self.level_handler = LevelHandler(level_number)
+        self.planner = planner
+        self.prefetcher = prefetcher
+        self.level_handler = LevelHandler(level_number, prefetcher.levels)
         x, y = self.level_handler.current_level.start_position
         self.player: Player = Player((x * TILE_SIZE, y * TILE_SIZE))
         self.enemies: list[Enemy] = [Enemy(pos, self.player) for pos in self.level_handler.current_level.enemies]
+        self.batch = EntityBatch() if BATCH_PHYSICS else None
+        self.broadphase: SpatialGrid[Enemy] = SpatialGrid()
+        self.ai = AIScheduler()
+        self.set_enemies(self.enemies)
+        self.level_handler.camera.follow(self.player.get_rect().center)
         self.next_level = level_number
+        self.transition_end: float | None = None
+        self.debug_font = pg.font.Font(FONT_NAME, FONT_DEBUG_SIZE) if SHOW_PREFETCH_STATUS else None
+        # screen rects of the entities at the last draw, and what the whole screen was drawn for
+        self.drawn_rects: list[pg.Rect] = []
+        self.drawn_view: tuple[tuple[int, int], bool, int] | None = None
+        # screen rect of the debug status at the last draw, a shorter status must clear the end of the longer one
+        self.status_rects: list[pg.Rect] = []
+        self.prefetch_next_level()
+
+    def set_enemies(self, enemies: list[Enemy]) -> None:
+        """
+        Replace the enemies, in batch mode their state is moved to the batch
+        """
+        if self.batch is not None:
+            for enemy in self.enemies:
+                if enemy.batch is self.batch:
+                    self.batch.remove(enemy)
+            for enemy in enemies:
+                self.batch.add(enemy)
+        self.broadphase.clear()
+        self.ai.clear()
+        for enemy in enemies:
+            self.ai.add(enemy)
+        self.enemies = enemies
+
+    def prefetch_next_level(self) -> None:
+        """
+        Prepare the next level and its enemies in the background
+        """
+        player = self.player
+        self.prefetcher.prefetch(self.level_handler.level_number + 1,
+                                lambda level: [Enemy(pos, player) for pos in level.enemies])
+
+    def update_transition(self) -> None:
+        """
+        Show the path of the finished level for a moment, then swap in the prepared next level.
+        The game keeps running frames while it waits
+        """
+        last_level = self.level_handler.level_number == len(self.level_handler.levels) - 1
+        if self.transition_end is None:
+            self.transition_end = time.perf_counter() + (0.5 if last_level else 2)
+        if time.perf_counter() < self.transition_end:
+            return
+
+        if last_level:
+            self.level_handler.next_level()
+            self.next_state = MainState.WIN
+            return
+
+        prepared = self.prefetcher.take(self.level_handler.level_number + 1)
+        if prepared is None:
+            if self.prefetcher.number != self.level_handler.level_number + 1:
+                self.prefetch_next_level()
+            return
 
-    def update(self) -> None:
-        self.player.animate(0.1)
-        self.player.move_and_slide(self.level_handler.current_level)
+        self.level_handler.next_level()
+        x, y = self.level_handler.current_level.start_position
+        self.player.position = pg.Vector2(x * TILE_SIZE, y * TILE_SIZE)
+        self.player.save_position()
+        self.level_handler.camera.follow(self.player.get_rect().center)
+        self.set_enemies(prepared.extras)
+        self.transition_end = None
+        self.prefetch_next_level()
+
+    def update(self, dt: float) -> None:
+        self.prefetcher.poll()
+        for entity in [self.player, *self.enemies]:
+            entity.save_position()
+        if self.level_handler.run.is_finished:
+            self.update_transition()
+            return
+
+        self.player.animate(dt)
+        if self.player.move_and_slide(self.level_handler.current_level):
+            self.level_handler.run.is_finished = True
+        self.planner.poll()
+        self.level_handler.run.flow_field.retarget_async(self.player.get_tile(), self.planner)
+        # the state machines run at the rate of their level of detail, the moves every step
+        self.ai.update(self.level_handler.run)
         for enemy in self.enemies:
-            enemy.update(0.1, self.level_handler.current_level)
+            enemy.step(dt, self.level_handler.run)
             if enemy.state == EnemyState.DYING and enemy.frame_remains == 0:
                 self.enemies.remove(enemy)
+                self.broadphase.remove(enemy)
+                self.ai.remove(enemy)
+                if enemy.batch is not None:
+                    enemy.batch.remove(enemy)
+        if self.batch is not None:
+            self.batch.step(self.level_handler.current_level)
 
-        self.player.alive = handle_entity_collision(self.player.position, self.player.image, self.enemies)
+        for enemy in self.enemies:
+            self.broadphase.move(enemy, entity_box(enemy.position, enemy.image))
+        self.player.alive = handle_entity_collision(self.player.position, self.player.image, self.enemies,
+                                                    self.broadphase)
+        if ENEMY_SEPARATION:
+            separate_enemies(self.broadphase.pairs(), self.level_handler.current_level)
+        self.level_handler.camera.follow(self.player.get_rect().center)
 
         if not self.player.alive:
             self.next_level = self.level_handler.level_number
             self.next_state = MainState.DEATH
 
-    def draw(self, screen: pg.Surface) -> None:
+    def draw(self, screen: pg.Surface, alpha: float = 1.0) -> None:
         screen.fill(COLOR_BLACK)
-        self.player.draw(screen)
+        camera = self.level_handler.camera
+        # entities are drawn between their last two steps, and the camera follows the drawn player
+        camera.follow(self.player.get_rect(alpha).center)
+        self.player.draw(screen, camera.offset, alpha)
+        drawn = [self.player.get_rect(alpha)]
         for enemy in self.enemies:
-            enemy.draw(screen)
+            # enemies out of the active chunks are not drawn
+            if camera.is_active(enemy.get_rect()):
+                enemy.draw(screen, camera.offset, alpha)
+                drawn.append(enemy.get_rect(alpha))
         self.level_handler.draw(screen)
+        if self.debug_font is not None:
+            rates = ' '.join(f'{rate:.2f}' for rate in self.ai.tick_rates)
+            status = f'prefetch: {self.prefetcher.status}  ai: {rates} ({self.ai.deferred} deferred)'
+            rect = screen.blit(self.debug_font.render(status, True, COLOR_WHITE), (10, 10))
+            self.mark_dirty(*self.status_rects, rect)
+            self.status_rects = [rect]
+        self.mark_drawn(drawn)
+
+    def mark_drawn(self, drawn: list[pg.Rect]) -> None:
+        """
+        Report the old and new bounds of the entities. The whole screen changes when the camera moves,
+        when the path of a finished level appears or when the level changes
+        """
+        offset = self.level_handler.camera.offset
+        view = (offset, self.level_handler.run.is_finished, self.level_handler.level_number)
+        if view != self.drawn_view:
+            self.drawn_view = view
+            self.full_redraw = True
+        rects = [rect.move(-offset[0], -offset[1]).inflate(2, 2) for rect in drawn]
+        self.mark_dirty(*self.drawn_rects, *rects)
+        self.drawn_rects = rects
 
     def handle_event(self, event: pg.event.Event) -> None:
         if event.type == pg.QUIT:
@@ -95,16 +245,6 @@ class GameMenu(State):
 
         if self.level_handler.last_level_finished:
             self.next_state = MainState.WIN
-        elif self.level_handler.current_level.is_finished:
-
-            if self.level_handler.level_number == len(self.level_handler.levels) - 1:
-                time.sleep(0.5)
-            else:
-                time.sleep(2)
-
-            self.level_handler.next_level()
-            self.player.position = pg.Vector2(self.level_handler.current_level.start_position[0] * TILE_SIZE, self.level_handler.current_level.start_position[1] *TILE_SIZE)
-            self.enemies: list[Enemy] = [Enemy(pos, self.player) for pos in self.level_handler.current_level.enemies]
         self.player.handle_event(event)
 
 
@@ -141,15 +281,16 @@ class MainMenu(State):
             COLOR_RED
         )
 
-    def update(self) -> None:
+    def update(self, dt: float) -> None:
         pass
 
-    def draw(self, screen: pg.Surface) -> None:
+    def draw(self, screen: pg.Surface, alpha: float = 1.0) -> None:
         screen.fill(COLOR_BLACK)
         screen.blit(self.title_text, self.title_text_rect)
         self.play_button.draw(screen)
         self.credits_button.draw(screen)
         self.quit_button.draw(screen)
+        self.mark_dirty(*changed_buttons(self.play_button, self.credits_button, self.quit_button))
 
     def handle_event(self, event: pg.event.Event) -> None:
         if event.type == pg.QUIT:
@@ -193,14 +334,15 @@ class Credits(State):
             COLOR_RED
         )
 
-    def update(self) -> None:
+    def update(self, dt: float) -> None:
         pass
 
-    def draw(self, screen: pg.Surface) -> None:
+    def draw(self, screen: pg.Surface, alpha: float = 1.0) -> None:
         screen.fill(COLOR_BLACK)
         screen.blit(self.title_text, self.title_text_rect)
         screen.blit(self.credits_text, self.credits_text_rect)
         self.exit_button.draw(screen)
+        self.mark_dirty(*changed_buttons(self.exit_button))
 
     def handle_event(self, event: pg.event.Event) -> None:
         if event.type == pg.QUIT:
@@ -253,10 +395,10 @@ class Instructions(State):
             COLOR_RED
         )
 
-    def update(self) -> None:
+    def update(self, dt: float) -> None:
         pass
 
-    def draw(self, screen: pg.Surface) -> None:
+    def draw(self, screen: pg.Surface, alpha: float = 1.0) -> None:
         screen.fill(COLOR_BLACK)
         screen.blit(self.title_text, self.title_text_rect)
         screen.blit(self.instructions_text, self.instructions_text_rect)
@@ -264,6 +406,7 @@ class Instructions(State):
         screen.blit(self.kills_text, self.kills_text_rect)
         self.start_button.draw(screen)
         self.back_button.draw(screen)
+        self.mark_dirty(*changed_buttons(self.start_button, self.back_button))
 
     def handle_event(self, event: pg.event.Event) -> None:
         if event.type == pg.QUIT:
@@ -301,14 +444,15 @@ class Death(State):
             COLOR_RED
         )
 
-    def update(self) -> None:
+    def update(self, dt: float) -> None:
         pass
 
-    def draw(self, screen: pg.Surface) -> None:
+    def draw(self, screen: pg.Surface, alpha: float = 1.0) -> None:
         screen.fill(COLOR_BLACK)
         screen.blit(self.title_text, self.title_text_rect)
         self.play_button.draw(screen)
         self.back_button.draw(screen)
+        self.mark_dirty(*changed_buttons(self.play_button, self.back_button))
 
     def handle_event(self, event: pg.event.Event) -> None:
         if event.type == pg.QUIT:
@@ -348,14 +492,15 @@ class Win(State):
             COLOR_RED
         )
 
-    def update(self) -> None:
+    def update(self, dt: float) -> None:
         pass
 
-    def draw(self, screen: pg.Surface) -> None:
+    def draw(self, screen: pg.Surface, alpha: float = 1.0) -> None:
         screen.fill(COLOR_BLACK)
         screen.blit(self.title_text, self.title_text_rect)
         self.play_button.draw(screen)
         self.back_button.draw(screen)
+        self.mark_dirty(*changed_buttons(self.play_button, self.back_button))
 
     def handle_event(self, event: pg.event.Event) -> None:
         if event.type == pg.QUIT:
@@ -0,0 +1,128 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 22:31:48
+ # @ Description:
+    Binary level format, memory-mapped so that huge levels open at once and only the pages
+    that are read are loaded. A file holds a header, a table of level offsets, then for each
+    level its header, a byte per tile grid (1 for a wall) and a table of entities: the player (P),
+    the exit (S) and the enemies (E) with their tile.
+    Usage: python -m src.world.binary assets/level.toml levels.lvl
+ '''
+
+import mmap
+import os
+import struct
+import sys
+
+import numpy as np
+import toml
+
+from src.core import DEFAULT_SOLVER
+from src.world.compiler import CompiledLevel, compile_layout
+
+BINARY_EXTENSION = '.lvl'
+MAGIC = b'LVLS'
+VERSION = 1
+# magic, version, number of levels, then an offset per level
+FILE_HEADER = struct.Struct('<4sHH')
+OFFSET = struct.Struct('<Q')
+# width, height, number of entities, name length, solver length, layout hash
+LEVEL_HEADER = struct.Struct('<IIIHH40s')
+ENTITY = np.dtype([('kind', 'u1'), ('x', '<u4'), ('y', '<u4')])
+
+
+def align(offset: int, size: int = 8) -> int:
+    return -(-offset // size) * size
+
+
+def level_section(level: CompiledLevel) -> bytes:
+    """
+    Header, grid and entity table of a level
+    """
+    name, solver = level.name.encode('utf-8'), level.solver.encode('utf-8')
+    entities = np.zeros(2 + len(level.enemies), dtype=ENTITY)
+    entities['kind'] = [ord('P'), ord('S')] + [ord('E')] * len(level.enemies)
+    entities['x'] = [level.start_position[0], level.exit_position[0], *level.enemies[:, 0].tolist()]
+    entities['y'] = [level.start_position[1], level.exit_position[1], *level.enemies[:, 1].tolist()]
+
+    head = LEVEL_HEADER.pack(level.width, level.height, len(entities), len(name), len(solver),
+                             level.layout_hash.encode('ascii')) + name + solver
+    head += bytes(align(len(head)) - len(head))
+    grid = level.walls.astype(np.uint8).tobytes()
+    return head + grid + bytes(align(len(grid)) - len(grid)) + entities.tobytes()
+
+
+def save_binary(levels: list[CompiledLevel], path: str) -> None:
+    """
+    Write levels to a binary level file, through a temporary file so a reader never sees half of it
+    """
+    sections = [level_section(level) for level in levels]
+    offset = align(FILE_HEADER.size + OFFSET.size * len(levels))
+    offsets = []
+    for section in sections:
+        offsets.append(offset)
+        offset += align(len(section))
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(f'{path}.tmp', 'wb') as file:
+        file.write(FILE_HEADER.pack(MAGIC, VERSION, len(levels)))
+        file.write(b''.join(OFFSET.pack(value) for value in offsets))
+        for value, section in zip(offsets, sections):
+            file.seek(value)
+            file.write(section)
+    os.replace(f'{path}.tmp', path)
+
+
+def read_level(data: mmap.mmap, offset: int) -> CompiledLevel:
+    """
+    Level at an offset of a mapped file, its walls are a read-only view of the file
+    """
+    width, height, count, name_length, solver_length, layout_hash = LEVEL_HEADER.unpack_from(data, offset)
+    offset += LEVEL_HEADER.size
+    name = data[offset:offset + name_length].decode('utf-8')
+    offset += name_length
+    solver = data[offset:offset + solver_length].decode('utf-8')
+    offset = align(offset + solver_length)
+
+    walls = np.frombuffer(data, dtype=np.bool_, count=width * height, offset=offset).reshape(height, width)
+    entities = np.frombuffer(data, dtype=ENTITY, count=count, offset=offset + align(width * height))
+    positions = np.stack([entities['x'], entities['y']], axis=1).astype(np.int32)
+
+    def first(kind: str) -> tuple[int, int]:
+        found = positions[entities['kind'] == ord(kind)]
+        return (int(found[0, 0]), int(found[0, 1])) if len(found) else (0, 0)
+
+    return CompiledLevel(name, solver or DEFAULT_SOLVER, layout_hash.decode('ascii'), walls,
+                         first('P'), first('S'), positions[entities['kind'] == ord('E')])
+
+
+def load_binary(path: str) -> list[CompiledLevel]:
+    """
+    Map a binary level file, nothing but the headers and the entities is read until the walls are used.
+    Raise ValueError if the file is not a level file of this version
+    """
+    with open(path, 'rb') as file:
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, count = FILE_HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f'{path} is not a level file of version {VERSION}')
+    offsets = [OFFSET.unpack_from(data, FILE_HEADER.size + OFFSET.size * i)[0] for i in range(count)]
+    return [read_level(data, offset) for offset in offsets]
+
+
+def convert(toml_file: str, path: str) -> list[CompiledLevel]:
+    """
+    Write the levels of a TOML level file to a binary level file
+    """
+    levels = [compile_layout(level['name'], level['layout'], level.get('solver', DEFAULT_SOLVER))
+              for level in toml.load(toml_file)['level']]
+    save_binary(levels, path)
+    return levels
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        print(f'usage: python -m src.world.binary LEVELS.toml OUTPUT{BINARY_EXTENSION}', file=sys.stderr)
+        sys.exit(1)
+    for converted in convert(sys.argv[1], sys.argv[2]):
+        print(f'{converted.name}: {converted.width}x{converted.height}, {len(converted.enemies)} enemies')
@@ -0,0 +1,48 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 20:48:33
+ # @ Description: Camera scrolling the levels larger than the screen
+ '''
+
+import pygame as pg
+
+from src.config import CAMERA_MARGIN
+
+
+class Camera:
+    """
+    Part of the level shown on the screen, in pixels. It follows a target without leaving the level,
+    a level smaller than the screen stays in the top left corner
+    """
+    def __init__(self, view_size: tuple[int, int], level_size: tuple[int, int], margin: int = CAMERA_MARGIN) -> None:
+        self.view = pg.Rect((0, 0), view_size)
+        self.level_size = level_size
+        self.margin = margin
+
+    @property
+    def offset(self) -> tuple[int, int]:
+        """
+        Level position of the top left of the screen
+        """
+        return self.view.topleft
+
+    @property
+    def active_area(self) -> pg.Rect:
+        """
+        The view and its margin, what is outside is neither drawn nor updated for drawing
+        """
+        return self.view.inflate(2 * self.margin, 2 * self.margin)
+
+    def follow(self, center: tuple[float, float]) -> None:
+        """
+        Center the view on a level position
+        """
+        width, height = self.view.size
+        self.view.x = min(max(int(center[0]) - width // 2, 0), max(self.level_size[0] - width, 0))
+        self.view.y = min(max(int(center[1]) - height // 2, 0), max(self.level_size[1] - height, 0))
+
+    def is_active(self, rect: pg.Rect) -> bool:
+        return self.active_area.colliderect(rect)
+
+    def to_screen(self, position: tuple[float, float]) -> tuple[float, float]:
+        return position[0] - self.view.x, position[1] - self.view.y
@@ -0,0 +1,176 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 17:02:45
+ # @ Description: Level compiler, turns layouts into NumPy arrays cached on disk
+ '''
+
+import glob
+import os
+from dataclasses import dataclass
+from math import sqrt
+from typing import Any
+
+import numpy as np
+import toml
+
+from src.core import DEFAULT_SOLVER, Graph, content_hash
+
+COMPILED_EXTENSION = '.npz'
+
+# moves in the order the level graph lists them: left, right, up, down, then the diagonals
+MOVES = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, -1), (-1, 1), (1, 1)]
+
+
+@dataclass
+class CompiledLevel:
+    """
+    Level layout compiled to arrays, walls[y, x] is True for a wall
+    """
+    name: str
+    solver: str
+    layout_hash: str
+    walls: np.ndarray
+    start_position: tuple[int, int]
+    exit_position: tuple[int, int]
+    enemies: np.ndarray
+
+    @property
+    def width(self) -> int:
+        return self.walls.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.walls.shape[0]
+
+
+def layout_array(layout: str) -> np.ndarray:
+    """
+    Characters of a layout as a (height, width) byte array, short rows are padded with spaces
+    """
+    rows = layout.split('\n')
+    if rows and rows[-1] == '':
+        rows.pop()
+    width = max((len(row) for row in rows), default=0)
+    data = ''.join(row.ljust(width) for row in rows).encode('ascii')
+    return np.frombuffer(data, dtype=np.uint8).reshape(len(rows), width)
+
+
+def find_first(chars: np.ndarray, char: str) -> tuple[int, int]:
+    """
+    Tile of the first occurrence of a character in reading order, (0, 0) if there is none
+    """
+    found = np.argwhere(chars == ord(char))
+    if len(found) == 0:
+        return 0, 0
+    y, x = found[0]
+    return int(x), int(y)
+
+
+def compile_layout(name: str, layout: str, solver: str = DEFAULT_SOLVER) -> CompiledLevel:
+    """
+    Compile a layout in one vectorized pass over its characters
+    """
+    chars = layout_array(layout)
+    enemies = np.argwhere(chars == ord('E'))[:, ::-1].astype(np.int32)
+    return CompiledLevel(name, solver, content_hash(layout), chars == ord('#'),
+                         find_first(chars, 'P'), find_first(chars, 'S'), enemies)
+
+
+def move_masks(walls: np.ndarray) -> list[tuple[int, int, float, np.ndarray]]:
+    """
+    For every move, the mask of the tiles it can be made from.
+    A diagonal move needs both tiles it passes by to be free, like the straight moves it is made of
+    """
+    height, width = walls.shape
+    padded = np.ones((height + 2, width + 2), dtype=bool)
+    padded[1:-1, 1:-1] = walls
+    free = ~padded
+
+    def shifted(dx: int, dy: int) -> np.ndarray:
+        return free[1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+
+    masks = []
+    for dx, dy in MOVES:
+        mask = shifted(0, 0) & shifted(dx, dy)
+        if dx and dy:
+            mask = mask & shifted(dx, 0) & shifted(0, dy)
+        masks.append((dx, dy, sqrt(2) if dx and dy else 1.0, mask))
+    return masks
+
+
+def build_graph(walls: np.ndarray) -> Graph:
+    """
+    Level graph of the free tiles, nodes are named "x-y"
+    """
+    ys, xs = np.nonzero(~walls)
+    names = np.empty(walls.shape, dtype=object)
+    names[ys, xs] = [f'{x}-{y}' for x, y in zip(xs.tolist(), ys.tolist())]
+    edges: dict[str, dict[str, float]] = {name: {} for name in names[ys, xs].tolist()}
+
+    for dx, dy, cost, mask in move_masks(walls):
+        sy, sx = np.nonzero(mask)
+        for source, target in zip(names[sy, sx].tolist(), names[sy + dy, sx + dx].tolist()):
+            edges[source][target] = cost
+    # neighbours are listed in move order, like the graph built tile by tile used to be
+    return Graph(edges)
+
+
+def compile_levels(content: str, cache_dir: str) -> list[CompiledLevel]:
+    """
+    Compile every level of a TOML level file. The result is cached in a .npz file named after the hash
+    of the file content, the caches of older versions of the file are deleted.
+    """
+    cache_file = os.path.join(cache_dir, f'levels-{content_hash(content)}.npz')
+
+    try:
+        return load_levels(cache_file)
+    except (OSError, KeyError, ValueError):
+        pass
+
+    levels = [compile_layout(level['name'], level['layout'], level.get('solver', DEFAULT_SOLVER))
+              for level in toml.loads(content)['level']]
+    for old in glob.glob(os.path.join(cache_dir, 'levels-*.npz')):
+        try:
+            os.remove(old)
+        except OSError:
+            pass
+    save_levels(levels, cache_file)
+    return levels
+
+
+def load_levels(path: str) -> list[CompiledLevel]:
+    """
+    Read compiled levels written by save_levels.
+    Raise OSError if the file cannot be read, KeyError or ValueError if it does not hold compiled levels
+    """
+    with np.load(path, allow_pickle=False) as data:
+        starts = np.asarray(data['starts']).tolist()
+        exits = np.asarray(data['exits']).tolist()
+        return [
+            CompiledLevel(str(name), str(solver), str(layout_hash), data[f'walls_{i}'],
+                          tuple(starts[i]), tuple(exits[i]), data[f'enemies_{i}'])
+            for i, (name, solver, layout_hash) in enumerate(zip(data['names'], data['solvers'], data['hashes']))
+        ]
+
+
+def save_levels(levels: list[CompiledLevel], cache_file: str) -> None:
+    """
+    Write compiled levels to a .npz file, the other files of its folder are left untouched
+    """
+    arrays: dict[str, Any] = {
+        'names': np.array([level.name for level in levels]),
+        'solvers': np.array([level.solver for level in levels]),
+        'hashes': np.array([level.layout_hash for level in levels]),
+        'starts': np.array([level.start_position for level in levels], dtype=np.int32).reshape(-1, 2),
+        'exits': np.array([level.exit_position for level in levels], dtype=np.int32).reshape(-1, 2),
+    }
+    for i, level in enumerate(levels):
+        arrays[f'walls_{i}'] = level.walls
+        arrays[f'enemies_{i}'] = level.enemies
+    try:
+        os.makedirs(os.path.dirname(cache_file) or '.', exist_ok=True)
+        np.savez(f'{cache_file}.tmp.npz', **arrays)
+        os.replace(f'{cache_file}.tmp.npz', cache_file)
+    except OSError:
+        # the cache is only an optimization
+        pass
@@ -0,0 +1,203 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 21:40:05
+ # @ Description:
+    Seeded level generator, for stress tests and benchmarks. Layouts use the P/E/S/# format of
+    assets/level.toml and the exit is always reachable from the player.
+    Usage: python -m src.world.generator --width 200 --height 100 --levels 3 --output big.toml
+ '''
+
+import argparse
+import os
+import sys
+from collections import deque
+
+import numpy as np
+
+from src.core import DEFAULT_SOLVER
+from src.world.binary import BINARY_EXTENSION, save_binary
+from src.world.compiler import COMPILED_EXTENSION, CompiledLevel, compile_layout, move_masks, save_levels
+
+KINDS = ('random', 'maze')
+
+
+def random_walls(rng: np.random.Generator, width: int, height: int, density: float) -> np.ndarray:
+    """
+    Walls placed at random with the given density, inside a wall border
+    """
+    walls = rng.random((height, width)) < density
+    walls[[0, -1], :] = True
+    walls[:, [0, -1]] = True
+    return walls
+
+
+def maze_walls(rng: np.random.Generator, width: int, height: int) -> np.ndarray:
+    """
+    Perfect maze carved with a randomized depth first search, corridors are one tile wide
+    """
+    walls = np.ones((height, width), dtype=bool)
+    if width < 3 or height < 3:
+        return walls
+    walls[1, 1] = False
+    stack = [(1, 1)]
+    while stack:
+        x, y = stack[-1]
+        options = [(x + dx, y + dy) for dx, dy in ((2, 0), (-2, 0), (0, 2), (0, -2))
+                   if 0 < x + dx < width - 1 and 0 < y + dy < height - 1 and walls[y + dy, x + dx]]
+        if not options:
+            stack.pop()
+            continue
+        nx, ny = options[rng.integers(len(options))]
+        walls[(y + ny) // 2, (x + nx) // 2] = False
+        walls[ny, nx] = False
+        stack.append((nx, ny))
+    return walls
+
+
+def flat_moves(walls: np.ndarray) -> list[tuple[int, list[bool]]]:
+    """
+    Moves of the level graph on the flattened grid, as (index step, tiles the move can start from)
+    """
+    width = walls.shape[1]
+    return [(dy * width + dx, mask.ravel().tolist()) for dx, dy, _, mask in move_masks(walls)]
+
+
+def flood(moves: list[tuple[int, list[bool]]], first: int, seen: bytearray) -> list[int]:
+    """
+    Indices of the free tiles reachable from a free tile, in breadth first order.
+    Tiles marked in seen are skipped, the reached ones are marked
+    """
+    seen[first] = 1
+    order = [first]
+    queue = deque(order)
+    while queue:
+        index = queue.popleft()
+        for step, mask in moves:
+            if mask[index] and not seen[index + step]:
+                seen[index + step] = 1
+                order.append(index + step)
+                queue.append(index + step)
+    return order
+
+
+def reachable(walls: np.ndarray, start: tuple[int, int]) -> list[tuple[int, int]]:
+    """
+    Tiles reachable from a free tile with the moves of the level graph, in breadth first order:
+    the last one is among the farthest
+    """
+    width = walls.shape[1]
+    order = flood(flat_moves(walls), start[1] * width + start[0], bytearray(walls.size))
+    return [(index % width, index // width) for index in order]
+
+
+def largest_region(walls: np.ndarray) -> list[tuple[int, int]]:
+    """
+    Largest connected region of free tiles. Every region is flooded once, and the search stops
+    as soon as a region holds more free tiles than the ones left to explore
+    """
+    width = walls.shape[1]
+    moves = flat_moves(walls)
+    seen = bytearray(walls.size)
+    left = int(walls.size - walls.sum())
+    best: list[int] = []
+    for first in np.flatnonzero(~walls).tolist():
+        if len(best) >= left:
+            break
+        if seen[first]:
+            continue
+        region = flood(moves, first, seen)
+        left -= len(region)
+        if len(region) > len(best):
+            best = region
+    return [(index % width, index // width) for index in best]
+
+
+def generate_layout(width: int, # pylint: disable=too-many-arguments, too-many-locals
+                    height: int,
+                    *,
+                    density: float = 0.3,
+                    enemies: int = 3,
+                    seed: int = 0,
+                    kind: str = 'random') -> str:
+    """
+    Layout of a level: the player, the exit as far as possible from it, and enemies on tiles it can reach.
+    Raise ValueError if no two tiles are connected
+    """
+    if kind not in KINDS:
+        raise ValueError(f'unknown level kind: {kind}')
+    rng = np.random.default_rng(seed)
+    walls = maze_walls(rng, width, height) if kind == 'maze' else random_walls(rng, width, height, density)
+
+    region = largest_region(walls)
+    if not region:
+        raise ValueError('the level has no free tile')
+    if len(region) < 2:
+        raise ValueError('the level has no room for a player and an exit')
+    # the player starts on a random tile of the region, the exit is among the farthest from it
+    region = reachable(walls, region[rng.integers(len(region))])
+
+    chars = np.where(walls, ord('#'), ord(' ')).astype(np.uint8)
+    start, goal = region[0], region[-1]
+    chars[start[1], start[0]] = ord('P')
+    chars[goal[1], goal[0]] = ord('S')
+    for i in rng.choice(np.arange(1, len(region) - 1), size=min(enemies, len(region) - 2), replace=False):
+        x, y = region[i]
+        chars[y, x] = ord('E')
+    return ''.join(row.tobytes().decode('ascii') + '\n' for row in chars)
+
+
+def generate_level(name: str, width: int, height: int, **options) -> CompiledLevel:
+    """
+    Generated level, compiled. The options are the ones of generate_layout
+    """
+    return compile_layout(name, generate_layout(width, height, **options))
+
+
+def to_toml(names: list[str], layouts: list[str], solver: str = DEFAULT_SOLVER) -> str:
+    """
+    Levels in the format of assets/level.toml
+    """
+    return ''.join(f'[[level]]\nname = "{name}"\nsolver = "{solver}"\nlayout = """\n{layout}"""\n\n'
+                   for name, layout in zip(names, layouts))
+
+
+def main() -> int:
+    """
+    Generate levels and write them as TOML, compiled to a .npz file or to a binary level file
+    """
+    parser = argparse.ArgumentParser(description='Seeded level generator')
+    parser.add_argument('--width', type=int, default=100)
+    parser.add_argument('--height', type=int, default=100)
+    parser.add_argument('--density', type=float, default=0.3, help='wall density of the random levels')
+    parser.add_argument('--enemies', type=int, default=3, help='enemies per level')
+    parser.add_argument('--kind', default='random', choices=KINDS)
+    parser.add_argument('--levels', type=int, default=1, help='number of levels, each one has its own seed')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--solver', default=DEFAULT_SOLVER, help='solver written in the TOML file')
+    parser.add_argument('--output', default='generated.toml',
+                        help='.toml file, .npz for the compiled levels or .lvl for a binary level file')
+    args = parser.parse_args()
+
+    names = [f'Generated {args.seed + i}' for i in range(args.levels)]
+    try:
+        layouts = [generate_layout(args.width, args.height, density=args.density, enemies=args.enemies,
+                                   seed=args.seed + i, kind=args.kind) for i in range(args.levels)]
+    except ValueError as error:
+        print(f'error: {error}', file=sys.stderr)
+        return 1
+
+    extension = os.path.splitext(args.output)[1]
+    if extension in (COMPILED_EXTENSION, BINARY_EXTENSION):
+        levels = [compile_layout(name, layout, args.solver) for name, layout in zip(names, layouts)]
+        if extension == BINARY_EXTENSION:
+            save_binary(levels, args.output)
+        else:
+            save_levels(levels, args.output)
+    else:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(to_toml(names, layouts, args.solver))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
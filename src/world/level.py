@@ -4,17 +4,38 @@
  # @ Description:
  '''
 
-from math import sqrt
-from typing import Any
+import os
+import threading
 from dataclasses import dataclass, field
 
-import toml
+import numpy as np
 import pygame as pg
 
-from src.config import TILE_SIZE
-from src.core import Graph, dijkstra
+from src.assets import ASSETS, AssetRegistry
+from src.config import SCREEN_SIZE, TILE_SIZE
+from src.core import (
+    Graph,
+    DEFAULT_SOLVER,
+    DStarLite,
+    FlowField,
+    Grid,
+    PathCache,
+    content_hash,
+    find_path,
+    node_distance,
+    node_name,
+    parse_node,
+    path_key
+)
+from src.world.compiler import COMPILED_EXTENSION, CompiledLevel, build_graph, compile_levels, load_levels
+from src.world.binary import BINARY_EXTENSION, load_binary
+from src.world.camera import Camera
+from src.world.tile_layer import TileLayer
 
 TOML_FILE = "assets/level.toml"
+WORLD_FILE = "assets/world.png"
+WORLD_CONFIG = "assets/world.toml"
+CACHE_DIR = "cache"
 
 
 class Tile:
@@ -28,10 +49,11 @@ class Tile:
     def draw(self, screen: pg.Surface) -> None:
         pg.draw.rect(screen, self.color, self.rect)
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class Level:
     """
-    Level class to represent the level
+    Level class to represent the level.
+    Levels are shared by every game through the level store, the state of a run lives in LevelRun
     """
     name: str
     tiles: list[Tile]
@@ -39,16 +61,29 @@ class Level:
     enemies: list[tuple[int, int]]
     exit_position: tuple[int, int]
     graph: Graph
+    solver: str = DEFAULT_SOLVER
+    layout_hash: str = ''
+    walls: np.ndarray | None = field(default=None, repr=False)
+    path_cache: PathCache | None = field(default=None, repr=False)
     to_print: list[tuple[tuple[int, int], tuple[int, int]]] = field(default_factory=list)
-    is_finished: bool = False
+    grid: Grid = field(init=False, repr=False)
+    cells: dict[tuple[int, int], Tile] = field(init=False, repr=False)
 
     def __post_init__(self):
-        x, y = self.start_position
-        graph_result = dijkstra(self.graph, f'{x}-{y}')
-
-        ex, ey = self.exit_position
-        solution = graph_result[f'{ex}-{ey}'].path
-        solution.append(f'{ex}-{ey}')
+        grid = Grid.from_walls(self.walls) if self.walls is not None else Grid.from_graph(self.graph)
+        object.__setattr__(self, 'grid', grid)
+        object.__setattr__(self, 'cells', {(tile.rect.x // TILE_SIZE, tile.rect.y // TILE_SIZE): tile
+                                           for tile in self.tiles})
+
+        start, goal = node_name(*self.start_position), node_name(*self.exit_position)
+        key = path_key(self.layout_hash, start, goal, self.solver)
+        cache = self.path_cache if self.layout_hash else None
+        result = cache.get(key) if cache is not None else None
+        if result is None:
+            result = find_path(self.graph, start, goal, self.solver)
+            if cache is not None:
+                cache.put(key, result)
+        solution = result.path[1:]
 
         last = self.start_position
         for path in solution:
@@ -56,148 +91,196 @@ class Level:
             self.to_print.append((last, (x, y)))
             last = (x, y)
 
-class LevelHandler:
-    """
-    Level class to represent the level
-    """
-    def __init__(self, level_number: int) -> None:
-        self.levels: list[Level] = []
-        self.level_number = level_number
-        self.last_level_finished = False
-        self.load_levels(TOML_FILE)
-        self.current_level: Level = self.levels[self.level_number]
-        self.world_image = pg.image.load("assets/world.png").convert_alpha()
-        self.frames: dict[str, tuple[int, int]] = {}
-        self.frame_dimensions: tuple[int, int]
-        self.load_frames_world("assets/world.toml")
-
-
-    def load_frames_world(self, toml_path: str):
+    @property
+    def size(self) -> tuple[int, int]:
         """
-        Load animations from a TOML file
+        Size of the level in pixels
         """
-        config = toml.load(toml_path)
-
-        self.frame_dimensions = (config['blocks']['frame_width'], config['blocks']['frame_height'])
+        return self.grid.width * TILE_SIZE, self.grid.height * TILE_SIZE
 
-        for name, frame_data in config['blocks'].items():
-            if name in {'frame_width', 'frame_height'}:
-                continue
 
+@dataclass
+class LevelRun:
+    """
+    State of one run of a level, cheap to create on every restart
+    """
+    level: Level
+    is_finished: bool = False
+    flow_field: FlowField = field(init=False, repr=False)
+    planner: DStarLite | None = field(default=None, init=False, repr=False)
 
-            x = frame_data['y_position']
-            y = frame_data['x_position']
-            self.frames[name] = (x, y)
+    def __post_init__(self):
+        self.flow_field = FlowField(self.level.grid)
 
-    def get_neighbour(self, layout: list[str], i: int, y: int, width: int) -> dict[str, float]:
+    def plan_from(self, tile: tuple[int, int]) -> list[tuple[int, int]]:
         """
-        Get the neighbours of a node in the graph
+        Shortest path from a tile to the exit.
+        The planner keeps its search between calls, edge changes go through planner.update_edges.
+        It works on a copy of the level graph, the changes of a run must not reach the shared level
         """
-        # pylint: disable=R0914 # Too many local variables, disable for clarity
-        def get_local_x(x: int) -> int:
-            return x - y * width - y
-
-        neighbours: dict[str, float] = {}
-
-        to_left = i - 1
-        to_right = i + 1
-        to_up = i - width - 1
-        to_down = i + width + 1
-
-        cond_left = i > 0
-        cond_right = i < len(layout)
-        cond_up = y > 0
-        cond_down = i + width < len(layout)
-
-        def ok(char: str) -> bool:
-            return char not in ['\n', '#']
-
-        if cond_left and ok(layout[to_left]):
-            neighbours[f'{get_local_x(i - 1)}-{y}'] = 1.0
-        if cond_right and ok(layout[to_right]):
-            neighbours[f'{get_local_x(i + 1)}-{y}'] = 1.0
-        if y > 0 and ok(layout[to_up]):
-            neighbours[f'{get_local_x(i)}-{y - 1}'] = 1.0
-        if cond_down and ok(layout[to_down]):
-            neighbours[f'{get_local_x(i)}-{y + 1}'] = 1.0
-
-        # Add diagonal neighbours
-        if cond_left and cond_up and\
-        ok(layout[to_up]) and ok(layout[to_left]) and ok(layout[to_up - 1]):
-            neighbours[f'{get_local_x(i - 1)}-{y - 1}'] = sqrt(2)
-
-        if cond_right and cond_up and\
-        ok(layout[to_up]) and ok(layout[to_right]) and ok(layout[to_up + 1]):
-            neighbours[f'{get_local_x(i + 1)}-{y - 1}'] = sqrt(2)
-
-        if cond_down and cond_left and\
-        ok(layout[to_down]) and ok(layout[to_left]) and ok(layout[to_down - 1]):
-            neighbours[f'{get_local_x(i - 1)}-{y + 1}'] = sqrt(2)
-
-        if cond_down and cond_right and\
-        ok(layout[to_down]) and ok(layout[to_right]) and ok(layout[to_down + 1]):
-            neighbours[f'{get_local_x(i + 1)}-{y + 1}'] = sqrt(2)
+        if self.planner is None:
+            graph = Graph({node: dict(neighbours) for node, neighbours in self.level.graph.edges.items()})
+            self.planner = DStarLite(graph, node_name(*tile), node_name(*self.level.exit_position), node_distance)
+        else:
+            self.planner.move_start(node_name(*tile))
+        return [parse_node(name) for name in self.planner.plan().path]
 
-        return neighbours
 
-    def load_levels(self, toml_file: str) -> None:
+class LevelStore:
+    """
+    Levels of a level file, each one is built on its first access and then kept for the whole process.
+    Levels can be built from any thread, each one outside the store lock so that building a level
+    never holds up the others. Compiled levels and paths are cached under the cache folder
+    """
+    def __init__(self, level_file: str = TOML_FILE, cache_dir: str = CACHE_DIR,
+                 path_cache: PathCache | None = None, assets: AssetRegistry = ASSETS) -> None:
+        self.level_file = level_file
+        self.assets = assets
+        self.cache_dir = cache_dir
+        self.path_cache = path_cache if path_cache is not None else PathCache(os.path.join(cache_dir, 'paths'))
+        self.compiled: list[CompiledLevel] | None = None
+        self.levels: dict[int, Level] = {}
+        # one lock per level being built, the store lock is only taken to read or publish
+        self.building: dict[int, threading.Lock] = {}
+        self.world: tuple[pg.Surface, dict[str, tuple[int, int]], tuple[int, int]] | None = None
+        self.layers: dict[int, TileLayer] = {}
+        self.lock = threading.RLock()
+
+    def __len__(self) -> int:
+        compiled = self.compiled
+        return len(compiled if compiled is not None else self.compile())
+
+    def __getitem__(self, index: int) -> Level:
+        compiled = self.compile()[index]
+        with self.lock:
+            if index in self.levels:
+                return self.levels[index]
+            building = self.building.setdefault(index, threading.Lock())
+        # a thread asking for a level being built waits for it instead of building it again
+        with building:
+            with self.lock:
+                level = self.levels.get(index)
+            if level is None:
+                level = self.build_level(compiled, self.path_cache)
+                with self.lock:
+                    self.levels[index] = level
+                    del self.building[index]
+        return level
+
+    def compile(self) -> list[CompiledLevel]:
         """
-        Load levels from a toml file
+        Compiled layouts of the level file, read once. A binary level file is mapped instead of read
+        and a .npz file written by the generator is read as it is, without compiling it again
         """
-        def get_local_x(x: int) -> int:
-            return x - y * width - y
-
-        with open(toml_file, 'r', encoding='utf-8') as file:
-            data: dict[str, Any] = toml.load(file)
+        with self.lock:
+            if self.compiled is None:
+                extension = os.path.splitext(self.level_file)[1]
+                if extension == BINARY_EXTENSION:
+                    self.compiled = load_binary(self.level_file)
+                elif extension == COMPILED_EXTENSION:
+                    self.compiled = load_levels(self.level_file)
+                else:
+                    with open(self.level_file, 'r', encoding='utf-8') as file:
+                        self.compiled = compile_levels(file.read(), self.cache_dir)
+                # paths only depend on the layouts and the solvers, whatever the file format
+                self.path_cache.open(content_hash(''.join(level.layout_hash + level.solver for level in self.compiled)))
+            return self.compiled
+
+    @staticmethod
+    def build_level(compiled: CompiledLevel, path_cache: PathCache | None = None) -> Level:
+        """
+        Build a level from its compiled arrays, its path is solved here or read from the path cache
+        """
+        ys, xs = np.nonzero(compiled.walls)
+        tiles = [Tile(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, (255, 0, 0))
+                 for x, y in zip(xs.tolist(), ys.tolist())]
+        return Level(compiled.name,
+            tiles,
+            compiled.start_position,
+            [(x * TILE_SIZE, y * TILE_SIZE) for x, y in compiled.enemies.tolist()],
+            compiled.exit_position,
+            build_graph(compiled.walls),
+            compiled.solver,
+            compiled.layout_hash,
+            compiled.walls,
+            path_cache)
+
+    def load_world(self) -> tuple[pg.Surface, dict[str, tuple[int, int]], tuple[int, int]]:
+        """
+        Tile sheet of the levels with the position of each block and the size of the blocks
+        """
+        with self.lock:
+            if self.world is None:
+                image = self.assets.sheet(WORLD_FILE)
+                config = self.assets.config(WORLD_CONFIG)
+                dimensions = (config['blocks']['frame_width'], config['blocks']['frame_height'])
+                frames = {}
+                for name, frame_data in config['blocks'].items():
+                    if name in {'frame_width', 'frame_height'}:
+                        continue
+                    frames[name] = (frame_data['y_position'], frame_data['x_position'])
+                self.world = (image, frames, dimensions)
+            return self.world
+
+    def tile_image(self, name: str) -> pg.Surface:
+        """
+        Block of the tile sheet scaled to the tile size
+        """
+        image, frames, dimensions = self.load_world()
+        return pg.transform.scale(image.subsurface((*frames[name], *dimensions)), (TILE_SIZE, TILE_SIZE))
 
-        for level_data in data['level']:
-            start_position: tuple[int, int] = (0, 0)
-            enemies: list[tuple[int, int]] = []
+    def tile_layer(self, index: int) -> TileLayer:
+        """
+        Baked tiles of a level, created on first access. Its chunks are rendered when first drawn or baked
+        """
+        with self.lock:
+            if index in self.layers:
+                return self.layers[index]
+        layer = TileLayer(self.compile()[index].walls, self[index].exit_position,
+                          self.tile_image('brick'), self.tile_image('exit'))
+        with self.lock:
+            return self.layers.setdefault(index, layer)
 
-            tiles: list[Tile] = []
-            local_graph: dict[str, dict[str, float]] = {}
-            local_exit_position = (0, 0)
 
-            y = 0
-            width = -1
-            for i, tile in enumerate(level_data['layout']):
-                if tile == '\n':
-                    if width == -1:
-                        width = i
-                    y += 1
+LEVELS = LevelStore()
 
-                if tile == 'P':
-                    start_position = (get_local_x(i), y)
-                elif tile == 'E':
-                    enemies.append((get_local_x(i) * TILE_SIZE, y * TILE_SIZE))
-                elif tile == '#':
-                    tiles.append(Tile(get_local_x(i) * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, (255, 0, 0)))
-                elif tile == 'S':
-                    local_exit_position = (get_local_x(i), y)
 
-                if tile not in ['\n', '#']:
-                    local_graph[f'{get_local_x(i)}-{y}'] = self.get_neighbour(level_data['layout'], i, y, width)
+class LevelHandler:
+    """
+    Level class to represent the level.
+    The levels come from a store kept for the whole process, so that a restart does not load anything again
+    """
+    def __init__(self, level_number: int, levels: LevelStore = LEVELS) -> None:
+        self.levels = levels
+        self.level_number = level_number
+        self.last_level_finished = False
+        self.current_level: Level
+        self.run: LevelRun
+        self.tile_layer: TileLayer
+        self.camera: Camera
+        self.set_level(level_number)
 
-            self.levels.append(
-                Level(level_data['name'],
-                tiles,
-                start_position,
-                enemies,
-                local_exit_position,
-                Graph(local_graph))
-            )
+    def set_level(self, level_number: int) -> None:
+        """
+        Start a new run of a level of the store
+        """
+        self.level_number = level_number
+        self.current_level = self.levels[level_number]
+        self.run = LevelRun(self.current_level)
+        self.tile_layer = self.levels.tile_layer(level_number)
+        self.camera = Camera(SCREEN_SIZE, self.current_level.size)
 
     def change_level(self, level_name: str) -> None:
-        for level in self.levels:
-            if level.name == level_name:
-                self.current_level = level
+        for number, compiled in enumerate(self.levels.compile()):
+            if compiled.name == level_name:
+                self.set_level(number)
                 break
 
     def next_level(self) -> None:
-        self.level_number += 1
-        if self.level_number < len(self.levels):
-            self.current_level = self.levels[self.level_number]
+        if self.level_number + 1 < len(self.levels):
+            self.set_level(self.level_number + 1)
         else:
+            self.level_number += 1
             self.last_level_finished = True
 
     def draw(self, screen: pg.Surface) -> None:
@@ -209,22 +292,12 @@ class LevelHandler:
                 x, y = elem[0]
                 x2, y2 = elem[1]
                 pg.draw.line(screen, (0, 0, 255),
-                    (x * TILE_SIZE + TILE_SIZE // 2, y * TILE_SIZE + TILE_SIZE // 2),
-                    (x2 * TILE_SIZE + TILE_SIZE // 2, y2 * TILE_SIZE + TILE_SIZE // 2), 5)
-
-        def draw_tile_here(x: int, y: int, name: str) -> None:
-            brick_image = self.world_image.subsurface((*self.frames[name], *self.frame_dimensions))
-            screen.blit(
-                pg.transform.scale(brick_image, (TILE_SIZE, TILE_SIZE)),
-                (x, y)
-            )
-
-        for tile in self.current_level.tiles:
-            x, y = tile.rect.topleft
-            draw_tile_here(x, y, 'brick')
+                    self.camera.to_screen((x * TILE_SIZE + TILE_SIZE // 2, y * TILE_SIZE + TILE_SIZE // 2)),
+                    self.camera.to_screen((x2 * TILE_SIZE + TILE_SIZE // 2, y2 * TILE_SIZE + TILE_SIZE // 2)), 5)
 
-        ex, ey = self.current_level.exit_position
-        draw_tile_here(ex * TILE_SIZE, ey * TILE_SIZE, 'exit')
+        # chunks in the margin are baked before they scroll into view
+        self.tile_layer.bake(self.camera.active_area)
+        self.tile_layer.draw(screen, self.camera.offset)
 
-        if self.current_level.is_finished:
+        if self.run.is_finished:
             draw_dijkstra_result()
@@ -0,0 +1,93 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 18:52:06
+ # @ Description: Prepares the next level on a worker while the current one is played
+ '''
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import pygame as pg
+
+from src.config import SCREEN_SIZE, TILE_SIZE
+from src.core import PlannerService
+from src.world.level import LEVELS, Level, LevelStore
+
+
+@dataclass
+class PreparedLevel:
+    """
+    Level ready to be played, its tiles around the start are baked
+    and extras is what the game built for it on the worker (its enemies)
+    """
+    number: int
+    level: Level
+    extras: Any
+    seconds: float
+
+
+class LevelPrefetcher:
+    """
+    Builds a level of the store and runs a preparation function on it, on its own worker so that
+    AI jobs are never queued behind a level. The result is handed back by take(), once ready.
+    Prefetching another level makes the previous request stale.
+    """
+    def __init__(self, levels: LevelStore = LEVELS, service: PlannerService | None = None) -> None:
+        self.levels = levels
+        self.service = service if service is not None else PlannerService(
+            ThreadPoolExecutor(1, thread_name_prefix='prefetch'))
+        self.number: int | None = None
+        self.prepared: PreparedLevel | None = None
+
+    def prefetch(self, number: int, prepare: Callable[[Level], Any]) -> bool:
+        """
+        Start preparing a level, return False if there is no such level
+        """
+        self.number = None
+        self.prepared = None
+        if not 0 <= number < len(self.levels):
+            return False
+        self.number = number
+        self.service.submit(self, self.prepare, number, prepare, callback=self.deliver)
+        return True
+
+    def prepare(self, number: int, prepare: Callable[[Level], Any]) -> PreparedLevel:
+        """
+        Runs on the worker
+        """
+        started = time.perf_counter()
+        level = self.levels[number]
+        area = pg.Rect((0, 0), SCREEN_SIZE)
+        area.center = (level.start_position[0] * TILE_SIZE, level.start_position[1] * TILE_SIZE)
+        self.levels.tile_layer(number).bake(area)
+        extras = prepare(level)
+        return PreparedLevel(number, level, extras, time.perf_counter() - started)
+
+    def deliver(self, prepared: PreparedLevel) -> None:
+        self.prepared = prepared
+
+    def poll(self) -> None:
+        self.service.poll()
+
+    def take(self, number: int) -> PreparedLevel | None:
+        """
+        The prepared level if it is the requested one and it is ready, None otherwise
+        """
+        self.poll()
+        if self.prepared is None or self.prepared.number != number:
+            return None
+        prepared, self.prepared, self.number = self.prepared, None, None
+        return prepared
+
+    @property
+    def status(self) -> str:
+        """
+        What the prefetcher is doing, for debugging
+        """
+        if self.prepared is not None:
+            return f'level {self.prepared.number + 1} prepared in {self.prepared.seconds * 1000:.0f} ms'
+        if self.number is not None:
+            return f'loading level {self.number + 1}'
+        return 'idle'
@@ -0,0 +1,88 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 19:40:12
+ # @ Description: Static tiles of a level pre-rendered into cached chunk surfaces
+ '''
+
+import numpy as np
+import pygame as pg
+
+from src.config import CHUNK_TILES, TILE_SIZE
+
+
+class TileLayer:
+    """
+    Walls and exit of a level baked into surfaces of CHUNK_TILES x CHUNK_TILES tiles.
+    A chunk is rendered on its first draw, or by bake(), and kept until one of its tiles changes,
+    so a frame costs one blit per visible chunk instead of a subsurface, a scale and a blit per tile.
+    """
+    def __init__(self, walls: np.ndarray, exit_position: tuple[int, int],
+                 brick: pg.Surface, exit_image: pg.Surface) -> None:
+        self.walls = walls.copy()
+        self.exit_position = exit_position
+        self.brick = brick
+        self.exit_image = exit_image
+        self.chunks: dict[tuple[int, int], pg.Surface] = {}
+        self.renders = 0
+
+    @property
+    def columns(self) -> int:
+        return -(-self.walls.shape[1] // CHUNK_TILES)
+
+    @property
+    def rows(self) -> int:
+        return -(-self.walls.shape[0] // CHUNK_TILES)
+
+    def chunks_in(self, area: pg.Rect) -> list[tuple[int, int]]:
+        """
+        Chunks overlapping an area of the level, in pixels
+        """
+        size = CHUNK_TILES * TILE_SIZE
+        first_x, first_y = max(area.left // size, 0), max(area.top // size, 0)
+        last_x, last_y = min((area.right - 1) // size, self.columns - 1), min((area.bottom - 1) // size, self.rows - 1)
+        return [(x, y) for y in range(first_y, last_y + 1) for x in range(first_x, last_x + 1)]
+
+    def render_chunk(self, chunk: tuple[int, int]) -> pg.Surface:
+        """
+        Render the tiles of a chunk on a transparent surface
+        """
+        cx, cy = chunk
+        x0, y0 = cx * CHUNK_TILES, cy * CHUNK_TILES
+        walls = self.walls[y0:y0 + CHUNK_TILES, x0:x0 + CHUNK_TILES]
+        surface = pg.Surface((walls.shape[1] * TILE_SIZE, walls.shape[0] * TILE_SIZE), pg.SRCALPHA)
+        ys, xs = np.nonzero(walls)
+        surface.blits([(self.brick, (x * TILE_SIZE, y * TILE_SIZE)) for x, y in zip(xs.tolist(), ys.tolist())],
+                      doreturn=False)
+        ex, ey = self.exit_position
+        if x0 <= ex < x0 + CHUNK_TILES and y0 <= ey < y0 + CHUNK_TILES:
+            surface.blit(self.exit_image, ((ex - x0) * TILE_SIZE, (ey - y0) * TILE_SIZE))
+        self.renders += 1
+        return surface
+
+    def bake(self, area: pg.Rect | None = None) -> None:
+        """
+        Render the missing chunks of an area, of the whole level by default
+        """
+        if area is None:
+            area = pg.Rect(0, 0, self.walls.shape[1] * TILE_SIZE, self.walls.shape[0] * TILE_SIZE)
+        for chunk in self.chunks_in(area):
+            if chunk not in self.chunks:
+                self.chunks[chunk] = self.render_chunk(chunk)
+
+    def set_wall(self, x: int, y: int, wall: bool) -> None:
+        """
+        Change a tile, its chunk is rendered again on its next draw
+        """
+        if self.walls[y, x] != wall:
+            self.walls[y, x] = wall
+            self.chunks.pop((x // CHUNK_TILES, y // CHUNK_TILES), None)
+
+    def draw(self, screen: pg.Surface, offset: tuple[int, int] = (0, 0)) -> None:
+        """
+        Blit the chunks visible on the screen, offset is the level position of the top left of the screen
+        """
+        area = screen.get_rect(topleft=offset)
+        self.bake(area)
+        size = CHUNK_TILES * TILE_SIZE
+        screen.blits([(self.chunks[(cx, cy)], (cx * size - offset[0], cy * size - offset[1]))
+                      for cx, cy in self.chunks_in(area)], doreturn=False)
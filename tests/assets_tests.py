@@ -0,0 +1,79 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 11:42:05
+ # @ Description:
+    This file contains unit tests for the asset registry. A sheet must be read once whatever
+    the number of entities, all of them must share the same frames, and the atlas must draw
+    them like the scaled and flipped frames.
+ '''
+
+import os
+import unittest
+
+import pygame as pg
+
+from src.assets import ASSETS, AssetRegistry # pylint: disable=import-error
+from src.config import SCALING_FACTOR # pylint: disable=import-error
+from src.entities.enemy import Enemy # pylint: disable=import-error
+from src.entities.player import Player # pylint: disable=import-error
+
+
+class TestAssetRegistry(unittest.TestCase):
+    """
+    Test class for the asset registry.
+    """
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        pg.display.init()
+        pg.display.set_mode((1, 1))
+
+    def test_loaded_once(self):
+        """
+        Test that the files are read once and the frames are the same objects
+        """
+        registry = AssetRegistry()
+        first = registry.animations('assets/enemies.png', 'assets/enemies.toml')
+        second = registry.animations('assets/enemies.png', 'assets/enemies.toml')
+        self.assertIs(first, second)
+        self.assertEqual(registry.loads, {'assets/enemies.png': 1, 'assets/enemies.toml': 1})
+        self.assertIsInstance(first['idle'], tuple)
+        with self.assertRaises(TypeError):
+            first['idle'] = ()  # type: ignore[index]
+        sheet = registry.sheet('assets/enemies.png')
+        frames = sum(len(frames) for frames in first.values())
+        self.assertEqual(registry.resident_bytes, 4 * (sheet.get_width() * sheet.get_height() + frames * 16 * 16))
+
+    def test_shared_by_entities(self):
+        """
+        Test that spawning many enemies does not load the sheet again
+        """
+        registry = AssetRegistry()
+        player = Player((0, 0), registry)
+        enemies = [Enemy((i, 0), player, registry) for i in range(200)]
+        self.assertEqual(registry.loads['assets/enemies.png'], 1)
+        self.assertIs(enemies[0].sprite_sheet, registry.sheet('assets/enemies.png'))
+        self.assertIsNot(enemies[0].sprite_sheet, ASSETS.sheet('assets/enemies.png'))
+        self.assertTrue(all(enemy.animations is enemies[0].animations for enemy in enemies))
+        self.assertIsNot(player.animations, enemies[0].animations)
+
+    def test_atlas(self):
+        """
+        Test that a frame drawn from the atlas is the frame flipped then scaled, and the image is kept
+        """
+        player = Player((10, 20))
+        for facing in (1, -1):
+            for frame in player.animations['walk']:
+                player.image, player.velocity.x = frame, facing
+                drawn, expected = pg.Surface((60, 60), pg.SRCALPHA), pg.Surface((60, 60), pg.SRCALPHA)
+                player.draw(drawn, (4, 8))
+                flipped = pg.transform.flip(frame, facing < 0, False)
+                expected.blit(pg.transform.scale(flipped, (int(flipped.get_width() * SCALING_FACTOR),
+                                                           int(flipped.get_height() * SCALING_FACTOR))), (6, 12))
+                self.assertEqual(pg.image.tobytes(drawn, 'RGBA'), pg.image.tobytes(expected, 'RGBA'))
+                self.assertIs(player.image, frame)
+        self.assertIs(player.atlas, ASSETS.atlas('assets/mario_bros.png', 'assets/mario_bros.toml'))
+
+
+if __name__ == '__main__':
+    unittest.main()
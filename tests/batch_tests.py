@@ -0,0 +1,59 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 13:28:44
+ # @ Description:
+    This file contains unit tests for the batched path queries. Their answers must match
+    one search per request, while searching each source only once.
+ '''
+
+import unittest
+from src.core import Grid, batch_shortest_paths, shortest_paths # pylint: disable=import-error
+
+ROWS = [
+    '############',
+    '#    #     #',
+    '# ## # ### #',
+    '#  #     # #',
+    '## ####### #',
+    '#          #',
+    '############',
+]
+
+
+class TestBatch(unittest.TestCase):
+    """
+    Test class for the batched path queries.
+    """
+    def setUp(self):
+        self.graph = Grid.from_rows(ROWS).to_graph()
+
+    def test_same_answers_as_single_queries(self):
+        """
+        Test every requested pair against a full search from its source
+        """
+        requests = [('1-1', ['10-5', '4-3']), ('10-1', ['1-5']), ('1-1', ['7-3'])]
+        batch = batch_shortest_paths(self.graph, requests)
+        self.assertEqual(set(batch.distances), {'1-1', '10-1'})
+        for source, targets in requests:
+            reference = shortest_paths(self.graph, source)
+            for target in targets:
+                self.assertAlmostEqual(batch.distance(source, target), reference.distance(target))
+                path = batch.path(source, target)
+                self.assertEqual(path[0], source)
+                self.assertEqual(path[-1], target)
+                cost = sum(self.graph.edges[a][b] for a, b in zip(path, path[1:]))
+                self.assertAlmostEqual(cost, reference.distance(target))
+
+    def test_stops_at_targets(self):
+        """
+        Test that a source stops once its targets are settled, unless all nodes are asked for
+        """
+        near = batch_shortest_paths(self.graph, [('1-1', ['2-1'])])
+        everything = batch_shortest_paths(self.graph, [('1-1', ['2-1']), ('1-1', None)])
+        self.assertLess(near.expanded, everything.expanded)
+        self.assertEqual(everything.expanded, len(self.graph.edges))
+        self.assertEqual(near.path('1-1', '10-5'), [])
+        self.assertEqual(near.predecessors['1-1'].dtype.itemsize, 4)
+
+if __name__ == '__main__':
+    unittest.main()
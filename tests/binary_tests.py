@@ -0,0 +1,66 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 22:58:14
+ # @ Description:
+    This file contains unit tests for the binary level format. A converted file must give back
+    the compiled levels, mapped instead of read, and play like the TOML file.
+ '''
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.world.binary import convert, load_binary # pylint: disable=import-error
+from src.world.level import LevelStore, TOML_FILE # pylint: disable=import-error
+
+
+class TestBinaryLevels(unittest.TestCase):
+    """
+    Test class for the binary level format.
+    """
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory() # pylint: disable=consider-using-with
+        self.path = os.path.join(self.directory.name, 'levels.lvl')
+        self.levels = convert(TOML_FILE, self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        """
+        Test that every field of the levels is written and read back
+        """
+        loaded = load_binary(self.path)
+        self.assertEqual(len(loaded), len(self.levels))
+        for level, read in zip(self.levels, loaded):
+            self.assertEqual((read.name, read.solver, read.layout_hash), (level.name, level.solver, level.layout_hash))
+            self.assertEqual((read.start_position, read.exit_position), (level.start_position, level.exit_position))
+            self.assertTrue(np.array_equal(read.walls, level.walls))
+            self.assertTrue(np.array_equal(read.enemies, level.enemies))
+            self.assertFalse(read.walls.flags.writeable)
+
+    def test_same_paths_as_toml(self):
+        """
+        Test that the levels of the binary file play like the ones of the TOML file
+        """
+        binary, text = LevelStore(self.path, self.directory.name), LevelStore(TOML_FILE, self.directory.name)
+        self.assertEqual(len(binary), len(text))
+        for read, level in zip(binary, text):
+            self.assertEqual(read.to_print, level.to_print)
+            self.assertEqual(read.enemies, level.enemies)
+            self.assertEqual([tile.rect for tile in read.tiles], [tile.rect for tile in level.tiles])
+
+    def test_not_a_level_file(self):
+        """
+        Test that another file is refused
+        """
+        with open(self.path, 'wb') as file:
+            file.write(b'#' * 64)
+        with self.assertRaises(ValueError):
+            load_binary(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
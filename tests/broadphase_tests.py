@@ -0,0 +1,126 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 11:47:05
+ # @ Description:
+    This file contains unit tests for the broadphase of the entity collisions. No overlapping
+    pair may be missed, and the player collisions must give the result of checking every enemy.
+ '''
+
+import os
+import random
+import unittest
+
+import pygame as pg
+
+from src.entities.broadphase import SpatialGrid # pylint: disable=import-error
+from src.entities.collisions import entity_box, handle_entity_collision, separate_enemies # pylint: disable=import-error
+from src.entities.enemy import Enemy, EnemyState # pylint: disable=import-error
+from src.entities.player import Player # pylint: disable=import-error
+from src.world.compiler import compile_layout # pylint: disable=import-error
+from src.world.level import LevelStore # pylint: disable=import-error
+
+LAYOUT = '''############
+#P        S#
+#          #
+#          #
+#          #
+############
+'''
+
+
+class TestSpatialGrid(unittest.TestCase):
+    """
+    Test class for the broadphase grid.
+    """
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        pg.display.init()
+        pg.display.set_mode((1, 1))
+
+    def test_pairs(self):
+        """
+        Test that every overlapping pair is found once, in insertion order
+        """
+        rng = random.Random(0)
+        grid: SpatialGrid[int] = SpatialGrid(32)
+        boxes = []
+        for item in range(300):
+            x, y = rng.uniform(-100, 500), rng.uniform(-100, 500)
+            boxes.append((x, y, x + rng.randint(1, 40), y + rng.randint(1, 40)))
+            grid.move(item, boxes[-1])
+        pairs = grid.pairs()
+        self.assertEqual(len(pairs), len(set(pairs)))
+        self.assertTrue(all(first < second for first, second in pairs))
+        overlapping = {(i, j) for i, a in enumerate(boxes) for j, b in enumerate(boxes[i + 1:], i + 1)
+                       if a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]}
+        self.assertTrue(overlapping <= set(pairs))
+
+    def test_move(self):
+        """
+        Test that moved and removed entities leave their old cells
+        """
+        grid: SpatialGrid[str] = SpatialGrid(10)
+        grid.move('a', (0, 0, 5, 5))
+        grid.move('b', (12, 0, 15, 5))
+        self.assertEqual(grid.query((9, 0, 11, 1)), ['a', 'b'])
+        grid.move('a', (1, 1, 6, 6))
+        self.assertEqual(grid.cells[(0, 0)], {'a'})
+        grid.move('a', (30, 30, 35, 35))
+        self.assertEqual(grid.query((0, 0, 9, 9)), [])
+        self.assertEqual(grid.pairs(), [])
+        grid.remove('b')
+        self.assertEqual((len(grid), sorted(grid.cells)), (1, [(3, 3)]))
+
+    def test_player_collision(self):
+        """
+        Test that the enemies killed and the player death are the ones of checking every enemy
+        """
+        for seed in range(20):
+            rng = random.Random(seed)
+            positions = [(rng.uniform(60, 140), rng.uniform(60, 140)) for _ in range(30)]
+            results = []
+            for use_grid in (False, True):
+                player = Player((100, 100))
+                enemies = [Enemy(position, player) for position in positions]
+                grid: SpatialGrid[Enemy] = SpatialGrid()
+                for enemy in enemies:
+                    grid.move(enemy, entity_box(enemy.position, enemy.image))
+                alive = handle_entity_collision(player.position, player.image, enemies, grid if use_grid else None)
+                results.append((alive, [enemy.state for enemy in enemies]))
+            self.assertEqual(results[0], results[1])
+
+    def test_separation(self):
+        """
+        Test that overlapping enemies are pushed apart and dying ones are left in place
+        """
+        level = LevelStore.build_level(compile_layout('Test', LAYOUT))
+        player = Player((0, 0))
+        enemies = [Enemy((100, 100), player), Enemy((110, 100), player), Enemy((300, 100), player)]
+        grid: SpatialGrid[Enemy] = SpatialGrid()
+        for enemy in enemies:
+            grid.move(enemy, entity_box(enemy.position, enemy.image))
+        separate_enemies(grid.pairs(), level)
+        first, second = (entity_box(enemy.position, enemy.image) for enemy in enemies[:2])
+        self.assertEqual(first[2], second[0])
+        self.assertEqual(enemies[2].position.x, 300)
+        enemies[0].position.x = second[0]
+        enemies[0].state = EnemyState.DYING
+        separate_enemies([(enemies[0], enemies[1])], level)
+        self.assertEqual(enemies[0].position.x, second[0])
+
+    def test_separation_walls(self):
+        """
+        Test that an enemy is not pushed into a wall, the other one still moves
+        """
+        rows = LAYOUT.split('\n')
+        rows[3] = '# #        #'
+        level = LevelStore.build_level(compile_layout('Test', '\n'.join(rows)))
+        player = Player((0, 0))
+        enemies = [Enemy((100, 100), player), Enemy((110, 100), player)]
+        separate_enemies([(enemies[0], enemies[1])], level)
+        self.assertEqual((enemies[0].position.x, enemies[1].position.x), (100, 117))
+
+
+if __name__ == '__main__':
+    unittest.main()
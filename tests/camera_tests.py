@@ -0,0 +1,42 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 21:12:40
+ # @ Description:
+    This file contains unit tests for the camera. The view must stay inside the level.
+ '''
+
+import unittest
+
+import pygame as pg
+
+from src.world.camera import Camera # pylint: disable=import-error
+
+
+class TestCamera(unittest.TestCase):
+    """
+    Test class for the camera.
+    """
+    def test_follow(self):
+        """
+        Test that the view is centered on the target, without leaving the level
+        """
+        camera = Camera((800, 600), (3000, 2000), margin=10)
+        camera.follow((1500, 1000))
+        self.assertEqual(camera.offset, (1100, 700))
+        self.assertEqual(camera.to_screen((1500, 1000)), (400, 300))
+        camera.follow((10, 1990))
+        self.assertEqual(camera.offset, (0, 1400))
+        self.assertTrue(camera.is_active(pg.Rect(805, 1395, 5, 5)))
+        self.assertFalse(camera.is_active(pg.Rect(811, 1395, 5, 5)))
+
+    def test_small_level(self):
+        """
+        Test that a level smaller than the screen does not scroll
+        """
+        camera = Camera((800, 600), (500, 300))
+        camera.follow((450, 250))
+        self.assertEqual(camera.offset, (0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
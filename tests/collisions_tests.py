@@ -0,0 +1,77 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 23:47:02
+ # @ Description:
+    This file contains unit tests for the tile collisions. The grid lookup must resolve every
+    position like the scan of every tile did, borders of the tiles included.
+ '''
+
+import random
+import unittest
+
+import pygame as pg
+
+from src.config import SCALING_FACTOR, TILE_SIZE # pylint: disable=import-error
+from src.entities.collisions import ( # pylint: disable=import-error
+    ObjectCollision,
+    corner_mask,
+    handle_collision,
+    snap_position
+)
+from src.world.generator import generate_level # pylint: disable=import-error
+from src.world.level import Level, LevelStore # pylint: disable=import-error
+
+
+def scan_collision(level: Level, position: pg.Vector2, image: pg.Surface, velocity: pg.Vector2) -> bool:
+    """
+    Reference tile collision, every tile of the level is tested against the four corners of the entity
+    """
+    entity = ObjectCollision(position.x, position.y,
+                             int(image.get_width() * SCALING_FACTOR), int(image.get_height() * SCALING_FACTOR))
+    exit_x, exit_y = level.exit_position
+    reached = bool(entity.is_colliding(ObjectCollision(exit_x * TILE_SIZE, exit_y * TILE_SIZE, TILE_SIZE, TILE_SIZE)))
+    walls = [ObjectCollision(tile.rect.x, tile.rect.y, TILE_SIZE, TILE_SIZE) for tile in level.tiles]
+    touched = [(wall, entity.is_colliding(wall)) for wall in walls]
+    touched = [(wall, sides) for wall, sides in touched if sides]
+    if touched:
+        snap_position(set().union(*(sides for _, sides in touched)), [wall for wall, _ in touched],
+                      position, image, velocity)
+    return reached
+
+
+class TestCollisions(unittest.TestCase):
+    """
+    Test class for the tile collisions.
+    """
+    def test_corner_mask(self):
+        """
+        Test the corners found inside a tile, its borders included
+        """
+        self.assertEqual(corner_mask((0, 0, 10, 10), 10, 10, TILE_SIZE), 0b1000)
+        self.assertEqual(corner_mask((0, 0, 10, 10), 0, 10, TILE_SIZE), 0b1100)
+        self.assertEqual(corner_mask((5, 5, 10, 10), 0, 0, TILE_SIZE), 0b1111)
+        self.assertEqual(corner_mask((0, 0, 10, 10), 10.5, 0, TILE_SIZE), 0)
+
+    def test_same_as_scan(self):
+        """
+        Test random positions, many of them on the borders of the tiles, against the scan of every tile
+        """
+        rng = random.Random(3)
+        level = LevelStore.build_level(generate_level('Test', 30, 20, density=0.3, seed=3))
+        width, height = level.size
+        for _ in range(3000):
+            image = pg.Surface((rng.choice([16, 21, 32]), rng.choice([16, 21, 32])))
+            if rng.random() < 0.5:
+                position = pg.Vector2(rng.uniform(-40, width + 40), rng.uniform(-40, height + 40))
+            else:
+                position = pg.Vector2(rng.randint(-2, width // 8) * 8 + rng.choice([0, 0.5, -1, 1]),
+                                      rng.randint(-2, height // 8) * 8 + rng.choice([0, 0.5, -1, 1]))
+            velocity = pg.Vector2(rng.uniform(-3, 3), rng.uniform(-3, 3))
+            expected_position, expected_velocity = pg.Vector2(position), pg.Vector2(velocity)
+            reached = handle_collision(level, position, image, velocity)
+            expected = scan_collision(level, expected_position, image, expected_velocity)
+            self.assertEqual((reached, position, velocity), (expected, expected_position, expected_velocity))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 17:40:18
+ # @ Description:
+    This file contains unit tests for the level compiler. The compiled graph must be the one
+    built tile by tile, and the .npz cache must give back the same levels.
+ '''
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.core import Grid # pylint: disable=import-error
+from src.world.compiler import ( # pylint: disable=import-error
+    build_graph,
+    compile_layout,
+    compile_levels,
+    save_levels
+)
+
+LAYOUT = '''#########
+#P  #  E#
+# ## ## #
+#E     S#
+#########
+'''
+
+CONTENT = f'''[[level]]
+name = "Test"
+solver = "astar"
+layout = """
+{LAYOUT}"""
+'''
+
+
+class TestCompiler(unittest.TestCase):
+    """
+    Test class for the level compiler.
+    """
+    def test_layout(self):
+        """
+        Test the positions found in a layout
+        """
+        level = compile_layout('Test', LAYOUT)
+        self.assertEqual(level.walls.shape, (5, 9))
+        self.assertEqual(level.start_position, (1, 1))
+        self.assertEqual(level.exit_position, (7, 3))
+        self.assertEqual(level.enemies.tolist(), [[7, 1], [1, 3]])
+
+    def test_graph_matches_grid(self):
+        """
+        Test the vectorized graph against the one built tile by tile, neighbour order included
+        """
+        expected = Grid.from_rows(LAYOUT.split('\n')[:-1]).to_graph()
+        graph = build_graph(compile_layout('Test', LAYOUT).walls)
+        self.assertEqual(sorted(graph.edges), sorted(expected.edges))
+        for node, neighbours in expected.edges.items():
+            self.assertEqual(list(graph.edges[node].items()), list(neighbours.items()))
+
+    def test_cache_round_trip(self):
+        """
+        Test that levels loaded from the cache are the compiled ones
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            compiled = compile_levels(CONTENT, directory)
+            self.assertEqual(len(os.listdir(directory)), 1)
+            cached = compile_levels(CONTENT, directory)
+            self.assertEqual(len(cached), 1)
+            self.assertEqual(cached[0].name, compiled[0].name)
+            self.assertEqual(cached[0].solver, 'astar')
+            self.assertEqual(cached[0].layout_hash, compiled[0].layout_hash)
+            self.assertEqual(cached[0].start_position, compiled[0].start_position)
+            self.assertTrue(np.array_equal(cached[0].walls, compiled[0].walls))
+            self.assertTrue(np.array_equal(cached[0].enemies, compiled[0].enemies))
+
+            compile_levels(CONTENT.replace('Test', 'Other'), directory)
+            self.assertEqual(len(os.listdir(directory)), 1)
+
+    def test_save_keeps_other_files(self):
+        """
+        Test that saving levels outside of the cache leaves the other level files of the folder
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            save_levels([compile_layout('Test', LAYOUT)], os.path.join(directory, 'levels-mine.npz'))
+            save_levels([compile_layout('Other', LAYOUT)], os.path.join(directory, 'levels-other.npz'))
+            self.assertEqual(sorted(os.listdir(directory)), ['levels-mine.npz', 'levels-other.npz'])
+
+
+if __name__ == '__main__':
+    unittest.main()
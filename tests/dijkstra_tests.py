@@ -9,7 +9,7 @@
 
 import unittest
 import copy
-from src.core.dijkstra import Node, Graph, dijkstra # pylint: disable=import-error
+from src.core.dijkstra import Node, Graph, dijkstra, shortest_paths # pylint: disable=import-error
 
 class TestDijkstra(unittest.TestCase):
     """
@@ -279,5 +279,27 @@ class TestDijkstra(unittest.TestCase):
                 self.assertEqual(distances[node].dist, expected_distances[start][node].dist)
                 self.assertEqual(distances[node].path, expected_distances[start][node].path)
 
+    def test_graph_is_not_mutated(self):
+        """
+        Test that the same graph can be solved several times from different starts
+        """
+        graph = self.graphs[3]
+        for start in graph.edges.keys():
+            distances = dijkstra(graph, start)
+            self.assertEqual(distances[start].dist, 0)
+        self.assertTrue(all(node.dist == float('infinity') for node in graph.nodes.values()))
+
+    def test_shortest_paths_early_stop(self):
+        """
+        Test that stopping at a target gives the same answer as a full search
+        """
+        graph = self.graphs[3]
+        full = shortest_paths(graph, 'A')
+        early = shortest_paths(graph, 'A', ['D'])
+        self.assertEqual(early.distance('D'), full.distance('D'))
+        self.assertEqual(early.path('D'), ['A', 'C', 'D'])
+        self.assertLess(early.expanded, full.expanded)
+        self.assertEqual(early.path('F'), [])
+
 if __name__ == '__main__':
     unittest.main()
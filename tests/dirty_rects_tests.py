@@ -0,0 +1,99 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 23:52:10
+ # @ Description:
+    This file contains unit tests for the dirty rectangles reported by the states. A state must
+    ask for a full update on its first frame, then only report what its draw changed.
+ '''
+
+import os
+import tempfile
+import unittest
+
+import pygame as pg
+
+from src.config import COLOR_RED, COLOR_WHITE, FONT_BUTTON_SIZE, FONT_DEBUG_SIZE, FONT_NAME # pylint: disable=import-error
+from src.game_states import State # pylint: disable=import-error
+from src.core import PlannerService # pylint: disable=import-error
+from src.ui.menu import Button, GameMenu, changed_buttons # pylint: disable=import-error
+from src.world.level import LevelStore, TOML_FILE # pylint: disable=import-error
+from src.world.prefetch import LevelPrefetcher # pylint: disable=import-error
+
+
+class TestDirtyRects(unittest.TestCase):
+    """
+    Test class for the dirty rectangles.
+    """
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        pg.init()
+        cls.screen = pg.display.set_mode((800, 600))
+        # the levels and their cache stay out of the repository
+        cls.directory = tempfile.TemporaryDirectory() # pylint: disable=consider-using-with
+        cls.planner = PlannerService()
+        cls.prefetcher = LevelPrefetcher(LevelStore(TOML_FILE, cls.directory.name))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.planner.shutdown()
+        cls.prefetcher.service.shutdown()
+        cls.directory.cleanup()
+
+    def test_state(self):
+        """
+        Test that the first frame is a full update and that the reported rects are consumed
+        """
+        state = State()
+        state.mark_dirty(pg.Rect(0, 0, 5, 5))
+        self.assertIsNone(state.dirty_rects())
+        self.assertEqual(state.dirty_rects(), [])
+        state.mark_dirty(pg.Rect(1, 2, 3, 4))
+        self.assertEqual(state.dirty_rects(), [pg.Rect(1, 2, 3, 4)])
+        self.assertEqual(state.dirty_rects(), [])
+
+    def test_buttons(self):
+        """
+        Test that a button is reported once when its hover changes
+        """
+        button = Button((100, 100), 'Play', pg.font.Font(FONT_NAME, FONT_BUTTON_SIZE), COLOR_WHITE, COLOR_RED)
+        button.handle_event(pg.event.Event(pg.MOUSEMOTION, pos=(500, 500)))
+        self.assertEqual(changed_buttons(button), [])
+        button.handle_event(pg.event.Event(pg.MOUSEMOTION, pos=(100, 100)))
+        self.assertEqual(changed_buttons(button), [button.rect])
+        self.assertEqual(changed_buttons(button), [])
+
+    def test_game(self):
+        """
+        Test that a game frame without scrolling only reports the old and new bounds of the entities
+        """
+        game = GameMenu(0, self.planner, self.prefetcher)
+        game.draw(self.screen)
+        self.assertIsNone(game.dirty_rects())
+        game.draw(self.screen)
+        rects = game.dirty_rects()
+        self.assertIsNotNone(rects)
+        player = game.player.get_rect().move(*(-value for value in game.level_handler.camera.offset))
+        self.assertTrue(any(rect.contains(player) for rect in rects))
+        game.level_handler.run.is_finished = True
+        game.draw(self.screen)
+        self.assertIsNone(game.dirty_rects())
+
+    def test_debug_status(self):
+        """
+        Test that the last bounds of the debug status are reported when a shorter status is drawn
+        """
+        game = GameMenu(0, self.planner, self.prefetcher)
+        game.debug_font = pg.font.Font(FONT_NAME, FONT_DEBUG_SIZE)
+        game.draw(self.screen)
+        game.dirty_rects()
+        longer = game.status_rects[0]
+        game.prefetcher = LevelPrefetcher(self.prefetcher.levels)
+        self.addCleanup(game.prefetcher.service.shutdown)
+        game.draw(self.screen)
+        self.assertLess(game.status_rects[0].width, longer.width)
+        self.assertIn(longer, game.dirty_rects())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 11:58:03
+ # @ Description:
+    This file contains unit tests for the D* Lite planner. After every start move and
+    edge change its answer must match a search from scratch on the same graph.
+ '''
+
+import copy
+import random
+import unittest
+from src.core import DStarLite, Grid, dijkstra_path, node_distance # pylint: disable=import-error
+
+
+def grid_graph(rng: random.Random, width: int, height: int, density: float):
+    """
+    Graph of a random grid surrounded by walls
+    """
+    rows = [''.join('#' if x in (0, width - 1) or y in (0, height - 1) or rng.random() < density else ' '
+                    for x in range(width)) for y in range(height)]
+    return Grid.from_rows(rows).to_graph()
+
+
+class TestDStarLite(unittest.TestCase):
+    """
+    Test class for the D* Lite planner.
+    """
+    def assert_same_as_dijkstra(self, planner: DStarLite):
+        """
+        Check the planner answer against a search from scratch
+        """
+        result = planner.plan()
+        reference = dijkstra_path(copy.deepcopy(planner.graph), planner.start, planner.goal)
+        self.assertAlmostEqual(result.cost, reference.cost)
+        if reference.path:
+            self.assertEqual(result.path[0], planner.start)
+            self.assertEqual(result.path[-1], planner.goal)
+            total = sum(planner.graph.edges[a][b] for a, b in zip(result.path, result.path[1:]))
+            self.assertAlmostEqual(total, result.cost)
+        else:
+            self.assertEqual(result.path, [])
+
+    def test_moving_start(self):
+        """
+        Test replanning while the start moves along the path
+        """
+        rng = random.Random(1)
+        for _ in range(20):
+            graph = grid_graph(rng, 15, 12, 0.2)
+            nodes = sorted(graph.edges)
+            planner = DStarLite(graph, rng.choice(nodes), rng.choice(nodes), node_distance)
+            for _ in range(5):
+                self.assert_same_as_dijkstra(planner)
+                planner.move_start(rng.choice(nodes))
+
+    def test_edge_updates(self):
+        """
+        Test replanning after edges are removed, added and their costs changed
+        """
+        rng = random.Random(2)
+        for _ in range(20):
+            graph = grid_graph(rng, 15, 12, 0.15)
+            nodes = sorted(graph.edges)
+            planner = DStarLite(graph, rng.choice(nodes), rng.choice(nodes), node_distance)
+            self.assert_same_as_dijkstra(planner)
+            for _ in range(6):
+                changes = []
+                for _ in range(rng.randint(1, 10)):
+                    source, target = rng.sample(nodes, 2)
+                    if target in graph.edges[source] and rng.random() < 0.5:
+                        cost = float('infinity')
+                    else:
+                        cost = max(node_distance(source, target), rng.uniform(1.0, 5.0))
+                    changes += [(source, target, cost), (target, source, cost)]
+                planner.update_edges(changes)
+                planner.move_start(rng.choice(nodes))
+                self.assert_same_as_dijkstra(planner)
+
+    def test_repair_is_local(self):
+        """
+        Test that a small change expands fewer nodes than the first search
+        """
+        graph = grid_graph(random.Random(3), 30, 30, 0.0)
+        planner = DStarLite(graph, '1-1', '28-28', node_distance)
+        first = planner.plan()
+        planner.update_edges([('27-28', '28-28', float('infinity')), ('28-28', '27-28', float('infinity'))])
+        repaired = planner.plan()
+        self.assertAlmostEqual(repaired.cost, first.cost)
+        self.assertLess(repaired.expanded, first.expanded)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 11:05:12
+ # @ Description:
+    This file contains unit tests for the flow field. Its distances must match Dijkstra's
+    algorithm and following its steps from any tile must lead to the target.
+ '''
+
+import math
+import unittest
+from src.core import FlowField, Grid, node_name, shortest_paths # pylint: disable=import-error
+
+ROWS = [
+    '##########',
+    '#    #   #',
+    '# ## # # #',
+    '#  #   # #',
+    '## ##### #',
+    '#        #',
+    '#### #####',
+    '#  #     #',
+    '##########',
+]
+
+
+class TestFlowField(unittest.TestCase):
+    """
+    Test class for the flow field.
+    """
+    def setUp(self):
+        self.grid = Grid.from_rows(ROWS)
+        self.field = FlowField(self.grid)
+
+    def test_distances_match_dijkstra(self):
+        """
+        Test the field distances against a search from the target
+        """
+        self.field.retarget((1, 1))
+        reference = shortest_paths(self.grid.to_graph(), node_name(1, 1))
+        for y, row in enumerate(ROWS):
+            for x, _ in enumerate(row):
+                expected = reference.distance(node_name(x, y))
+                if math.isinf(expected):
+                    self.assertTrue(math.isinf(self.field.distance_at(x, y)))
+                else:
+                    self.assertAlmostEqual(self.field.distance_at(x, y), expected)
+
+    def test_steps_lead_to_target(self):
+        """
+        Test that following the steps reaches the target with the expected cost
+        """
+        self.field.retarget((8, 1))
+        for x, y in self.grid.walkable:
+            if math.isinf(self.field.distance_at(x, y)):
+                self.assertEqual(self.field.step_at(x, y), (0, 0))
+                continue
+            tile, cost = (x, y), 0.0
+            while tile != (8, 1):
+                dx, dy = self.field.step_at(*tile)
+                cost += math.sqrt(2) if dx and dy else 1.0
+                tile = (tile[0] + dx, tile[1] + dy)
+                self.assertTrue(self.grid.is_walkable(*tile))
+            self.assertAlmostEqual(cost, self.field.distance_at(x, y))
+
+    def test_rebuild_only_on_new_tile(self):
+        """
+        Test that the field is only rebuilt when the target changes tile
+        """
+        self.assertTrue(self.field.retarget((1, 1)))
+        self.assertFalse(self.field.retarget((1, 1)))
+        self.assertFalse(self.field.retarget((0, 0)))
+        self.assertTrue(self.field.retarget((2, 1)))
+        self.assertEqual(self.field.builds, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 22:03:27
+ # @ Description:
+    This file contains unit tests for the level generator. Layouts must be reproducible from
+    their seed, readable by the level compiler, and the exit must always be reachable.
+ '''
+
+import math
+import os
+import tempfile
+import unittest
+
+from src.core import dijkstra_path, node_name # pylint: disable=import-error
+from src.world.compiler import build_graph, compile_levels, save_levels # pylint: disable=import-error
+from src.world.generator import generate_layout, generate_level, to_toml # pylint: disable=import-error
+from src.world.level import LevelStore # pylint: disable=import-error
+
+
+class TestGenerator(unittest.TestCase):
+    """
+    Test class for the level generator.
+    """
+    def test_seeded(self):
+        """
+        Test that a seed always gives the same layout, in the level format
+        """
+        layout = generate_layout(30, 20, density=0.3, enemies=4, seed=3)
+        self.assertEqual(layout, generate_layout(30, 20, density=0.3, enemies=4, seed=3))
+        self.assertNotEqual(layout, generate_layout(30, 20, density=0.3, enemies=4, seed=4))
+        rows = layout.split('\n')[:-1]
+        self.assertEqual((len(rows), {len(row) for row in rows}), (20, {30}))
+        self.assertTrue(set(layout) <= set('PES# \n'))
+        self.assertEqual((layout.count('P'), layout.count('S'), layout.count('E')), (1, 1, 4))
+
+    def test_exit_is_reachable(self):
+        """
+        Test the exit path on many random and maze levels
+        """
+        for seed in range(40):
+            for kind in ('random', 'maze'):
+                level = generate_level('Test', 5 + seed, 25, density=0.45, seed=seed, kind=kind)
+                result = dijkstra_path(build_graph(level.walls), node_name(*level.start_position),
+                                       node_name(*level.exit_position))
+                self.assertTrue(math.isfinite(result.cost), (seed, kind))
+                self.assertNotEqual(level.start_position, level.exit_position)
+
+    def test_errors(self):
+        """
+        Test that impossible levels and unknown kinds are refused
+        """
+        with self.assertRaises(ValueError):
+            generate_layout(10, 10, density=1.0)
+        with self.assertRaises(ValueError):
+            generate_layout(10, 10, kind='cave')
+
+    def test_toml(self):
+        """
+        Test that the TOML output is compiled back to the same levels
+        """
+        layouts = [generate_layout(40, 30, seed=seed) for seed in range(2)]
+        with tempfile.TemporaryDirectory() as directory:
+            levels = compile_levels(to_toml(['A', 'B'], layouts, 'astar'), directory)
+        self.assertEqual([level.name for level in levels], ['A', 'B'])
+        self.assertEqual(levels[1].solver, 'astar')
+        self.assertEqual(levels[0].walls.shape, (30, 40))
+        self.assertEqual(len(levels[0].enemies), 3)
+
+    def test_compiled(self):
+        """
+        Test that the .npz output is loaded by the level store
+        """
+        levels = [generate_level(name, 40, 30, seed=seed) for seed, name in enumerate(['A', 'B'])]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'levels.npz')
+            save_levels(levels, path)
+            store = LevelStore(path, directory)
+            self.assertEqual(len(store), 2)
+            self.assertEqual(store[1].name, 'B')
+            self.assertEqual(store[1].exit_position, levels[1].exit_position)
+            self.assertTrue((store[0].walls == levels[0].walls).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
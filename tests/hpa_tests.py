@@ -0,0 +1,77 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 14:55:08
+ # @ Description:
+    This file contains unit tests for the hierarchical pathfinding. Its paths must be valid
+    and reach the same tiles as Dijkstra's algorithm, and tile changes must only rebuild
+    the clusters around them.
+ '''
+
+import random
+import unittest
+from src.core import Grid, HierarchicalGrid, dijkstra_path, node_name # pylint: disable=import-error
+
+
+def random_grid(rng: random.Random, width: int, height: int, density: float) -> Grid:
+    """
+    Random grid without border walls
+    """
+    return Grid.from_rows([''.join('#' if rng.random() < density else ' ' for _ in range(width))
+                           for _ in range(height)])
+
+
+class TestHierarchicalGrid(unittest.TestCase):
+    """
+    Test class for the hierarchical pathfinding.
+    """
+    def test_paths_are_valid(self):
+        """
+        Test paths against Dijkstra's algorithm, they may be longer but never shorter
+        """
+        rng = random.Random(5)
+        for _ in range(30):
+            grid = random_grid(rng, rng.randint(5, 40), rng.randint(5, 40), rng.choice([0.0, 0.2, 0.35]))
+            graph = grid.to_graph()
+            if len(graph.edges) < 2:
+                continue
+            hierarchy = HierarchicalGrid(Grid.from_graph(graph), rng.choice([4, 8]))
+            for _ in range(10):
+                start, goal = rng.sample(sorted(grid.walkable), 2)
+                reference = dijkstra_path(graph, node_name(*start), node_name(*goal))
+                result = hierarchy.find_path(start, goal)
+                self.assertEqual(bool(result.path), bool(reference.path))
+                if not result.path:
+                    continue
+                self.assertEqual(result.path[0], node_name(*start))
+                self.assertEqual(result.path[-1], node_name(*goal))
+                cost = sum(graph.edges[a][b] for a, b in zip(result.path, result.path[1:]))
+                self.assertAlmostEqual(cost, result.cost)
+                self.assertGreaterEqual(result.cost + 1e-9, reference.cost)
+
+    def test_tile_changes_match_full_rebuild(self):
+        """
+        Test that updating tiles one by one gives the same abstraction as building it again
+        """
+        rng = random.Random(6)
+        grid = random_grid(rng, 30, 30, 0.25)
+        hierarchy = HierarchicalGrid(grid, 8)
+        for _ in range(60):
+            x, y = rng.randrange(30), rng.randrange(30)
+            hierarchy.set_walkable(x, y, not grid.is_walkable(x, y))
+        rebuilt = HierarchicalGrid(Grid(set(grid.walkable), grid.width, grid.height), 8)
+        self.assertEqual(hierarchy.borders, rebuilt.borders)
+        self.assertEqual(hierarchy.intra, rebuilt.intra)
+
+    def test_only_affected_clusters_are_rebuilt(self):
+        """
+        Test that an inner tile rebuilds one cluster and a border tile also rebuilds its neighbour
+        """
+        hierarchy = HierarchicalGrid(random_grid(random.Random(7), 40, 40, 0.0), 10)
+        built = hierarchy.rebuilt_clusters
+        hierarchy.set_walkable(15, 15, False)
+        self.assertEqual(hierarchy.rebuilt_clusters, built + 1)
+        hierarchy.set_walkable(19, 15, False)
+        self.assertEqual(hierarchy.rebuilt_clusters, built + 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 11:51:02
+ # @ Description:
+    This file contains unit tests for the render interpolation. Entities must be drawn between
+    their positions of the last two steps, and exactly at their position for a whole step.
+ '''
+
+import os
+import tempfile
+import unittest
+
+import pygame as pg
+
+from src.config import SIMULATION_RATE # pylint: disable=import-error
+from src.entities.player import Player # pylint: disable=import-error
+from src.core import PlannerService # pylint: disable=import-error
+from src.ui.menu import GameMenu # pylint: disable=import-error
+from src.world.level import LevelStore, TOML_FILE # pylint: disable=import-error
+from src.world.prefetch import LevelPrefetcher # pylint: disable=import-error
+
+
+class TestInterpolation(unittest.TestCase):
+    """
+    Test class for the render interpolation.
+    """
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        pg.init()
+        cls.screen = pg.display.set_mode((800, 600))
+
+    def test_drawn_position(self):
+        """
+        Test that the drawn position goes from the previous position to the current one
+        """
+        player = Player((10, 20))
+        player.position = pg.Vector2(0.1 + 0.2, 40)
+        self.assertEqual(player.drawn_position(0.0), pg.Vector2(10, 20))
+        self.assertEqual(player.drawn_position(0.5), pg.Vector2((10 + 0.3) / 2, 30))
+        self.assertEqual(player.drawn_position(1.0), player.position)
+        self.assertEqual(player.get_rect(0.5).topleft, (5, 30))
+        player.save_position()
+        self.assertEqual(player.drawn_position(0.0), player.position)
+
+    def test_game_steps(self):
+        """
+        Test that a game step keeps the positions before it, and that drawing does not move anything
+        """
+        directory = tempfile.TemporaryDirectory() # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        game = GameMenu(0, PlannerService(), LevelPrefetcher(LevelStore(TOML_FILE, directory.name)))
+        self.addCleanup(game.prefetcher.service.shutdown)
+        self.addCleanup(game.planner.shutdown)
+        game.player.acceleration.x = 0.5
+        before = pg.Vector2(game.player.position)
+        game.update(1 / SIMULATION_RATE)
+        self.assertEqual(game.player.previous_position, before)
+        self.assertNotEqual(game.player.position, before)
+        after = pg.Vector2(game.player.position)
+        game.draw(self.screen, 0.25)
+        self.assertEqual(game.player.position, after)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 18:21:37
+ # @ Description:
+    This file contains unit tests for the level store. Levels must be built once, on their
+    first access, and the state of a run must not leak into the shared levels.
+ '''
+
+import tempfile
+import threading
+import unittest
+from src.core import node_name # pylint: disable=import-error
+from src.world.level import LevelRun, LevelStore, TOML_FILE # pylint: disable=import-error
+
+
+class TestLevelStore(unittest.TestCase):
+    """
+    Test class for the level store.
+    """
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory() # pylint: disable=consider-using-with
+        self.store = LevelStore(TOML_FILE, self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_levels_are_built_lazily(self):
+        """
+        Test that only the accessed levels are built, and only once
+        """
+        self.assertGreater(len(self.store), 1)
+        self.assertEqual(self.store.levels, {})
+        level = self.store[1]
+        self.assertEqual(list(self.store.levels), [1])
+        self.assertIs(self.store[1], level)
+        self.assertTrue(level.to_print)
+
+    def test_building_does_not_hold_the_store(self):
+        """
+        Test that other levels can be read while a level is built, and that a level is built once
+        """
+        started, release = threading.Event(), threading.Event()
+        build_level = self.store.build_level
+        built = []
+
+        def slow_build(compiled, path_cache=None):
+            built.append(compiled.name)
+            started.set()
+            release.wait(5)
+            return build_level(compiled, path_cache)
+
+        self.store.build_level = slow_build # type: ignore[method-assign]
+        results = []
+        workers = [threading.Thread(target=lambda: results.append(self.store[1])) for _ in range(2)]
+        workers[0].start()
+        self.assertTrue(started.wait(5))
+        workers[1].start()
+        self.store.build_level = build_level # type: ignore[method-assign]
+        reader = threading.Thread(target=lambda: results.append((len(self.store), self.store[0])))
+        reader.start()
+        reader.join(2)
+        self.assertFalse(reader.is_alive())
+        release.set()
+        self.assertGreater(results.pop(0)[0], 1)
+        for worker in workers:
+            worker.join(5)
+        self.assertEqual(len(built), 1)
+        self.assertIs(results[0], results[1])
+        self.assertIs(self.store[1], results[0])
+
+    def test_runs_are_independent(self):
+        """
+        Test that finishing a run leaves the level and the next runs untouched
+        """
+        level = self.store[0]
+        run = LevelRun(level)
+        run.is_finished = True
+        self.assertFalse(LevelRun(level).is_finished)
+        self.assertIsNot(LevelRun(level).flow_field, run.flow_field)
+        with self.assertRaises(AttributeError):
+            level.name = 'Other' # type: ignore[misc]
+
+    def test_edge_changes_stay_in_the_run(self):
+        """
+        Test that the edges changed by the planner of a run leave the level and the next runs untouched
+        """
+        level = self.store[0]
+        edges = {node: dict(neighbours) for node, neighbours in level.graph.edges.items()}
+        run = LevelRun(level)
+        path = run.plan_from(level.start_position)
+        assert run.planner is not None
+        run.planner.update_edges([(node_name(*path[0]), node_name(*path[1]), float('infinity')),
+                                  (node_name(*path[1]), node_name(*path[0]), float('infinity'))])
+        self.assertNotEqual(run.plan_from(level.start_position)[1], path[1])
+        self.assertEqual(level.graph.edges, edges)
+        self.assertEqual(LevelRun(level).plan_from(level.start_position), path)
+
+
+if __name__ == '__main__':
+    unittest.main()
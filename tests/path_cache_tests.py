@@ -0,0 +1,79 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 12:47:50
+ # @ Description:
+    This file contains unit tests for the path cache: the memory layer, the disk layer
+    and its invalidation when the level file changes.
+ '''
+
+import os
+import tempfile
+import unittest
+from src.core import PathCache, PathResult, path_key # pylint: disable=import-error
+
+
+class TestPathCache(unittest.TestCase):
+    """
+    Test class for the path cache.
+    """
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory() # pylint: disable=consider-using-with
+        self.result = PathResult(['1-1', '2-2', '3-2'], 2.414, 12)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_memory_layer(self):
+        """
+        Test the least recently used entries are evicted first
+        """
+        cache = PathCache(self.directory.name, capacity=2)
+        for key in ('a', 'b', 'c'):
+            cache.put(key, self.result)
+        self.assertNotIn('a', cache.memory)
+        self.assertEqual(list(cache.memory), ['b', 'c'])
+        cache.get('b')
+        self.assertEqual(list(cache.memory), ['c', 'b'])
+
+    def test_disk_layer(self):
+        """
+        Test that a new cache finds the results stored by a previous one
+        """
+        key = path_key('layout', '1-1', '3-2', 'jps')
+        cache = PathCache(self.directory.name)
+        cache.open('v1')
+        cache.put(key, self.result)
+
+        restarted = PathCache(self.directory.name)
+        restarted.open('v1')
+        result = restarted.get(key)
+        self.assertIsNotNone(result)
+        assert result is not None
+        self.assertEqual(result.path, self.result.path)
+        self.assertEqual(result.cost, self.result.cost)
+        self.assertIsNone(restarted.get(path_key('layout', '1-1', '3-2', 'astar')))
+
+    def test_versions_are_kept(self):
+        """
+        Test that caches of two level files keep their entries, and that the oldest versions are dropped
+        """
+        key = path_key('layout', '1-1', '3-2', 'jps')
+        cache = PathCache(self.directory.name, versions=2)
+        cache.open('v1')
+        cache.put(key, self.result)
+        other = PathCache(self.directory.name, versions=2)
+        other.open('v2')
+
+        restarted = PathCache(self.directory.name, versions=2)
+        restarted.open('v1')
+        self.assertIsNotNone(restarted.get(key))
+
+        other.open('v3')
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ['v1', 'v3'])
+        restarted.open('v1')
+        self.assertIsNotNone(restarted.get(key))
+        other.open('v2')
+        self.assertIsNone(other.get(key))
+
+if __name__ == '__main__':
+    unittest.main()
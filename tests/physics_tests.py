@@ -0,0 +1,87 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 11:45:02
+ # @ Description:
+    This file contains unit tests for the batched entity physics. A batch must move its entities
+    exactly like Entity.move_and_slide, and the entities must keep working through their views.
+ '''
+
+import os
+import random
+import unittest
+
+import pygame as pg
+
+from src.entities.enemy import Enemy # pylint: disable=import-error
+from src.entities.physics import ArrayRowView, EntityBatch # pylint: disable=import-error
+from src.entities.player import Player # pylint: disable=import-error
+from src.world.generator import generate_level # pylint: disable=import-error
+from src.world.level import LevelStore # pylint: disable=import-error
+
+
+class TestEntityBatch(unittest.TestCase):
+    """
+    Test class for the entity batch.
+    """
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        pg.display.init()
+        pg.display.set_mode((1, 1))
+        cls.level = LevelStore.build_level(generate_level('Test', 30, 20, density=0.25, seed=2))
+
+    def test_same_moves(self):
+        """
+        Test that the batch gives the positions, velocities and animations of the moves one by one
+        """
+        rng = random.Random(0)
+        width, height = self.level.size
+        player = Player((0, 0))
+        starts = [(rng.uniform(-40, width + 40), rng.uniform(-40, height + 40)) for _ in range(100)]
+        single = [Enemy(start, player) for start in starts]
+        batched = [Enemy(start, player) for start in starts]
+        batch = EntityBatch(4)
+        for enemy in batched:
+            batch.add(enemy)
+        for _ in range(100):
+            for first, second in zip(single, batched):
+                first.acceleration.x = second.acceleration.x = rng.uniform(-0.05, 0.05)
+                first.acceleration.y = second.acceleration.y = rng.choice([0, 0, -2.5])
+                first.move_and_slide(self.level)
+                batch.moving[second.slot] = True
+            batch.step(self.level)
+            for first, second in zip(single, batched):
+                self.assertEqual((first.position.x, first.position.y, first.velocity.x, first.velocity.y),
+                                 (second.position.x, second.position.y, second.velocity.x, second.velocity.y))
+                self.assertEqual((first.current_animation, first.frame_index),
+                                 (second.current_animation, second.frame_index))
+
+    def test_slots(self):
+        """
+        Test that freed slots are reused and that the entities get their vectors back
+        """
+        player = Player((0, 0))
+        enemies = [Enemy((i, 2 * i), player) for i in range(3)]
+        batch = EntityBatch(2)
+        slots = [batch.add(enemy) for enemy in enemies]
+        self.assertEqual((len(batch), len(batch.active)), (3, 4))
+        self.assertEqual(enemies[1].position, pg.Vector2(1, 2))
+        batch.remove(enemies[1])
+        self.assertIsInstance(enemies[1].position, pg.Vector2)
+        self.assertEqual(batch.add(Enemy((7, 7), player)), slots[1])
+        self.assertEqual(len(batch), 3)
+
+    def test_view(self):
+        """
+        Test that a view reads and writes its row like a vector
+        """
+        view = ArrayRowView(EntityBatch(2).position, 1)
+        view.x, view.y = 3, 4
+        view += (1, 1)
+        self.assertEqual((view.x, view.y, len(view), view.length()), (4, 5, 2, pg.Vector2(4, 5).length()))
+        self.assertEqual(pg.Vector2(6, 6) - view, pg.Vector2(2, 1))
+        self.assertEqual(view - pg.Vector2(1, 1), pg.Vector2(3, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 16:35:27
+ # @ Description:
+    This file contains unit tests for the planner service: results are delivered by poll,
+    stale ones are dropped, and flow fields keep their last arrays until a new one arrives.
+ '''
+
+import gc
+import threading
+import time
+import unittest
+import weakref
+from src.core import FlowField, Grid, PlannerService, node_name # pylint: disable=import-error
+
+ROWS = [
+    '#######',
+    '#     #',
+    '# ### #',
+    '#     #',
+    '#######',
+]
+
+
+def wait_for(planner: PlannerService) -> None:
+    """
+    Wait until the planner has no job running
+    """
+    deadline = time.perf_counter() + 5
+    while planner.queue_depth and time.perf_counter() < deadline:
+        time.sleep(0.001)
+
+
+class TestPlannerService(unittest.TestCase):
+    """
+    Test class for the planner service.
+    """
+    def setUp(self):
+        self.planner = PlannerService()
+
+    def tearDown(self):
+        self.planner.shutdown()
+
+    def test_results_are_delivered_by_poll(self):
+        """
+        Test that callbacks only run when polling, on the polling thread
+        """
+        graph = Grid.from_rows(ROWS).to_graph()
+        results = []
+        self.planner.submit_path('enemy', graph, node_name(1, 1), node_name(5, 3), 'astar',
+                                 lambda result: results.append((result, threading.current_thread())))
+        wait_for(self.planner)
+        self.assertEqual(results, [])
+        self.assertEqual(self.planner.poll(), 1)
+        self.assertEqual(results[0][0].path[-1], node_name(5, 3))
+        self.assertIs(results[0][1], threading.current_thread())
+        self.assertGreater(self.planner.average_latency, 0)
+
+    def test_stale_results_are_dropped(self):
+        """
+        Test that only the latest job of a key is delivered
+        """
+        release = threading.Event()
+        results = []
+        self.planner.submit('enemy', release.wait, callback=lambda _: results.append('old'))
+        self.planner.submit('enemy', lambda: 'new', callback=results.append)
+        self.planner.submit('other', lambda: 'other', callback=results.append)
+        self.assertGreaterEqual(self.planner.queue_depth, 1)
+        release.set()
+        wait_for(self.planner)
+        self.planner.poll()
+        self.assertEqual(results, ['new', 'other'])
+        self.assertEqual(self.planner.dropped, 1)
+        self.assertEqual(self.planner.generations, {})
+
+    def test_failed_job_is_not_polled_again(self):
+        """
+        Test that a job raising in poll does not deliver or count the other jobs twice
+        """
+        results = []
+        self.planner.submit('enemy', lambda: 'done', callback=results.append)
+        self.planner.submit('other', lambda: 1 / 0, callback=results.append)
+        wait_for(self.planner)
+        with self.assertRaises(ZeroDivisionError):
+            self.planner.poll()
+        latencies = len(self.planner.latencies)
+        self.assertEqual(self.planner.poll(), 0)
+        self.assertEqual(results, ['done'])
+        self.assertEqual((self.planner.delivered, self.planner.dropped), (1, 0))
+        self.assertEqual(len(self.planner.latencies), latencies)
+        self.assertEqual(self.planner.jobs, [])
+
+    def test_keys_are_released(self):
+        """
+        Test that the planner does not keep the flow fields alive once their jobs are delivered
+        """
+        field = FlowField(Grid.from_rows(ROWS))
+        field.build((1, 1))
+        field.retarget_async((5, 3), self.planner)
+        wait_for(self.planner)
+        self.planner.poll()
+        reference = weakref.ref(field)
+        del field
+        gc.collect()
+        self.assertIsNone(reference())
+
+    def test_flow_field_keeps_last_plan(self):
+        """
+        Test that the flow field keeps its arrays until the new ones are delivered
+        """
+        field = FlowField(Grid.from_rows(ROWS))
+        field.build((1, 1))
+        self.assertTrue(field.retarget_async((5, 3), self.planner))
+        self.assertFalse(field.retarget_async((5, 3), self.planner))
+        wait_for(self.planner)
+        self.assertEqual(field.target, (1, 1))
+        self.assertEqual(field.step_at(2, 1), (-1, 0))
+        self.planner.poll()
+        self.assertEqual(field.target, (5, 3))
+        self.assertEqual(field.step_at(4, 3), (1, 0))
+
+if __name__ == '__main__':
+    unittest.main()
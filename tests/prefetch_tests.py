@@ -0,0 +1,74 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 19:14:50
+ # @ Description:
+    This file contains unit tests for the level prefetcher. The next level must be built on the
+    worker, and only the latest request must be handed back.
+ '''
+
+import os
+import tempfile
+import time
+import unittest
+
+import pygame as pg
+
+from src.world.level import LevelStore, TOML_FILE # pylint: disable=import-error
+from src.world.prefetch import LevelPrefetcher # pylint: disable=import-error
+
+
+class TestLevelPrefetcher(unittest.TestCase):
+    """
+    Test class for the level prefetcher.
+    """
+    @classmethod
+    def setUpClass(cls):
+        # the tile sheet is converted for the display when the tiles are baked
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        pg.display.init()
+        pg.display.set_mode((1, 1))
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory() # pylint: disable=consider-using-with
+        self.store = LevelStore(TOML_FILE, self.directory.name)
+        self.prefetcher = LevelPrefetcher(self.store)
+
+    def tearDown(self):
+        self.prefetcher.service.shutdown()
+        self.directory.cleanup()
+
+    def wait(self, number: int):
+        deadline = time.perf_counter() + 10
+        prepared = self.prefetcher.take(number)
+        while prepared is None and time.perf_counter() < deadline:
+            time.sleep(0.01)
+            prepared = self.prefetcher.take(number)
+        self.assertIsNotNone(prepared)
+        return prepared
+
+    def test_prefetch(self):
+        """
+        Test that the prepared level is the one of the store, with the result of the preparation
+        """
+        self.assertEqual(self.prefetcher.status, 'idle')
+        self.assertTrue(self.prefetcher.prefetch(1, lambda level: len(level.enemies)))
+        self.assertIsNone(self.prefetcher.take(2))
+        prepared = self.wait(1)
+        self.assertIs(prepared.level, self.store[1])
+        self.assertEqual(prepared.extras, len(self.store[1].enemies))
+        self.assertEqual(list(self.store.levels), [1])
+        self.assertEqual(self.prefetcher.status, 'idle')
+
+    def test_latest_request_wins(self):
+        """
+        Test that a newer request replaces the older one, and that missing levels are refused
+        """
+        self.prefetcher.prefetch(1, lambda level: level.name)
+        self.prefetcher.prefetch(2, lambda level: level.name)
+        self.assertEqual(self.wait(2).extras, self.store[2].name)
+        self.assertIsNone(self.prefetcher.take(1))
+        self.assertFalse(self.prefetcher.prefetch(len(self.store), lambda level: None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 11:49:36
+ # @ Description:
+    This file contains unit tests for the AI scheduler. Enemies must be updated at the rate of
+    their distance and state, and the work over the budget must be done at the next frames.
+ '''
+
+import os
+import unittest
+from itertools import count
+
+import pygame as pg
+
+from src.entities.enemy import Enemy, EnemyState # pylint: disable=import-error
+from src.entities.player import Player # pylint: disable=import-error
+from src.entities.scheduler import AIScheduler # pylint: disable=import-error
+
+
+class CountingEnemy(Enemy):
+    """
+    Enemy counting its AI updates, its state machine does nothing.
+    """
+    def __init__(self, position: tuple[int, int], player: Player, state: EnemyState) -> None:
+        super().__init__(position, player)
+        self.state = state
+        self.thinks = 0
+
+    def think(self, run) -> None: # pylint: disable=unused-argument
+        self.thinks += 1
+
+
+class TestAIScheduler(unittest.TestCase):
+    """
+    Test class for the AI scheduler.
+    """
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        pg.display.init()
+        pg.display.set_mode((1, 1))
+
+    def test_levels_of_detail(self):
+        """
+        Test that the rates follow the distance to the player and the state
+        """
+        player = Player((0, 0))
+        scheduler = AIScheduler(budget=1.0, distances=(100, 200), intervals=(1, 4, 16))
+        enemies = [CountingEnemy((x, 0), player, state) for x, state in
+                   ((50, EnemyState.WALKING), (150, EnemyState.WALKING), (500, EnemyState.WALKING),
+                    (500, EnemyState.IDLE), (150, EnemyState.DYING))]
+        for enemy in enemies:
+            scheduler.add(enemy)
+        for _ in range(64):
+            scheduler.update(None)
+        self.assertEqual([enemy.thinks for enemy in enemies], [64, 16, 4, 2, 1])
+        self.assertEqual(len(scheduler), 4)
+        self.assertAlmostEqual(scheduler.tick_rates[0], 1.0)
+        self.assertAlmostEqual(scheduler.tick_rates[1], 16 / 60, delta=0.02)
+
+    def test_budget(self):
+        """
+        Test that the enemies over the budget are updated first at the next frame
+        """
+        player = Player((0, 0))
+        ticks = count()
+        scheduler = AIScheduler(budget=1.5, distances=(100,), intervals=(1, 1), clock=lambda: next(ticks))
+        enemies = [CountingEnemy((i, 0), player, EnemyState.WALKING) for i in range(5)]
+        for enemy in enemies:
+            scheduler.add(enemy)
+        self.assertEqual(scheduler.update(None), 2)
+        self.assertEqual(scheduler.deferred, 3)
+        self.assertEqual(scheduler.update(None), 2)
+        self.assertEqual([enemy.thinks for enemy in enemies], [1, 1, 1, 1, 0])
+        scheduler.remove(enemies[4])
+        scheduler.update(None)
+        self.assertEqual(enemies[4].thinks, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
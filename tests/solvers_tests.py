@@ -0,0 +1,134 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 10:20:31
+ # @ Description:
+    This file contains unit tests for the search backends. Every backend must return
+    a valid path with the same cost as Dijkstra's algorithm on random grids.
+ '''
+
+import random
+import unittest
+from src.core import ( # pylint: disable=import-error
+    Graph,
+    Grid,
+    SOLVERS,
+    bidirectional_dijkstra,
+    dijkstra_path,
+    find_path,
+    node_name,
+    shortest_paths
+)
+
+
+def random_rows(rng: random.Random, width: int, height: int, density: float) -> list[str]:
+    """
+    Random layout rows surrounded by walls
+    """
+    rows = []
+    for y in range(height):
+        row = ''
+        for x in range(width):
+            border = x in (0, width - 1) or y in (0, height - 1)
+            row += '#' if border or rng.random() < density else ' '
+        rows.append(row)
+    return rows
+
+
+class TestSolvers(unittest.TestCase):
+    """
+    Test class for the search backends.
+    """
+    def assert_valid_path(self, graph, path: list[str], cost: float):
+        total = 0.0
+        for current, following in zip(path, path[1:]):
+            self.assertIn(following, graph.edges[current])
+            total += graph.edges[current][following]
+        self.assertAlmostEqual(total, cost)
+
+    def test_same_cost_as_dijkstra(self):
+        """
+        Test every backend against Dijkstra on random grids
+        """
+        rng = random.Random(42)
+        for _ in range(150):
+            rows = random_rows(rng, rng.randint(3, 20), rng.randint(3, 20), rng.choice([0.0, 0.1, 0.25, 0.4]))
+            grid = Grid.from_rows(rows)
+            graph = grid.to_graph()
+            if len(graph.edges) < 2:
+                continue
+            start, goal = rng.sample(sorted(graph.edges), 2)
+            # the one-way search, the dijkstra backend runs from both ends
+            reference = shortest_paths(graph, start, [goal])
+            for name in SOLVERS:
+                result = find_path(graph, start, goal, name)
+                self.assertAlmostEqual(result.cost, reference.distance(goal), msg=f'{name} {start} {goal} {rows}')
+                if reference.path(goal):
+                    self.assertEqual(result.path[0], start)
+                    self.assertEqual(result.path[-1], goal)
+                    self.assert_valid_path(graph, result.path, result.cost)
+                else:
+                    self.assertEqual(result.path, [])
+
+    def test_open_grid_expands_fewer_nodes(self):
+        """
+        Test that A* and JPS expand fewer nodes than Dijkstra on an open grid
+        """
+        graph = Grid.from_rows(random_rows(random.Random(0), 40, 40, 0.0)).to_graph()
+        start, goal = node_name(1, 1), node_name(38, 30)
+        reference = find_path(graph, start, goal, 'dijkstra')
+        self.assertLess(find_path(graph, start, goal, 'astar').expanded, reference.expanded)
+        self.assertLess(find_path(graph, start, goal, 'jps').expanded, reference.expanded)
+
+    def test_bidirectional_directed_graph(self):
+        """
+        Test the bidirectional search on a directed graph, given its reversed edges
+        """
+        edges = {
+            'A': {'B': 1, 'C': 4},
+            'B': {'C': 1, 'D': 7},
+            'C': {'D': 1},
+            'D': {'A': 1},
+            'E': {'A': 1},
+        }
+        reverse: dict[str, dict[str, float]] = {}
+        for node, neighbours in edges.items():
+            for neighbor, weight in neighbours.items():
+                reverse.setdefault(neighbor, {})[node] = weight
+        graph = Graph(edges) # type: ignore[arg-type]
+        for start in edges:
+            for goal in edges:
+                result = bidirectional_dijkstra(graph, start, goal, reverse)
+                reference = shortest_paths(graph, start, [goal])
+                self.assertEqual(result.cost, reference.distance(goal))
+                self.assertEqual(result.path, reference.path(goal))
+
+    def test_directed_graph_single_pair(self):
+        """
+        Test that the single pair entry points find the one-way paths of a directed graph
+        """
+        graph = Graph({'A': {'B': 1}, 'B': {'C': 1}, 'C': {'A': 1}}) # type: ignore[dict-item]
+        for result in (find_path(graph, 'A', 'C'), dijkstra_path(graph, 'A', 'C')):
+            self.assertEqual((result.path, result.cost), (['A', 'B', 'C'], 2))
+        self.assertEqual(find_path(graph, 'C', 'B').path, ['C', 'A', 'B'])
+
+    def test_bidirectional_expands_fewer_nodes(self):
+        """
+        Test that meeting in the middle settles fewer nodes than a one-way search
+        """
+        graph = Grid.from_rows(random_rows(random.Random(0), 40, 40, 0.0)).to_graph()
+        start, goal = node_name(2, 20), node_name(37, 20)
+        reference = shortest_paths(graph, start, [goal])
+        result = bidirectional_dijkstra(graph, start, goal)
+        self.assertAlmostEqual(result.cost, reference.distance(goal))
+        self.assertLess(result.expanded, reference.expanded)
+
+    def test_unknown_solver(self):
+        """
+        Test that an unknown backend name is rejected
+        """
+        graph = Grid.from_rows(['   ']).to_graph()
+        with self.assertRaises(ValueError):
+            find_path(graph, node_name(0, 0), node_name(2, 0), 'bfs')
+
+if __name__ == '__main__':
+    unittest.main()
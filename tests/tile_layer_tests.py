@@ -0,0 +1,69 @@
+'''
+ # @ Author: Niels Ouvrard - Diego Jiménez Ontiveros - Santiago Arreola Munguia
+ # @ Create Time: 2026-10-17 20:21:09
+ # @ Description:
+    This file contains unit tests for the baked tile layer. Chunks must only be rendered once,
+    and again only when one of their tiles changes.
+ '''
+
+import unittest
+
+import numpy as np
+import pygame as pg
+
+from src.config import CHUNK_TILES, TILE_SIZE # pylint: disable=import-error
+from src.world.tile_layer import TileLayer # pylint: disable=import-error
+
+
+class TestTileLayer(unittest.TestCase):
+    """
+    Test class for the tile layer.
+    """
+    def setUp(self):
+        self.walls = np.zeros((CHUNK_TILES + 4, 2 * CHUNK_TILES + 3), dtype=bool)
+        self.walls[0, :] = True
+        brick = pg.Surface((TILE_SIZE, TILE_SIZE))
+        brick.fill((255, 0, 0))
+        exit_image = pg.Surface((TILE_SIZE, TILE_SIZE))
+        exit_image.fill((0, 255, 0))
+        self.layer = TileLayer(self.walls, (1, 1), brick, exit_image)
+
+    def test_chunks_in(self):
+        """
+        Test the chunks overlapping an area, clamped to the level
+        """
+        self.assertEqual((self.layer.columns, self.layer.rows), (3, 2))
+        self.assertEqual(self.layer.chunks_in(pg.Rect(0, 0, 10, 10)), [(0, 0)])
+        size = CHUNK_TILES * TILE_SIZE
+        self.assertEqual(self.layer.chunks_in(pg.Rect(size - 1, -50, 2, size + 100)), [(0, 0), (1, 0), (0, 1), (1, 1)])
+        self.assertEqual(len(self.layer.chunks_in(pg.Rect(-size, -size, 10 * size, 10 * size))), 6)
+
+    def test_draw(self):
+        """
+        Test the pixels drawn and that only the visible chunks are rendered
+        """
+        screen = pg.Surface((4 * TILE_SIZE, 3 * TILE_SIZE))
+        self.layer.draw(screen)
+        self.assertEqual(screen.get_at((TILE_SIZE // 2, TILE_SIZE // 2))[:3], (255, 0, 0))
+        self.assertEqual(screen.get_at((TILE_SIZE + 1, TILE_SIZE + 1))[:3], (0, 255, 0))
+        self.assertEqual(screen.get_at((TILE_SIZE // 2, 2 * TILE_SIZE + 1))[:3], (0, 0, 0))
+        self.assertEqual(self.layer.renders, 1)
+        self.layer.draw(screen)
+        self.assertEqual(self.layer.renders, 1)
+
+    def test_set_wall(self):
+        """
+        Test that changing a tile renders its chunk again, and only it
+        """
+        self.layer.bake()
+        self.assertEqual(self.layer.renders, 6)
+        self.layer.set_wall(CHUNK_TILES + 1, 2, True)
+        self.layer.set_wall(0, 0, True)
+        self.assertEqual(len(self.layer.chunks), 5)
+        self.assertFalse(self.walls[2, CHUNK_TILES + 1])
+        self.layer.bake()
+        self.assertEqual(self.layer.renders, 7)
+
+
+if __name__ == '__main__':
+    unittest.main()